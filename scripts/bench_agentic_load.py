@@ -0,0 +1,200 @@
+"""Load-test the agentic endpoints against the stub LLM.
+
+Without ``--api-url`` the script starts the stub LLM (``reflexflow-maas stub-llm``)
+and the API in this process, pointing ``RoleBasedLLMClient`` at the stub. Each
+endpoint is then driven at every concurrency level, and the script reports
+throughput and latency percentiles. Every request uses its own scene id and point
+names, so parse checkpoints and response caches do not short-circuit LLM calls.
+
+Usage: python scripts/bench_agentic_load.py [--concurrency 1,8,32] [--requests 200]
+           [--endpoints run,parse-points,generate-draft,review-draft]
+           [--llm-latency-ms 50] [--llm-jitter-ms 20] [--llm-error-rate 0] [--api-url URL]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+import uvicorn
+
+from easyshift_maas.agentic.generator_agent import GeneratorAgent
+from easyshift_maas.agentic.template_validator import TemplateValidator
+from easyshift_maas.core.contracts import FieldDefinition, FieldDictionary, SceneMetadata
+from easyshift_maas.llm.stub_server import StubLLMConfig, build_stub_llm_app
+from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
+
+_FIELDS = FieldDictionary(
+    fields=[
+        FieldDefinition(field_name="energy_cost", semantic_label="cost", unit="$/h"),
+        FieldDefinition(field_name="boiler_temp", semantic_label="temperature", unit="C", controllable=True),
+        FieldDefinition(field_name="steam_flow", semantic_label="flow", unit="t/h", controllable=True),
+        FieldDefinition(field_name="efficiency", semantic_label="efficiency", unit="ratio"),
+    ]
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(app: Any) -> tuple[uvicorn.Server, str]:
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _payload_builders(max_iterations: int) -> dict[str, tuple[str, Callable[[int], dict[str, Any]]]]:
+    fields = _FIELDS.model_dump(mode="json")
+    draft = GeneratorAgent(llm_client=None).generate(
+        scene_metadata=SceneMetadata(scene_id="bench-review"), field_dictionary=_FIELDS, nl_requirements=[]
+    )
+    draft.template.guardrail.rules = []
+    review = {
+        "failed_draft": draft.model_dump(mode="json"),
+        "validation_report": TemplateValidator().validate(draft).model_dump(mode="json"),
+        "quality_report": TemplateQualityEvaluator().evaluate(draft.template).model_dump(mode="json"),
+    }
+
+    def _points(idx: int) -> list[str]:
+        return [f"ENERGY_COST_{idx}", f"BOILER_TEMP_{idx}", f"STEAM_FLOW_{idx}", f"UNKNOWN_{idx}"]
+
+    return {
+        "run": (
+            "/v1/agentic/run",
+            lambda idx: {
+                "scene_metadata": {"scene_id": f"bench-{idx}"},
+                "field_dictionary": fields,
+                "nl_requirements": ["minimize energy cost"],
+                "legacy_points": _points(idx),
+                "max_iterations": max_iterations,
+            },
+        ),
+        "parse-points": (
+            "/v1/agentic/parse-points",
+            lambda idx: {"field_dictionary": fields, "legacy_points": _points(idx)},
+        ),
+        "generate-draft": (
+            "/v1/agentic/generate-draft",
+            lambda idx: {
+                "scene_metadata": {"scene_id": f"bench-{idx}"},
+                "field_dictionary": fields,
+                "nl_requirements": [f"minimize energy cost, variant {idx}"],
+            },
+        ),
+        "review-draft": ("/v1/agentic/review-draft", lambda idx: review),
+    }
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+async def _drive(
+    api_url: str, path: str, build: Callable[[int], dict[str, Any]], requests: int, concurrency: int, offset: int
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(offset, offset + requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=api_url, timeout=300, limits=limits) as client:
+
+        async def _worker() -> None:
+            nonlocal errors
+            for idx in counter:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(path, json=build(idx))
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append((time.perf_counter() - started) * 1000)
+                errors += not ok
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 2),
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p95_ms": round(_percentile(ordered, 95), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api-url", help="Benchmark a running API instead of starting one in-process")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--endpoints", default="run,parse-points,generate-draft,review-draft")
+    parser.add_argument("--max-iterations", type=int, default=1)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print one JSON line per result")
+    args = parser.parse_args()
+
+    stub_url = None
+    api_url = args.api_url
+    if api_url is None:
+        config = StubLLMConfig(
+            latency_ms=args.llm_latency_ms,
+            jitter_ms=args.llm_jitter_ms,
+            error_rate=args.llm_error_rate,
+            seed=args.seed,
+        )
+        _, stub_url = _serve(build_stub_llm_app(config))
+        os.environ["REFLEXFLOW_LLM_BASE_URL"] = f"{stub_url}/v1"
+        os.environ["REFLEXFLOW_LLM_API_KEY"] = "bench"
+        os.environ.pop("REFLEXFLOW_LLM_CACHE_PATH", None)
+        # The API builds its LLM client at import time, so import it after the env is set.
+        from easyshift_maas.api.app import app
+
+        _, api_url = _serve(app)
+
+    builders = _payload_builders(args.max_iterations)
+    levels = [int(item) for item in args.concurrency.split(",") if item.strip()]
+    if not args.json:
+        print(f"{'endpoint':16s} {'conc':>5s} {'req/s':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'errors':>7s}")
+    offset = 0
+    for name in [item.strip() for item in args.endpoints.split(",") if item.strip()]:
+        path, build = builders[name]
+        for concurrency in levels:
+            row = asyncio.run(_drive(api_url, path, build, args.requests, concurrency, offset))
+            offset += args.requests
+            if args.json:
+                print(json.dumps({"endpoint": name, "concurrency": concurrency, **row}), flush=True)
+            else:
+                print(
+                    f"{name:16s} {concurrency:5d} {row['throughput_rps']:9.2f} {row['p50_ms']:9.2f}"
+                    f" {row['p95_ms']:9.2f} {row['p99_ms']:9.2f} {row['errors']:7d}",
+                    flush=True,
+                )
+    if stub_url is not None:
+        print(json.dumps({"stub_llm": httpx.get(f"{stub_url}/stats").json()}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark YamlCatalogLoader on large synthetic catalogs.
+
+Usage: python scripts/bench_catalog_loader.py [--bindings 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from easyshift_maas.core.contracts import CatalogLoadMode
+from easyshift_maas.ingestion.catalog_loader import YamlCatalogLoader
+
+
+def _write_fixtures(root: Path, count: int) -> dict[str, Path]:
+    bindings = [
+        {
+            "point_id": f"P_{idx:06d}",
+            "source_type": "redis",
+            "source_ref": f"plant:point:{idx:06d}",
+            "field_name": f"field_{idx:06d}",
+            "unit": "C",
+        }
+        for idx in range(count)
+    ]
+    header = {
+        "scene": {"scene_id": "bench-line"},
+        "datasources": {"redis_main": {"kind": "redis", "conn_ref": "env:REFLEXFLOW_REDIS_CONN"}},
+        "point_catalog": {"catalog_id": "bench-catalog", "source_profile": "redis_main"},
+    }
+
+    standard = root / "standard.yaml"
+    standard.write_text(
+        yaml.safe_dump({**header, "point_catalog": {**header["point_catalog"], "bindings": bindings}}, sort_keys=False),
+        encoding="utf-8",
+    )
+
+    ndjson = root / "standard.ndjson"
+    with ndjson.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps(header) + "\n")
+        for item in bindings:
+            handle.write(json.dumps(item) + "\n")
+
+    legacy = root / "legacy.yaml"
+    legacy.write_text(
+        "redis_config:\n  host: 127.0.0.1\n" + "".join(f"AB{idx:06d}PT: AB{idx:06d}PT\n" for idx in range(count)),
+        encoding="utf-8",
+    )
+    return {"standard": standard, "ndjson": ndjson, "legacy": legacy}
+
+
+def _time(label: str, repeat: int, func) -> None:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    print(f"{label:<34} best={min(samples):7.3f}s  mean={sum(samples) / len(samples):7.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bindings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_fixtures(Path(tmp), args.bindings)
+        print(f"bindings={args.bindings} libyaml={hasattr(yaml, 'CSafeLoader')}")
+
+        text = paths["standard"].read_text(encoding="utf-8")
+        _time("yaml.safe_load (pure python)", args.repeat, lambda: yaml.safe_load(text))
+
+        for label, key, mode in (
+            ("standard yaml", "standard", CatalogLoadMode.STANDARD),
+            ("standard ndjson", "ndjson", CatalogLoadMode.STANDARD),
+            ("legacy yaml", "legacy", CatalogLoadMode.LEGACY),
+        ):
+            path = str(paths[key])
+            _time(f"{label} (cold)", args.repeat, lambda: YamlCatalogLoader(cache_size=0).load(yaml_path=path, mode=mode))
+
+        cached = YamlCatalogLoader()
+        cached.load(yaml_path=str(paths["standard"]))
+        _time("standard yaml (cached)", args.repeat, lambda: cached.load(yaml_path=str(paths["standard"])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark ParserAgent rule mapping on large synthetic point lists.
+
+Usage: python scripts/bench_field_matcher.py [--points 50000] [--fields 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from easyshift_maas.agentic.parser_agent import ParserAgent
+from easyshift_maas.core.contracts import FieldDefinition, FieldDictionary
+
+_WORDS = [
+    "coal", "flow", "temp", "drum", "level", "feed", "water", "steam", "pressure", "oxygen",
+    "fan", "damper", "valve", "mill", "burner", "outlet", "inlet", "main", "reheat", "spray",
+]
+
+
+def _dictionary(count: int, rng: random.Random) -> FieldDictionary:
+    fields = [
+        FieldDefinition(
+            field_name=f"{'_'.join(rng.sample(_WORDS, 2))}_{idx}",
+            semantic_label=" ".join(rng.sample(_WORDS, 3)),
+            unit="-",
+        )
+        for idx in range(count)
+    ]
+    return FieldDictionary(fields=fields)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--fields", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    dictionary = _dictionary(args.fields, rng)
+    points = [f"{'_'.join(rng.sample(_WORDS, 3)).upper()}_{idx}" for idx in range(args.points)]
+
+    agent = ParserAgent(llm_client=None)
+    started = time.perf_counter()
+    result = agent._parse_with_rules(points=points, field_dictionary=dictionary)
+    elapsed = time.perf_counter() - started
+
+    print(f"points={args.points} fields={args.fields} mapped={len(result.mappings)} unmapped={len(result.unmapped_points)}")
+    print(f"elapsed: {elapsed:.2f}s ({args.points / elapsed:,.0f} points/s)")
+
+
+if __name__ == "__main__":
+    main()
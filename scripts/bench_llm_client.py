@@ -0,0 +1,78 @@
+"""Compare per-call httpx clients with the pooled OpenAICompatibleProvider client.
+
+Starts a local OpenAI-compatible stub and times sequential chat_json calls.
+
+Usage: python scripts/bench_llm_client.py [--calls 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from easyshift_maas.llm.providers.openai_compatible import OpenAICompatibleProvider
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        body = json.dumps({"choices": [{"message": {"content": json.dumps({"ok": True})}}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return None
+
+
+def _per_call(base_url: str, calls: int) -> float:
+    payload = {
+        "model": "stub",
+        "messages": [{"role": "user", "content": "{}"}],
+        "response_format": {"type": "json_object"},
+    }
+    started = time.perf_counter()
+    for _ in range(calls):
+        with httpx.Client(timeout=30) as client:
+            client.post(f"{base_url}/chat/completions", json=payload).raise_for_status()
+    return time.perf_counter() - started
+
+
+def _pooled(base_url: str, calls: int) -> float:
+    provider = OpenAICompatibleProvider(base_url=base_url, api_key="bench")
+    started = time.perf_counter()
+    for _ in range(calls):
+        provider.chat_json(model="stub", system_prompt="", user_payload={})
+    elapsed = time.perf_counter() - started
+    provider.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        for label, runner in (("per-call client", _per_call), ("pooled client", _pooled)):
+            elapsed = runner(base_url, args.calls)
+            print(f"{label:16s} {elapsed:6.2f}s  {elapsed / args.calls * 1000:6.2f} ms/call")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
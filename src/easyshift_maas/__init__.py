@@ -4,6 +4,7 @@ from easyshift_maas.core.contracts import (
     AgenticRunReport,
     AgenticRunState,
     AgenticRunStatus,
+    CatalogDiff,
     CatalogLoadMode,
     ConstraintOperator,
     ConstraintSeverity,
@@ -18,6 +19,8 @@ from easyshift_maas.core.contracts import (
     GuardrailDecision,
     GuardrailRule,
     GuardrailSpec,
+    JobRecord,
+    JobStatus,
     LLMProviderConfig,
     MigrationDraft,
     MigrationRisk,
@@ -35,12 +38,15 @@ from easyshift_maas.core.contracts import (
     PredictionResult,
     PredictionSpec,
     ReflectionStep,
+    ReplayReport,
     ScenarioTemplate,
     SceneContext,
     SceneMetadata,
     SnapshotMissingPolicy,
     SnapshotRequest,
     SnapshotResult,
+    SnapshotWindow,
+    SnapshotWindowRequest,
     TemplateQualityGate,
     TemplateQualityIssue,
     TemplateQualityReport,
@@ -50,6 +56,7 @@ __all__ = [
     "AgenticRunReport",
     "AgenticRunState",
     "AgenticRunStatus",
+    "CatalogDiff",
     "CatalogLoadMode",
     "ConstraintOperator",
     "ConstraintSeverity",
@@ -64,6 +71,8 @@ __all__ = [
     "GuardrailDecision",
     "GuardrailRule",
     "GuardrailSpec",
+    "JobRecord",
+    "JobStatus",
     "LLMProviderConfig",
     "MigrationDraft",
     "MigrationRisk",
@@ -81,12 +90,15 @@ __all__ = [
     "PredictionResult",
     "PredictionSpec",
     "ReflectionStep",
+    "ReplayReport",
     "ScenarioTemplate",
     "SceneContext",
     "SceneMetadata",
     "SnapshotMissingPolicy",
     "SnapshotRequest",
     "SnapshotResult",
+    "SnapshotWindow",
+    "SnapshotWindowRequest",
     "TemplateQualityGate",
     "TemplateQualityIssue",
     "TemplateQualityReport",
@@ -1,3 +1,9 @@
+from easyshift_maas.agentic.batch import AgenticBatchSummarizer, BatchMigrationRunner
+from easyshift_maas.agentic.checkpoints import (
+    CheckpointStoreProtocol,
+    InMemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
 from easyshift_maas.agentic.critic_agent import CriticAgent
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
@@ -11,4 +17,9 @@ __all__ = [
     "LangGraphMigrationWorkflow",
     "TemplateValidator",
     "TemplateValidatorProtocol",
+    "CheckpointStoreProtocol",
+    "InMemoryCheckpointStore",
+    "SQLiteCheckpointStore",
+    "BatchMigrationRunner",
+    "AgenticBatchSummarizer",
 ]
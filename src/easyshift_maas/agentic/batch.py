@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
+from easyshift_maas.core.contracts import (
+    AgenticBatchItem,
+    AgenticBatchSummary,
+    AgenticRunStatus,
+    MigrationManifest,
+    MigrationManifestEntry,
+)
+from easyshift_maas.llm.client import llm_call_limit
+
+
+class BatchMigrationRunner:
+    """Run the reflection workflow for every scene of a migration manifest.
+
+    A fixed pool of ``manifest.max_concurrency`` coroutines pulls scenes from a
+    queue, so the number of scenes in flight is bounded by that setting rather than
+    by the manifest size. Each scene may fan out into several LLM calls (candidates,
+    parser chunks); ``manifest.max_llm_concurrency`` caps the calls in flight across
+    all scenes with one shared semaphore. All scenes share the workflow's agents,
+    hence its LLM client, response cache, parser field index cache and checkpoint
+    store. Items are yielded as scenes finish.
+    """
+
+    def __init__(self, workflow: LangGraphMigrationWorkflow) -> None:
+        self.workflow = workflow
+
+    async def iter_items(self, manifest: MigrationManifest) -> AsyncIterator[AgenticBatchItem]:
+        pending: asyncio.Queue[tuple[int, MigrationManifestEntry]] = asyncio.Queue()
+        for index, entry in enumerate(manifest.scenes):
+            pending.put_nowait((index, entry))
+        finished: asyncio.Queue[AgenticBatchItem | None] = asyncio.Queue()
+
+        async def _worker() -> None:
+            while True:
+                try:
+                    index, entry = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                await finished.put(await self._run_scene(manifest, index, entry))
+            await finished.put(None)
+
+        context = contextvars.copy_context()
+        if manifest.max_llm_concurrency is not None:
+            context.run(llm_call_limit.set, asyncio.Semaphore(manifest.max_llm_concurrency))
+        workers = [
+            asyncio.create_task(_worker(), context=context.copy())
+            for _ in range(min(manifest.max_concurrency, len(manifest.scenes)))
+        ]
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await finished.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def run(self, manifest: MigrationManifest) -> tuple[list[AgenticBatchItem], AgenticBatchSummary]:
+        started = time.perf_counter()
+        summary = AgenticBatchSummarizer(total=len(manifest.scenes))
+        items: list[AgenticBatchItem] = []
+        async for item in self.iter_items(manifest):
+            summary.add(item)
+            items.append(item)
+        items.sort(key=lambda item: item.index)
+        return items, summary.summary(elapsed_ms=int((time.perf_counter() - started) * 1000))
+
+    async def _run_scene(self, manifest: MigrationManifest, index: int, entry: MigrationManifestEntry) -> AgenticBatchItem:
+        started = time.perf_counter()
+        item = AgenticBatchItem(index=index, scene_id=entry.scene_metadata.scene_id)
+        try:
+            raw_yaml_text = entry.raw_yaml_text
+            if raw_yaml_text is None and entry.raw_yaml_path is not None:
+                raw_yaml_text = await asyncio.to_thread(Path(entry.raw_yaml_path).read_text, encoding="utf-8")
+            item.report = await self.workflow.arun(
+                scene_metadata=entry.scene_metadata,
+                field_dictionary=entry.field_dictionary or manifest.field_dictionary,  # type: ignore[arg-type]
+                nl_requirements=entry.nl_requirements,
+                legacy_points=entry.legacy_points,
+                raw_yaml_text=raw_yaml_text,
+                regression_samples=manifest.regression_samples,
+                gate=manifest.gate,
+                max_iterations=entry.max_iterations or manifest.max_iterations,
+                candidates_per_iteration=manifest.candidates_per_iteration,
+            )
+        except Exception as exc:  # noqa: BLE001
+            item.error = f"{type(exc).__name__}: {exc}"
+        item.elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return item
+
+
+class AgenticBatchSummarizer:
+    """Incremental batch summary, updated as scene items stream in."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self._completed = 0
+        self._approved = 0
+        self._blocked = 0
+        self._errored = 0
+        self._published = 0
+        self._iterations = 0
+
+    def add(self, item: AgenticBatchItem) -> None:
+        self._completed += 1
+        if item.report is None:
+            self._errored += 1
+            return
+        self._approved += item.report.status == AgenticRunStatus.APPROVED
+        self._blocked += item.report.status == AgenticRunStatus.BLOCKED
+        self._published += item.report.published
+        self._iterations += item.report.iterations_used
+
+    def summary(self, elapsed_ms: int = 0) -> AgenticBatchSummary:
+        reported = self._completed - self._errored
+        return AgenticBatchSummary(
+            total=self.total,
+            completed=self._completed,
+            approved=self._approved,
+            blocked=self._blocked,
+            errored=self._errored,
+            published=self._published,
+            mean_iterations=round(self._iterations / reported, 4) if reported else 0.0,
+            elapsed_ms=elapsed_ms,
+        )
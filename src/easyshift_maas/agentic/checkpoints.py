@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Protocol
+
+from easyshift_maas.core.contracts import AgenticRunState, ParserResult, now_utc
+
+
+class CheckpointStoreProtocol(Protocol):
+    def save(self, state: AgenticRunState) -> None: ...
+
+    def load(self, run_id: str) -> AgenticRunState: ...
+
+    def get_parse(self, key: str) -> ParserResult | None: ...
+
+    def put_parse(self, key: str, result: ParserResult) -> None: ...
+
+
+class InMemoryCheckpointStore:
+    """Process-local checkpoints, keeping the ``max_runs`` most recently saved runs.
+
+    States are stored serialized, so later in-place changes by the workflow do not
+    leak into a saved checkpoint.
+    """
+
+    def __init__(self, max_runs: int = 1024, max_parse_entries: int = 1024) -> None:
+        if max_runs <= 0 or max_parse_entries <= 0:
+            raise ValueError("max_runs and max_parse_entries must be positive")
+        self.max_runs = max_runs
+        self.max_parse_entries = max_parse_entries
+        self._runs: OrderedDict[str, str] = OrderedDict()
+        self._parses: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, state: AgenticRunState) -> None:
+        state.updated_at = now_utc()
+        encoded = state.model_dump_json()
+        with self._lock:
+            self._runs[state.run_id] = encoded
+            self._runs.move_to_end(state.run_id)
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+
+    def load(self, run_id: str) -> AgenticRunState:
+        with self._lock:
+            encoded = self._runs.get(run_id)
+        if encoded is None:
+            raise KeyError(f"checkpoint not found: {run_id}")
+        return AgenticRunState.model_validate_json(encoded)
+
+    def get_parse(self, key: str) -> ParserResult | None:
+        with self._lock:
+            encoded = self._parses.get(key)
+            if encoded is not None:
+                self._parses.move_to_end(key)
+        return ParserResult.model_validate_json(encoded) if encoded is not None else None
+
+    def put_parse(self, key: str, result: ParserResult) -> None:
+        with self._lock:
+            self._parses[key] = result.model_dump_json()
+            while len(self._parses) > self.max_parse_entries:
+                self._parses.popitem(last=False)
+
+
+class SQLiteCheckpointStore:
+    """Checkpoints and parse results in a local SQLite file (WAL mode).
+
+    Rows older than ``ttl_s`` are ignored and deleted, and each table keeps at most
+    ``max_runs`` / ``max_parse_entries`` rows; once a table outgrows its cap, expired
+    rows go first and then the oldest ones, down to 90% of the cap.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS run_checkpoints ("
+        " run_id TEXT PRIMARY KEY, updated_at TEXT NOT NULL, state TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS run_checkpoints_updated ON run_checkpoints (updated_at)",
+        "CREATE TABLE IF NOT EXISTS parse_cache (key TEXT PRIMARY KEY, created_at TEXT NOT NULL, result TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS parse_cache_created ON parse_cache (created_at)",
+    )
+    # table -> (key column, timestamp column, value column)
+    _TABLES = {
+        "run_checkpoints": ("run_id", "updated_at", "state"),
+        "parse_cache": ("key", "created_at", "result"),
+    }
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_runs: int = 10_000,
+        max_parse_entries: int = 10_000,
+        ttl_s: float = 7 * 24 * 3600.0,
+        clock: Callable[[], datetime] = now_utc,
+    ) -> None:
+        if max_runs <= 0 or max_parse_entries <= 0:
+            raise ValueError("max_runs and max_parse_entries must be positive")
+        self.path = Path(path)
+        self.ttl = timedelta(seconds=ttl_s)
+        self._caps = {"run_checkpoints": max_runs, "parse_cache": max_parse_entries}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+        self._counts = {
+            table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in self._TABLES
+        }
+
+    def save(self, state: AgenticRunState) -> None:
+        state.updated_at = self._clock()
+        with self._lock:
+            self._write("run_checkpoints", state.run_id, state.updated_at, state.model_dump_json())
+
+    def load(self, run_id: str) -> AgenticRunState:
+        with self._lock:
+            encoded = self._read("run_checkpoints", run_id)
+        if encoded is None:
+            raise KeyError(f"checkpoint not found: {run_id}")
+        return AgenticRunState.model_validate_json(encoded)
+
+    def get_parse(self, key: str) -> ParserResult | None:
+        with self._lock:
+            encoded = self._read("parse_cache", key)
+        return ParserResult.model_validate_json(encoded) if encoded is not None else None
+
+    def put_parse(self, key: str, result: ParserResult) -> None:
+        with self._lock:
+            self._write("parse_cache", key, self._clock(), result.model_dump_json())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _read(self, table: str, key: str) -> str | None:
+        key_column, time_column, value_column = self._TABLES[table]
+        row = self._conn.execute(
+            f"SELECT {value_column}, {time_column} FROM {table} WHERE {key_column} = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if datetime.fromisoformat(row[1]) < self._clock() - self.ttl:
+            self._conn.execute(f"DELETE FROM {table} WHERE {key_column} = ?", (key,))
+            self._counts[table] -= 1
+            return None
+        return row[0]
+
+    def _write(self, table: str, key: str, stamp: datetime, encoded: str) -> None:
+        key_column, time_column, value_column = self._TABLES[table]
+        exists = self._conn.execute(f"SELECT 1 FROM {table} WHERE {key_column} = ?", (key,)).fetchone()
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {table} ({key_column}, {time_column}, {value_column}) VALUES (?, ?, ?)",
+            (key, stamp.isoformat(), encoded),
+        )
+        if exists is None:
+            self._counts[table] += 1
+        if self._counts[table] > self._caps[table]:
+            self._prune(table)
+
+    def _prune(self, table: str) -> None:
+        key_column, time_column, _ = self._TABLES[table]
+        cutoff = (self._clock() - self.ttl).isoformat()
+        self._conn.execute(f"DELETE FROM {table} WHERE {time_column} < ?", (cutoff,))
+        remaining = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        target = max(1, int(self._caps[table] * 0.9))
+        if remaining > self._caps[table]:
+            remaining -= self._conn.execute(
+                f"DELETE FROM {table} WHERE {key_column} IN "
+                f"(SELECT {key_column} FROM {table} ORDER BY {time_column} LIMIT ?)",
+                (remaining - target,),
+            ).rowcount
+        self._counts[table] = remaining
+
+
+def build_checkpoint_store_from_env() -> InMemoryCheckpointStore | SQLiteCheckpointStore:
+    """Persist checkpoints to SQLite when ``REFLEXFLOW_CHECKPOINT_PATH`` is set."""
+
+    path = os.getenv("REFLEXFLOW_CHECKPOINT_PATH")
+    if not path:
+        return InMemoryCheckpointStore()
+    max_entries = int(os.getenv("REFLEXFLOW_CHECKPOINT_MAX_ENTRIES", "10000"))
+    return SQLiteCheckpointStore(
+        path,
+        max_runs=max_entries,
+        max_parse_entries=max_entries,
+        ttl_s=float(os.getenv("REFLEXFLOW_CHECKPOINT_TTL_SEC", str(7 * 24 * 3600))),
+    )
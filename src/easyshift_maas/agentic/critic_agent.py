@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from easyshift_maas.agentic.prompts.output_schemas import CriticAgentOutput
 from easyshift_maas.core.contracts import CriticFeedback, MigrationDraft, MigrationValidationReport, TemplateQualityReport
-from easyshift_maas.llm.client import LLMClientProtocol
+from easyshift_maas.llm.client import LLMClientProtocol, acomplete_validated, complete_validated
 
 
 class CriticAgent:
@@ -30,13 +31,7 @@ class CriticAgent:
                     quality_report=quality_report,
                 )
             except Exception as exc:  # noqa: BLE001
-                feedback = self._review_with_rules(
-                    failed_draft=failed_draft,
-                    validation_report=validation_report,
-                    quality_report=quality_report,
-                )
-                feedback.analysis = f"{feedback.analysis}; llm critic unavailable: {exc}"
-                return feedback
+                return self._fallback_feedback(exc, failed_draft, validation_report, quality_report)
 
         return self._review_with_rules(
             failed_draft=failed_draft,
@@ -44,35 +39,76 @@ class CriticAgent:
             quality_report=quality_report,
         )
 
-    def _review_with_llm(
+    async def areview(
         self,
         *,
         failed_draft: MigrationDraft,
         validation_report: MigrationValidationReport,
         quality_report: TemplateQualityReport,
     ) -> CriticFeedback:
-        result: CriticAgentOutput | None = None
+        """Async ``review`` that awaits the LLM instead of blocking a thread."""
+
+        if self.llm_client is not None:
+            try:
+                return await self._areview_with_llm(failed_draft, validation_report, quality_report)
+            except Exception as exc:  # noqa: BLE001
+                return self._fallback_feedback(exc, failed_draft, validation_report, quality_report)
+
+        return self._review_with_rules(
+            failed_draft=failed_draft,
+            validation_report=validation_report,
+            quality_report=quality_report,
+        )
+
+    async def _areview_with_llm(
+        self,
+        failed_draft: MigrationDraft,
+        validation_report: MigrationValidationReport,
+        quality_report: TemplateQualityReport,
+    ) -> CriticFeedback:
+        request = self._llm_request(failed_draft, validation_report, quality_report)
         last_error: Exception | None = None
         for _ in range(2):
             try:
-                payload, _meta = self.llm_client.complete_json(
-                    role="critic",
-                    system_prompt=self.prompt,
-                    user_payload={
-                        "failed_draft": failed_draft.model_dump(mode="json"),
-                        "validation_report": validation_report.model_dump(mode="json"),
-                        "quality_report": quality_report.model_dump(mode="json"),
-                    },
-                    temperature=0.0,
-                )
-                result = CriticAgentOutput.model_validate(payload)
-                break
+                output, _meta = await acomplete_validated(self.llm_client, CriticAgentOutput, **request)
+                return self._feedback_from_output(output)
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
-                continue
+        raise RuntimeError(f"critic llm output validation failed after retries: {last_error}")
 
-        if result is None:
-            raise RuntimeError(f"critic llm output validation failed after retries: {last_error}")
+    def _fallback_feedback(
+        self,
+        exc: Exception,
+        failed_draft: MigrationDraft,
+        validation_report: MigrationValidationReport,
+        quality_report: TemplateQualityReport,
+    ) -> CriticFeedback:
+        feedback = self._review_with_rules(
+            failed_draft=failed_draft,
+            validation_report=validation_report,
+            quality_report=quality_report,
+        )
+        feedback.analysis = f"{feedback.analysis}; llm critic unavailable: {exc}"
+        return feedback
+
+    def _llm_request(
+        self,
+        failed_draft: MigrationDraft,
+        validation_report: MigrationValidationReport,
+        quality_report: TemplateQualityReport,
+    ) -> dict[str, Any]:
+        return {
+            "role": "critic",
+            "system_prompt": self.prompt,
+            "user_payload": {
+                "failed_draft": failed_draft.model_dump(mode="json"),
+                "validation_report": validation_report.model_dump(mode="json"),
+                "quality_report": quality_report.model_dump(mode="json"),
+            },
+            "temperature": 0.0,
+        }
+
+    def _feedback_from_output(self, result: CriticAgentOutput) -> CriticFeedback:
         return CriticFeedback(
             is_fatal_error=result.is_fatal_error,
             analysis=result.analysis,
@@ -80,6 +116,28 @@ class CriticAgent:
             confidence=0.85,
         )
 
+    def _review_with_llm(
+        self,
+        *,
+        failed_draft: MigrationDraft,
+        validation_report: MigrationValidationReport,
+        quality_report: TemplateQualityReport,
+    ) -> CriticFeedback:
+        request = self._llm_request(failed_draft, validation_report, quality_report)
+        result: CriticAgentOutput | None = None
+        last_error: Exception | None = None
+        for _ in range(2):
+            try:
+                result, _meta = complete_validated(self.llm_client, CriticAgentOutput, **request)
+                break
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+                continue
+
+        if result is None:
+            raise RuntimeError(f"critic llm output validation failed after retries: {last_error}")
+        return self._feedback_from_output(result)
+
     def _review_with_rules(
         self,
         *,
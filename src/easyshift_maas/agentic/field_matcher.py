@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain
+
+from easyshift_maas.core.contracts import FieldDictionary
+
+_TOKEN_SPLIT = re.compile(r"[^a-zA-Z0-9]+")
+
+
+def tokenize(value: str) -> frozenset[str]:
+    return frozenset(item for item in _TOKEN_SPLIT.split(value.lower()) if item)
+
+
+class FieldTokenIndex:
+    """Inverted token -> field index for Jaccard matching of legacy point names.
+
+    Each field's token set (field name plus semantic label) is built once. A lookup
+    only scores fields sharing at least one token with the point, which is exactly
+    the set of fields that can score above zero. Ties keep the earliest field, as a
+    linear scan over the dictionary would.
+
+    The result depends only on the point's indexed tokens and its total token count,
+    so lookups are memoized on that pair; legacy tags that differ only in serial
+    numbers share one scoring pass. The memo is an LRU of at most ``memo_size``
+    entries, since indexes are cached and outlive the batches that fill them.
+    """
+
+    def __init__(self, field_dictionary: FieldDictionary, memo_size: int = 4096) -> None:
+        self.field_names = [item.field_name for item in field_dictionary.fields]
+        self._field_set = frozenset(self.field_names)
+        self._sizes: list[int] = []
+        postings: dict[str, list[int]] = defaultdict(list)
+        for position, item in enumerate(field_dictionary.fields):
+            tokens = tokenize(item.field_name) | tokenize(item.semantic_label)
+            self._sizes.append(len(tokens))
+            for token in tokens:
+                postings[token].append(position)
+        self._postings = dict(postings)
+        self.memo_size = memo_size
+        self._memo: OrderedDict[tuple[frozenset[str], int], tuple[str | None, float]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def has_field(self, field_name: str) -> bool:
+        return field_name in self._field_set
+
+    def best_match(self, legacy_name: str) -> tuple[str | None, float]:
+        """Return the highest-Jaccard field and its score, or ``(None, 0.0)``."""
+
+        legacy_tokens = tokenize(legacy_name)
+        known = frozenset(token for token in legacy_tokens if token in self._postings)
+        key = (known, len(legacy_tokens))
+        with self._memo_lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                return cached
+        cached = self._score(known, len(legacy_tokens))
+        with self._memo_lock:
+            self._memo[key] = cached
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return cached
+
+    def top_matches(self, legacy_name: str, limit: int) -> list[tuple[str, float]]:
+        """Return up to ``limit`` fields by descending score, earliest field first on ties."""
+
+        legacy_tokens = tokenize(legacy_name)
+        legacy_size = len(legacy_tokens)
+        sizes = self._sizes
+        overlap = Counter(
+            chain.from_iterable(self._postings[token] for token in legacy_tokens if token in self._postings)
+        )
+        ranked = heapq.nsmallest(
+            limit,
+            ((-shared / (legacy_size + sizes[position] - shared), position) for position, shared in overlap.items()),
+        )
+        return [(self.field_names[position], -negative) for negative, position in ranked]
+
+    def _score(self, known: frozenset[str], legacy_size: int) -> tuple[str | None, float]:
+        overlap = Counter(chain.from_iterable(self._postings[token] for token in known))
+        best_position = -1
+        best_score = 0.0
+        sizes = self._sizes
+        for position, shared in overlap.items():
+            score = shared / (legacy_size + sizes[position] - shared)
+            if score > best_score or (score == best_score and position < best_position):
+                best_score = score
+                best_position = position
+
+        if best_position < 0:
+            return None, 0.0
+        return self.field_names[best_position], best_score
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from easyshift_maas.agentic.prompts.output_schemas import GeneratorAgentOutput
 from easyshift_maas.core.contracts import (
@@ -22,11 +23,15 @@ from easyshift_maas.core.contracts import (
     ScenarioTemplate,
     SceneMetadata,
 )
-from easyshift_maas.llm.client import LLMClientProtocol
+from easyshift_maas.llm.client import LLMClientProtocol, acomplete_validated, complete_validated
 
 
 class GeneratorAgent:
-    """Generate migration draft from semantic fields and natural language requirements."""
+    """Generate migration draft from semantic fields and natural language requirements.
+
+    ``strategy="rules"`` skips the LLM; ``temperature`` is passed to the LLM call so
+    callers can ask for more varied candidates.
+    """
 
     def __init__(self, llm_client: LLMClientProtocol | None = None, prompt_path: str | None = None) -> None:
         self.llm_client = llm_client
@@ -42,8 +47,10 @@ class GeneratorAgent:
         parser_result: ParserResult | None = None,
         correction_instruction: str | None = None,
         iteration: int = 1,
+        temperature: float = 0.1,
+        strategy: str = "auto",
     ) -> MigrationDraft:
-        if self.llm_client is not None:
+        if self.llm_client is not None and strategy != "rules":
             try:
                 return self._generate_with_llm(
                     scene_metadata=scene_metadata,
@@ -52,23 +59,60 @@ class GeneratorAgent:
                     parser_result=parser_result,
                     correction_instruction=correction_instruction,
                     iteration=iteration,
+                    temperature=temperature,
                 )
             except Exception as exc:  # noqa: BLE001
-                draft = self._generate_with_rules(
+                return self._fallback_draft(
+                    exc,
                     scene_metadata=scene_metadata,
                     field_dictionary=field_dictionary,
                     nl_requirements=nl_requirements,
                     parser_result=parser_result,
                     iteration=iteration,
                 )
-                draft.risks.append(
-                    MigrationRisk(
-                        code="LLM_GENERATOR_UNAVAILABLE",
-                        message=f"llm generator unavailable, fallback to rule generator: {exc}",
-                    )
+
+        return self._generate_with_rules(
+            scene_metadata=scene_metadata,
+            field_dictionary=field_dictionary,
+            nl_requirements=nl_requirements,
+            parser_result=parser_result,
+            iteration=iteration,
+        )
+
+    async def agenerate(
+        self,
+        *,
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        nl_requirements: list[str],
+        parser_result: ParserResult | None = None,
+        correction_instruction: str | None = None,
+        iteration: int = 1,
+        temperature: float = 0.1,
+        strategy: str = "auto",
+    ) -> MigrationDraft:
+        """Async ``generate`` that awaits the LLM instead of blocking a thread."""
+
+        if self.llm_client is not None and strategy != "rules":
+            try:
+                return await self._agenerate_with_llm(
+                    scene_metadata=scene_metadata,
+                    field_dictionary=field_dictionary,
+                    nl_requirements=nl_requirements,
+                    parser_result=parser_result,
+                    correction_instruction=correction_instruction,
+                    iteration=iteration,
+                    temperature=temperature,
+                )
+            except Exception as exc:  # noqa: BLE001
+                return self._fallback_draft(
+                    exc,
+                    scene_metadata=scene_metadata,
+                    field_dictionary=field_dictionary,
+                    nl_requirements=nl_requirements,
+                    parser_result=parser_result,
+                    iteration=iteration,
                 )
-                draft.generation_strategy = "rule_fallback"
-                return draft
 
         return self._generate_with_rules(
             scene_metadata=scene_metadata,
@@ -78,6 +122,55 @@ class GeneratorAgent:
             iteration=iteration,
         )
 
+    def _fallback_draft(
+        self,
+        exc: Exception,
+        *,
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        nl_requirements: list[str],
+        parser_result: ParserResult | None,
+        iteration: int,
+    ) -> MigrationDraft:
+        draft = self._generate_with_rules(
+            scene_metadata=scene_metadata,
+            field_dictionary=field_dictionary,
+            nl_requirements=nl_requirements,
+            parser_result=parser_result,
+            iteration=iteration,
+        )
+        draft.risks.append(
+            MigrationRisk(
+                code="LLM_GENERATOR_UNAVAILABLE",
+                message=f"llm generator unavailable, fallback to rule generator: {exc}",
+            )
+        )
+        draft.generation_strategy = "rule_fallback"
+        return draft
+
+    def _llm_request(
+        self,
+        *,
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        nl_requirements: list[str],
+        parser_result: ParserResult | None,
+        correction_instruction: str | None,
+        temperature: float = 0.1,
+    ) -> dict[str, Any]:
+        return {
+            "role": "generator",
+            "system_prompt": self.prompt,
+            "user_payload": {
+                "scene_metadata": scene_metadata.model_dump(mode="json"),
+                "field_dictionary": field_dictionary.model_dump(mode="json"),
+                "nl_requirements": nl_requirements,
+                "parser_result": parser_result.model_dump(mode="json") if parser_result else None,
+                "correction_instruction": correction_instruction,
+            },
+            "temperature": temperature,
+        }
+
     def _generate_with_llm(
         self,
         *,
@@ -87,25 +180,22 @@ class GeneratorAgent:
         parser_result: ParserResult | None,
         correction_instruction: str | None,
         iteration: int,
+        temperature: float = 0.1,
     ) -> MigrationDraft:
+        request = self._llm_request(
+            scene_metadata=scene_metadata,
+            field_dictionary=field_dictionary,
+            nl_requirements=nl_requirements,
+            parser_result=parser_result,
+            correction_instruction=correction_instruction,
+            temperature=temperature,
+        )
         last_error: Exception | None = None
         output: GeneratorAgentOutput | None = None
         meta: dict[str, str] = {}
         for _ in range(2):
             try:
-                payload, meta_payload = self.llm_client.complete_json(
-                    role="generator",
-                    system_prompt=self.prompt,
-                    user_payload={
-                        "scene_metadata": scene_metadata.model_dump(mode="json"),
-                        "field_dictionary": field_dictionary.model_dump(mode="json"),
-                        "nl_requirements": nl_requirements,
-                        "parser_result": parser_result.model_dump(mode="json") if parser_result else None,
-                        "correction_instruction": correction_instruction,
-                    },
-                    temperature=0.1,
-                )
-                output = GeneratorAgentOutput.model_validate(payload)
+                output, meta_payload = complete_validated(self.llm_client, GeneratorAgentOutput, **request)
                 meta = {key: str(value) for key, value in meta_payload.items()}
                 break
             except Exception as exc:  # noqa: BLE001
@@ -114,7 +204,64 @@ class GeneratorAgent:
 
         if output is None:
             raise RuntimeError(f"generator llm output validation failed after retries: {last_error}")
+        return self._draft_from_output(
+            output,
+            meta=meta,
+            scene_metadata=scene_metadata,
+            field_dictionary=field_dictionary,
+            parser_result=parser_result,
+            correction_instruction=correction_instruction,
+            iteration=iteration,
+        )
 
+    async def _agenerate_with_llm(
+        self,
+        *,
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        nl_requirements: list[str],
+        parser_result: ParserResult | None,
+        correction_instruction: str | None,
+        iteration: int,
+        temperature: float = 0.1,
+    ) -> MigrationDraft:
+        request = self._llm_request(
+            scene_metadata=scene_metadata,
+            field_dictionary=field_dictionary,
+            nl_requirements=nl_requirements,
+            parser_result=parser_result,
+            correction_instruction=correction_instruction,
+            temperature=temperature,
+        )
+        last_error: Exception | None = None
+        for _ in range(2):
+            try:
+                output, meta_payload = await acomplete_validated(self.llm_client, GeneratorAgentOutput, **request)
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+                continue
+            return self._draft_from_output(
+                output,
+                meta={key: str(value) for key, value in meta_payload.items()},
+                scene_metadata=scene_metadata,
+                field_dictionary=field_dictionary,
+                parser_result=parser_result,
+                correction_instruction=correction_instruction,
+                iteration=iteration,
+            )
+        raise RuntimeError(f"generator llm output validation failed after retries: {last_error}")
+
+    def _draft_from_output(
+        self,
+        output: GeneratorAgentOutput,
+        *,
+        meta: dict[str, str],
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        parser_result: ParserResult | None,
+        correction_instruction: str | None,
+        iteration: int,
+    ) -> MigrationDraft:
         objective_terms = [
             ObjectiveTerm(
                 field_name=item.field_name,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Generator
 
+from easyshift_maas.agentic.checkpoints import CheckpointStoreProtocol
 from easyshift_maas.agentic.critic_agent import CriticAgent
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.parser_agent import ParserAgent
@@ -13,12 +16,21 @@ from easyshift_maas.core.contracts import (
     FieldDictionary,
     IssueSeverity,
     MigrationDraft,
+    MigrationValidationReport,
     ReflectionStep,
     SceneMetadata,
     SimulationSample,
     TemplateQualityGate,
+    TemplateQualityReport,
 )
-from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
+from easyshift_maas.core.hashing import canonical_digest
+from easyshift_maas.core.template_diff import TemplateFingerprint, fingerprint_template
+# Module import (not ``from ... import``) so importing the quality package first
+# does not trip over the quality -> agentic -> workflow -> quality cycle.
+from easyshift_maas.quality import template_quality
+
+# Steps the reflection loop yields for checkpoint-store I/O rather than agent work.
+_STORE_STEPS = frozenset({"checkpoint", "get_parse", "put_parse"})
 
 
 class LangGraphMigrationWorkflow:
@@ -35,13 +47,17 @@ class LangGraphMigrationWorkflow:
         generator_agent: GeneratorAgent,
         critic_agent: CriticAgent,
         validator: TemplateValidator | None = None,
-        quality_evaluator: TemplateQualityEvaluator | None = None,
+        quality_evaluator: template_quality.TemplateQualityEvaluator | None = None,
+        checkpoint_store: CheckpointStoreProtocol | None = None,
     ) -> None:
         self.parser_agent = parser_agent
         self.generator_agent = generator_agent
         self.critic_agent = critic_agent
         self.validator = validator or TemplateValidator()
-        self.quality_evaluator = quality_evaluator or TemplateQualityEvaluator(validator=self.validator)
+        self.quality_evaluator = quality_evaluator or template_quality.TemplateQualityEvaluator(
+            validator=self.validator
+        )
+        self.checkpoint_store = checkpoint_store
 
     def run(
         self,
@@ -54,42 +70,340 @@ class LangGraphMigrationWorkflow:
         regression_samples: list[SimulationSample] | None = None,
         gate: TemplateQualityGate | None = None,
         max_iterations: int = 3,
+        candidates_per_iteration: int = 1,
+        cancel_check: Callable[[], bool] | None = None,
+        run_id: str | None = None,
     ) -> AgenticRunReport:
-        state = AgenticRunState(
+        """Run the reflection loop, calling each agent synchronously.
+
+        ``cancel_check`` is polled before every step; once it returns True the run
+        stops with ``RuntimeError``. ``run_id`` names the checkpoint for :meth:`resume`.
+        """
+
+        state = self._new_state(
+            run_id=run_id,
             scene_metadata=scene_metadata,
             field_dictionary=field_dictionary,
             nl_requirements=nl_requirements,
+            legacy_points=legacy_points,
+            raw_yaml_text=raw_yaml_text,
+            regression_samples=regression_samples,
+            gate=gate,
+            max_iterations=max_iterations,
+            candidates_per_iteration=candidates_per_iteration,
         )
+        return self._drive(state, cancel_check)
+
+    async def arun(
+        self,
+        *,
+        scene_metadata: SceneMetadata,
+        field_dictionary: FieldDictionary,
+        nl_requirements: list[str],
+        legacy_points: list[str] | None = None,
+        raw_yaml_text: str | None = None,
+        regression_samples: list[SimulationSample] | None = None,
+        gate: TemplateQualityGate | None = None,
+        max_iterations: int = 3,
+        candidates_per_iteration: int = 1,
+        cancel_check: Callable[[], bool] | None = None,
+        run_id: str | None = None,
+    ) -> AgenticRunReport:
+        """Run the same loop awaiting the async agents.
 
-        parser_result = self.parser_agent.parse(
+        Deterministic validation and quality scoring are CPU-bound and run in worker
+        threads so the event loop stays free for other requests.
+        """
+
+        state = self._new_state(
+            run_id=run_id,
+            scene_metadata=scene_metadata,
             field_dictionary=field_dictionary,
+            nl_requirements=nl_requirements,
             legacy_points=legacy_points,
             raw_yaml_text=raw_yaml_text,
+            regression_samples=regression_samples,
+            gate=gate,
+            max_iterations=max_iterations,
+            candidates_per_iteration=candidates_per_iteration,
         )
-        state.parser_result = parser_result
-
-        correction_instruction: Optional[str] = None
-        last_validation = None
-        last_quality = None
-
-        for iteration in range(1, max(1, max_iterations) + 1):
-            state.iteration = iteration
-            draft = self.generator_agent.generate(
-                scene_metadata=scene_metadata,
-                field_dictionary=field_dictionary,
-                nl_requirements=nl_requirements,
-                parser_result=parser_result,
-                correction_instruction=correction_instruction,
-                iteration=iteration,
-            )
+        return await self._adrive(state, cancel_check)
+
+    def resume(self, run_id: str, *, cancel_check: Callable[[], bool] | None = None) -> AgenticRunReport:
+        """Continue a run from its last checkpoint; a finished run returns its report.
+
+        Completed parse, generate and review steps are not repeated. Scoring is
+        deterministic and re-runs for a draft set that had not been reviewed yet.
+        """
+
+        state = self._load_state(run_id)
+        if state.report is not None:
+            return state.report
+        return self._drive(state, cancel_check)
+
+    async def aresume(self, run_id: str, *, cancel_check: Callable[[], bool] | None = None) -> AgenticRunReport:
+        state = await asyncio.to_thread(self._load_state, run_id)
+        if state.report is not None:
+            return state.report
+        return await self._adrive(state, cancel_check)
+
+    def _new_state(
+        self,
+        *,
+        run_id: str | None,
+        legacy_points: list[str] | None,
+        regression_samples: list[SimulationSample] | None,
+        **inputs: Any,
+    ) -> AgenticRunState:
+        state = AgenticRunState(
+            legacy_points=list(legacy_points or []),
+            regression_samples=list(regression_samples or []),
+            **inputs,
+        )
+        if run_id is not None:
+            state.run_id = run_id
+        return state
+
+    def _load_state(self, run_id: str) -> AgenticRunState:
+        if self.checkpoint_store is None:
+            raise RuntimeError("resume requires a checkpoint store")
+        return self.checkpoint_store.load(run_id)
+
+    def _checkpoint(self, state: AgenticRunState, step: str) -> Generator[tuple[str, dict[str, Any]], Any, None]:
+        state.last_step = step
+        if self.checkpoint_store is not None:
+            yield "checkpoint", {"state": state}
+
+    def _store_calls(self) -> dict[str, Callable[..., Any]]:
+        store = self.checkpoint_store
+        if store is None:
+            return {}
+        return {"checkpoint": store.save, "get_parse": store.get_parse, "put_parse": store.put_parse}
 
-            validation = self.validator.validate(draft)
-            quality = self.quality_evaluator.evaluate(
-                template=draft.template,
-                regression_samples=regression_samples,
-                gate=gate,
+    def _parse_key(self, state: AgenticRunState) -> str:
+        return canonical_digest(
+            {
+                "field_dictionary": state.field_dictionary.model_dump(mode="json"),
+                "legacy_points": state.legacy_points,
+                "raw_yaml_text": state.raw_yaml_text,
+                "llm": self._parser_llm_identity(),
+            }
+        )
+
+    def _parser_llm_identity(self) -> dict[str, Any] | None:
+        # Persisted parses outlive deployments, so a new prompt, model, endpoint or
+        # chunking budget must not be served an answer produced under the old one.
+        parser = self.parser_agent
+        if parser.llm_client is None:
+            return None
+        role_configs = getattr(parser.llm_client, "role_configs", None) or {}
+        config = role_configs.get("parser")
+        return {
+            "prompt": canonical_digest(parser.prompt),
+            "model": config.model if config is not None else None,
+            "base_url": config.base_url if config is not None else None,
+            "chunk_token_budget": parser.chunk_token_budget,
+        }
+
+    def _drive(self, state: AgenticRunState, cancel_check: Callable[[], bool] | None) -> AgenticRunReport:
+        calls: dict[str, Callable[..., Any]] = {
+            "parse": self.parser_agent.parse,
+            "generate": self._generate_all,
+            "score": self._score_all,
+            "review": self.critic_agent.review,
+            **self._store_calls(),
+        }
+        steps = self._steps(state)
+        result: Any = None
+        while True:
+            try:
+                name, call_kwargs = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+            if name not in _STORE_STEPS and cancel_check is not None and cancel_check():
+                raise RuntimeError("agentic run cancelled")
+            result = calls[name](**call_kwargs)
+
+    async def _adrive(self, state: AgenticRunState, cancel_check: Callable[[], bool] | None) -> AgenticRunReport:
+        calls: dict[str, Callable[..., Awaitable[Any]]] = {
+            "parse": self.parser_agent.aparse,
+            "generate": self._agenerate_all,
+            "score": self._ascore_all,
+            "review": self.critic_agent.areview,
+        }
+        # Checkpoint stores do blocking (SQLite) I/O, so their steps run in a worker thread.
+        store_calls = self._store_calls()
+        steps = self._steps(state)
+        result: Any = None
+        while True:
+            try:
+                name, call_kwargs = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+            if name in store_calls:
+                result = await asyncio.to_thread(store_calls[name], **call_kwargs)
+                continue
+            if cancel_check is not None and cancel_check():
+                raise RuntimeError("agentic run cancelled")
+            result = await calls[name](**call_kwargs)
+
+    def _candidate_variants(self, count: int) -> list[dict[str, Any]]:
+        if count <= 1 or self.generator_agent.llm_client is None:
+            return [{}]
+        llm_count = count - 1
+        variants: list[dict[str, Any]] = [
+            {"temperature": round(0.1 + 0.9 * idx / max(1, llm_count - 1), 2)} for idx in range(llm_count)
+        ]
+        variants.append({"strategy": "rules"})
+        return variants
+
+    def _pick_best(
+        self,
+        drafts: list[MigrationDraft],
+        scores: list[tuple[MigrationValidationReport, TemplateQualityReport] | None],
+    ) -> tuple[MigrationDraft, MigrationValidationReport, TemplateQualityReport]:
+        def _rank(idx: int) -> tuple:
+            validation, quality = scores[idx]  # type: ignore[misc]
+            return (
+                validation.valid and quality.passed,
+                validation.valid,
+                quality.overall_score,
+                validation.correctness_score,
+                -idx,
             )
 
+        best = max((idx for idx, item in enumerate(scores) if item is not None), key=_rank)
+        return drafts[best], scores[best][0], scores[best][1]  # type: ignore[index]
+
+    def _contenders(self, drafts: list[MigrationDraft]) -> list[int]:
+        # A valid draft outranks every invalid one in _pick_best, so once one candidate
+        # passes the fail-fast check the invalid ones need no full scoring.
+        if len(drafts) == 1:
+            return [0]
+        valid = [idx for idx, draft in enumerate(drafts) if self.validator.is_valid(draft)]
+        return valid or list(range(len(drafts)))
+
+    def _generate_all(self, *, requests: list[dict[str, Any]]) -> list[MigrationDraft]:
+        if len(requests) == 1:
+            return [self.generator_agent.generate(**requests[0])]
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            return list(pool.map(lambda request: self.generator_agent.generate(**request), requests))
+
+    async def _agenerate_all(self, *, requests: list[dict[str, Any]]) -> list[MigrationDraft]:
+        return list(await asyncio.gather(*(self.generator_agent.agenerate(**request) for request in requests)))
+
+    def _score(
+        self,
+        draft: MigrationDraft,
+        regression_samples: list[SimulationSample] | None,
+        gate: TemplateQualityGate | None,
+    ) -> tuple[MigrationValidationReport, TemplateQualityReport]:
+        # One fingerprint feeds both, so unchanged sections are reused across iterations.
+        fingerprint = fingerprint_template(draft.template)
+        validation = self.validator.validate(draft, fingerprint=fingerprint)
+        quality = self.quality_evaluator.evaluate(
+            template=draft.template,
+            regression_samples=regression_samples,
+            gate=gate,
+            fingerprint=fingerprint,
+        )
+        return validation, quality
+
+    def _score_all(
+        self,
+        *,
+        drafts: list[MigrationDraft],
+        regression_samples: list[SimulationSample] | None,
+        gate: TemplateQualityGate | None,
+    ) -> list[tuple[MigrationValidationReport, TemplateQualityReport] | None]:
+        """Score the contending drafts; skipped drafts get ``None``.
+
+        Scoring is pure-Python CPU work with no I/O, so threads would only add
+        overhead under the GIL; contenders are scored one after another.
+        """
+
+        scores: list[tuple[MigrationValidationReport, TemplateQualityReport] | None] = [None] * len(drafts)
+        for idx in self._contenders(drafts):
+            scores[idx] = self._score(drafts[idx], regression_samples, gate)
+        return scores
+
+    async def _ascore_all(
+        self,
+        *,
+        drafts: list[MigrationDraft],
+        regression_samples: list[SimulationSample] | None,
+        gate: TemplateQualityGate | None,
+    ) -> list[tuple[MigrationValidationReport, TemplateQualityReport] | None]:
+        # One worker thread keeps the event loop free; see _score_all for why not more.
+        return await asyncio.to_thread(
+            self._score_all, drafts=drafts, regression_samples=regression_samples, gate=gate
+        )
+
+    def _steps(self, state: AgenticRunState) -> Generator[tuple[str, dict[str, Any]], Any, AgenticRunReport]:
+        """Reflection loop as a generator of ``(step, kwargs)`` calls.
+
+        ``_drive`` and ``_adrive`` run it, sending each step's result back in, so the
+        sync and async paths share one control flow. With ``candidates_per_iteration``
+        above one, each iteration generates that many drafts concurrently (spread over
+        temperatures, plus one rule draft), scores them and keeps the best; once one
+        candidate passes the fail-fast validation, invalid ones are not scored. Each
+        reflection step records which template sections changed since the previous
+        iteration's draft. ``state`` is checkpointed after every step and the loop
+        picks up from whatever it already holds, which is how :meth:`resume` works.
+        """
+
+        if state.parser_result is None:
+            key = self._parse_key(state)
+            cached = (yield "get_parse", {"key": key}) if self.checkpoint_store is not None else None
+            if cached is None:
+                cached = yield "parse", {
+                    "field_dictionary": state.field_dictionary,
+                    "legacy_points": state.legacy_points,
+                    "raw_yaml_text": state.raw_yaml_text,
+                }
+                # Fallbacks and partial results (anything with warnings) are not cached,
+                # so a transient LLM failure does not pin rule mappings for later runs.
+                if self.checkpoint_store is not None and not cached.warnings:
+                    yield "put_parse", {"key": key, "result": cached}
+            state.parser_result = cached
+            yield from self._checkpoint(state, "parse")
+        parser_result = state.parser_result
+        regression_samples = state.regression_samples or None
+        gate = state.gate
+
+        previous_fingerprint: TemplateFingerprint | None = (
+            fingerprint_template(state.current_draft.template) if state.current_draft is not None else None
+        )
+
+        for iteration in range(len(state.reflections) + 1, max(1, state.max_iterations) + 1):
+            if state.iteration != iteration or not state.candidate_drafts:
+                state.iteration = iteration
+                base_request = {
+                    "scene_metadata": state.scene_metadata,
+                    "field_dictionary": state.field_dictionary,
+                    "nl_requirements": state.nl_requirements,
+                    "parser_result": parser_result,
+                    "correction_instruction": state.correction_instruction,
+                    "iteration": iteration,
+                }
+                state.candidate_drafts = yield "generate", {
+                    "requests": [
+                        {**base_request, **variant}
+                        for variant in self._candidate_variants(state.candidates_per_iteration)
+                    ]
+                }
+                yield from self._checkpoint(state, "generate")
+            drafts = state.candidate_drafts
+
+            scores = yield "score", {"drafts": drafts, "regression_samples": regression_samples, "gate": gate}
+            draft, validation, quality = self._pick_best(drafts, scores)
+            state.last_validation = validation
+            state.last_quality = quality
+            yield from self._checkpoint(state, "score")
+            fingerprint = fingerprint_template(draft.template)
+            changed_sections = fingerprint.changed_sections(previous_fingerprint)
+            previous_fingerprint = fingerprint
+
             validation_errors = [
                 f"{item.code}: {item.message}"
                 for item in validation.issues
@@ -110,27 +424,33 @@ class LangGraphMigrationWorkflow:
                     validation_errors=[],
                     quality_errors=[],
                     critic_feedback=None,
+                    candidates_evaluated=len(drafts),
+                    changed_sections=changed_sections,
                 )
                 state.reflections.append(pass_step)
                 draft.trace = list(state.reflections)
                 state.current_draft = draft
-                return AgenticRunReport(
-                    run_id=state.run_id,
-                    status=AgenticRunStatus.APPROVED,
-                    parser_result=parser_result,
-                    final_draft=draft,
-                    validation=validation,
-                    quality=quality,
-                    reflections=list(state.reflections),
-                    iterations_used=iteration,
-                    published=False,
-                )
+                state.candidate_drafts = []
+                return (yield from self._finish(
+                    state,
+                    AgenticRunReport(
+                        run_id=state.run_id,
+                        status=AgenticRunStatus.APPROVED,
+                        parser_result=parser_result,
+                        final_draft=draft,
+                        validation=validation,
+                        quality=quality,
+                        reflections=list(state.reflections),
+                        iterations_used=iteration,
+                        published=False,
+                    ),
+                ))
 
-            critic = self.critic_agent.review(
-                failed_draft=draft,
-                validation_report=validation,
-                quality_report=quality,
-            )
+            critic = yield "review", {
+                "failed_draft": draft,
+                "validation_report": validation,
+                "quality_report": quality,
+            }
             step = ReflectionStep(
                 iteration=iteration,
                 draft_id=draft.draft_id,
@@ -139,39 +459,53 @@ class LangGraphMigrationWorkflow:
                 validation_errors=validation_errors,
                 quality_errors=quality_errors,
                 critic_feedback=critic,
+                candidates_evaluated=len(drafts),
+                changed_sections=changed_sections,
             )
             state.reflections.append(step)
-            correction_instruction = critic.correction_instruction
+            state.correction_instruction = critic.correction_instruction
 
             draft.trace = list(state.reflections)
             state.current_draft = draft
-            last_validation = validation
-            last_quality = quality
+            state.candidate_drafts = []
+            yield from self._checkpoint(state, "review")
 
             if critic.is_fatal_error:
-                return AgenticRunReport(
-                    run_id=state.run_id,
-                    status=AgenticRunStatus.BLOCKED,
-                    parser_result=parser_result,
-                    final_draft=draft,
-                    validation=validation,
-                    quality=quality,
-                    reflections=list(state.reflections),
-                    blocked_reason="critic_marked_fatal_error",
-                    iterations_used=iteration,
-                    published=False,
-                )
+                return (yield from self._finish(
+                    state,
+                    AgenticRunReport(
+                        run_id=state.run_id,
+                        status=AgenticRunStatus.BLOCKED,
+                        parser_result=parser_result,
+                        final_draft=draft,
+                        validation=validation,
+                        quality=quality,
+                        reflections=list(state.reflections),
+                        blocked_reason="critic_marked_fatal_error",
+                        iterations_used=iteration,
+                        published=False,
+                    ),
+                ))
 
-        final_draft: MigrationDraft | None = state.current_draft
-        return AgenticRunReport(
-            run_id=state.run_id,
-            status=AgenticRunStatus.BLOCKED,
-            parser_result=parser_result,
-            final_draft=final_draft,
-            validation=last_validation,
-            quality=last_quality,
-            reflections=list(state.reflections),
-            blocked_reason="max_iterations_reached",
-            iterations_used=max_iterations,
-            published=False,
-        )
+        return (yield from self._finish(
+            state,
+            AgenticRunReport(
+                run_id=state.run_id,
+                status=AgenticRunStatus.BLOCKED,
+                parser_result=parser_result,
+                final_draft=state.current_draft,
+                validation=state.last_validation,
+                quality=state.last_quality,
+                reflections=list(state.reflections),
+                blocked_reason="max_iterations_reached",
+                iterations_used=state.max_iterations,
+                published=False,
+            ),
+        ))
+
+    def _finish(
+        self, state: AgenticRunState, report: AgenticRunReport
+    ) -> Generator[tuple[str, dict[str, Any]], Any, AgenticRunReport]:
+        state.report = report
+        yield from self._checkpoint(state, "done")
+        return report
@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from easyshift_maas.agentic.field_matcher import FieldTokenIndex
 from easyshift_maas.agentic.prompts.output_schemas import ParserAgentOutput
 from easyshift_maas.core.contracts import FieldDictionary, ParserMapping, ParserResult
-from easyshift_maas.llm.client import LLMClientProtocol
+from easyshift_maas.core.hashing import model_digest
+from easyshift_maas.ingestion.legacy_scan import collect_point_keys, load_yaml_text
+from easyshift_maas.llm.client import LLMClientProtocol, acomplete_validated, complete_validated
 
 
 class ParserAgent:
-    """Map legacy point names to canonical field dictionary."""
+    """Map legacy point names to canonical field dictionary.
+
+    LLM requests are split into chunks of at most ``chunk_token_budget`` estimated
+    tokens and sent with up to ``max_concurrency`` in flight. When the field
+    dictionary alone does not fit the budget, each chunk carries only the fields the
+    rule matcher ranks highest for its points. A chunk that fails is mapped by rules;
+    the others keep their LLM mappings. Field indexes are cached per dictionary
+    content, so many scenes sharing one dictionary build it once.
+    """
+
+    _CHARS_PER_TOKEN = 4
+    _FIELDS_PER_POINT = 8
 
     _RESERVED_KEYS = {
         "scene",
@@ -22,14 +39,28 @@ class ParserAgent:
         "template_override",
         "redis_config",
         "mysql_config",
+        "file_config",
     }
 
     def __init__(
         self,
         llm_client: LLMClientProtocol | None = None,
         prompt_path: str | None = None,
+        *,
+        chunk_token_budget: int = 6000,
+        max_concurrency: int = 4,
+        index_cache_size: int = 64,
     ) -> None:
+        if chunk_token_budget <= 0:
+            raise ValueError("chunk_token_budget must be positive")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
         self.llm_client = llm_client
+        self.chunk_token_budget = chunk_token_budget
+        self.max_concurrency = max_concurrency
+        self.index_cache_size = index_cache_size
+        self._indexes: OrderedDict[str, FieldTokenIndex] = OrderedDict()
+        self._index_lock = threading.Lock()
         default_path = Path(__file__).with_name("prompts") / "parser_system.md"
         self.prompt = Path(prompt_path).read_text(encoding="utf-8") if prompt_path else default_path.read_text(encoding="utf-8")
 
@@ -42,63 +73,138 @@ class ParserAgent:
     ) -> ParserResult:
         points = self._collect_points(legacy_points=legacy_points or [], raw_yaml_text=raw_yaml_text)
         if not points:
-            return ParserResult(
-                mappings=[],
-                unmapped_points=[],
-                confidence=0.0,
-                strategy="empty_input",
-                warnings=["no legacy points provided"],
-            )
+            return self._empty_result()
 
         if self.llm_client is not None:
             try:
                 return self._parse_with_llm(points=points, field_dictionary=field_dictionary)
             except Exception as exc:  # noqa: BLE001
-                fallback = self._parse_with_rules(points=points, field_dictionary=field_dictionary)
-                fallback.warnings.append(f"llm parser unavailable, fallback to rule mapping: {exc}")
-                return fallback
+                return self._fallback_result(points, field_dictionary, exc)
 
         return self._parse_with_rules(points=points, field_dictionary=field_dictionary)
 
-    def _parse_with_llm(self, *, points: list[str], field_dictionary: FieldDictionary) -> ParserResult:
-        last_error: Exception | None = None
-        parsed: ParserAgentOutput | None = None
-        for _ in range(2):
+    async def aparse(
+        self,
+        *,
+        field_dictionary: FieldDictionary,
+        legacy_points: list[str] | None = None,
+        raw_yaml_text: str | None = None,
+    ) -> ParserResult:
+        """Async ``parse``: chunks are awaited concurrently instead of using threads.
+
+        YAML parsing, chunk planning, merging and rule mapping are CPU-bound and run
+        in a worker thread, so large legacy inputs do not stall the event loop.
+        """
+
+        points = await asyncio.to_thread(
+            self._collect_points, legacy_points=legacy_points or [], raw_yaml_text=raw_yaml_text
+        )
+        if not points:
+            return self._empty_result()
+
+        if self.llm_client is not None:
             try:
-                payload, _meta = self.llm_client.complete_json(
-                    role="parser",
-                    system_prompt=self.prompt,
-                    user_payload={
-                        "legacy_points": points,
-                        "field_dictionary": field_dictionary.model_dump(mode="json"),
-                    },
-                    temperature=0.0,
-                )
-                parsed = ParserAgentOutput.model_validate(payload)
-                break
+                return await self._aparse_with_llm(points=points, field_dictionary=field_dictionary)
             except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                continue
+                return await asyncio.to_thread(self._fallback_result, points, field_dictionary, exc)
+
+        return await asyncio.to_thread(self._parse_with_rules, points=points, field_dictionary=field_dictionary)
+
+    def _index(self, field_dictionary: FieldDictionary) -> FieldTokenIndex:
+        # Scenes of one plant usually share a dictionary; reuse its index and memo.
+        if self.index_cache_size <= 0:
+            return FieldTokenIndex(field_dictionary)
+        key = model_digest(field_dictionary)
+        with self._index_lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        index = FieldTokenIndex(field_dictionary)
+        with self._index_lock:
+            self._indexes[key] = index
+            while len(self._indexes) > self.index_cache_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _empty_result(self) -> ParserResult:
+        return ParserResult(
+            mappings=[],
+            unmapped_points=[],
+            confidence=0.0,
+            strategy="empty_input",
+            warnings=["no legacy points provided"],
+        )
+
+    def _fallback_result(self, points: list[str], field_dictionary: FieldDictionary, exc: Exception) -> ParserResult:
+        fallback = self._parse_with_rules(points=points, field_dictionary=field_dictionary)
+        fallback.warnings.append(f"llm parser unavailable, fallback to rule mapping: {exc}")
+        return fallback
+
+    def _parse_with_llm(self, *, points: list[str], field_dictionary: FieldDictionary) -> ParserResult:
+        index = self._index(field_dictionary)
+        chunks = self._plan_chunks(points=points, field_dictionary=field_dictionary, index=index)
+        if len(chunks) == 1:
+            outcomes = [self._run_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+                outcomes = list(pool.map(self._run_chunk, chunks))
+        return self._merge_chunks(points, field_dictionary, index, chunks, outcomes)
+
+    async def _aparse_with_llm(self, *, points: list[str], field_dictionary: FieldDictionary) -> ParserResult:
+        index = await asyncio.to_thread(self._index, field_dictionary)
+        chunks = await asyncio.to_thread(
+            self._plan_chunks, points=points, field_dictionary=field_dictionary, index=index
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(chunk: tuple[list[str], dict[str, Any]]) -> ParserAgentOutput | Exception:
+            async with semaphore:
+                return await self._arun_chunk(chunk)
 
-        if parsed is None:
-            raise RuntimeError(f"parser llm output validation failed after retries: {last_error}")
+        outcomes = list(await asyncio.gather(*(_bounded(chunk) for chunk in chunks)))
+        return await asyncio.to_thread(self._merge_chunks, points, field_dictionary, index, chunks, outcomes)
+
+    def _merge_chunks(
+        self,
+        points: list[str],
+        field_dictionary: FieldDictionary,
+        index: FieldTokenIndex,
+        chunks: list[tuple[list[str], dict[str, Any]]],
+        outcomes: list[ParserAgentOutput | Exception],
+    ) -> ParserResult:
+        failures = [(idx, outcome) for idx, outcome in enumerate(outcomes) if isinstance(outcome, Exception)]
+        if len(failures) == len(chunks):
+            raise RuntimeError(f"parser llm output validation failed after retries: {failures[-1][1]}")
 
         valid_fields = set(field_dictionary.field_names())
         mappings: list[ParserMapping] = []
-        unmapped = set(parsed.unmapped_points)
-
-        for item in parsed.mappings:
-            if item.standard_name not in valid_fields:
-                unmapped.add(item.legacy_name)
+        unmapped: set[str] = set()
+        warnings: list[str] = []
+
+        for (chunk_points, _), outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                fallback = self._parse_with_rules(points=chunk_points, field_dictionary=field_dictionary, index=index)
+                mappings.extend(fallback.mappings)
+                unmapped.update(fallback.unmapped_points)
                 continue
-            mappings.append(
-                ParserMapping(
-                    legacy_name=item.legacy_name,
-                    standard_name=item.standard_name,
-                    confidence=item.confidence,
-                    reasoning=item.reasoning,
+
+            unmapped.update(outcome.unmapped_points)
+            for item in outcome.mappings:
+                if item.standard_name not in valid_fields:
+                    unmapped.add(item.legacy_name)
+                    continue
+                mappings.append(
+                    ParserMapping(
+                        legacy_name=item.legacy_name,
+                        standard_name=item.standard_name,
+                        confidence=item.confidence,
+                        reasoning=item.reasoning,
+                    )
                 )
-            )
+
+        for idx, exc in failures:
+            warnings.append(f"parser chunk {idx + 1}/{len(chunks)} fell back to rule mapping: {exc}")
 
         mapped_points = {item.legacy_name for item in mappings}
         for point in points:
@@ -114,19 +220,133 @@ class ParserAgent:
             unmapped_points=sorted(unmapped),
             confidence=round(confidence, 4),
             strategy="llm_semantic_mapping",
-            warnings=[],
+            warnings=warnings,
         )
 
-    def _parse_with_rules(self, *, points: list[str], field_dictionary: FieldDictionary) -> ParserResult:
+    def _run_chunk(self, chunk: tuple[list[str], dict[str, Any]]) -> ParserAgentOutput | Exception:
+        last_error: Exception | None = None
+        for _ in range(2):
+            try:
+                output, _meta = complete_validated(self.llm_client, ParserAgentOutput, **self._chunk_request(chunk))
+                return output
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+        return last_error or RuntimeError("parser llm returned no output")
+
+    async def _arun_chunk(self, chunk: tuple[list[str], dict[str, Any]]) -> ParserAgentOutput | Exception:
+        last_error: Exception | None = None
+        for _ in range(2):
+            try:
+                output, _meta = await acomplete_validated(
+                    self.llm_client, ParserAgentOutput, **self._chunk_request(chunk)
+                )
+                return output
+            except Exception as exc:  # noqa: BLE001
+                last_error = exc
+        return last_error or RuntimeError("parser llm returned no output")
+
+    def _chunk_request(self, chunk: tuple[list[str], dict[str, Any]]) -> dict[str, Any]:
+        chunk_points, dictionary_payload = chunk
+        return {
+            "role": "parser",
+            "system_prompt": self.prompt,
+            "user_payload": {
+                "legacy_points": chunk_points,
+                "field_dictionary": dictionary_payload,
+            },
+            "temperature": 0.0,
+        }
+
+    def _plan_chunks(
+        self,
+        *,
+        points: list[str],
+        field_dictionary: FieldDictionary,
+        index: FieldTokenIndex,
+    ) -> list[tuple[list[str], dict[str, Any]]]:
+        """Split points into token-budgeted chunks, each with the dictionary it needs."""
+
+        full_payload = field_dictionary.model_dump(mode="json")
+        budget = self.chunk_token_budget - self._estimate_tokens(self.prompt)
+        dictionary_cost = self._estimate_tokens(full_payload)
+        point_costs = [self._estimate_tokens(point) + 1 for point in points]
+
+        if dictionary_cost <= budget // 2:
+            chunks: list[tuple[list[str], dict[str, Any]]] = []
+            current: list[str] = []
+            used = dictionary_cost
+            for point, cost in zip(points, point_costs):
+                if current and used + cost > budget:
+                    chunks.append((current, full_payload))
+                    current, used = [], dictionary_cost
+                current.append(point)
+                used += cost
+            chunks.append((current, full_payload))
+            return chunks
+
+        # The dictionary alone would crowd out the points: give each chunk only the
+        # fields the rule matcher considers plausible for its points.
+        alias_map = {key.lower(): value for key, value in field_dictionary.alias_map.items()}
+        field_costs = {
+            item["field_name"]: self._estimate_tokens(item) + 1 for item in full_payload["fields"]
+        }
+        chunks = []
+        current, current_fields, used = [], set(), 0
+        for point, cost in zip(points, point_costs):
+            candidates = {name for name, _ in index.top_matches(point, self._FIELDS_PER_POINT)}
+            if index.has_field(point):
+                candidates.add(point)
+            alias_target = alias_map.get(point.lower())
+            if alias_target is not None and index.has_field(alias_target):
+                candidates.add(alias_target)
+            added = cost + sum(field_costs[name] for name in candidates - current_fields)
+            if current and used + added > budget:
+                chunks.append(self._slice_chunk(current, current_fields, field_dictionary))
+                current, current_fields, used = [], set(), 0
+                added = cost + sum(field_costs[name] for name in candidates)
+            current.append(point)
+            current_fields |= candidates
+            used += added
+        chunks.append(self._slice_chunk(current, current_fields, field_dictionary))
+        return chunks
+
+    def _slice_chunk(
+        self,
+        chunk_points: list[str],
+        field_names: set[str],
+        field_dictionary: FieldDictionary,
+    ) -> tuple[list[str], dict[str, Any]]:
+        lowered = {point.lower() for point in chunk_points}
+        sliced = FieldDictionary(
+            fields=[item for item in field_dictionary.fields if item.field_name in field_names],
+            alias_map={
+                key: value
+                for key, value in field_dictionary.alias_map.items()
+                if key.lower() in lowered and value in field_names
+            },
+        )
+        return chunk_points, sliced.model_dump(mode="json")
+
+    def _estimate_tokens(self, payload: Any) -> int:
+        text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        return len(text) // self._CHARS_PER_TOKEN + 1
+
+    def _parse_with_rules(
+        self,
+        *,
+        points: list[str],
+        field_dictionary: FieldDictionary,
+        index: FieldTokenIndex | None = None,
+    ) -> ParserResult:
         mappings: list[ParserMapping] = []
         unmapped: list[str] = []
 
         alias_map = {key.lower(): value for key, value in field_dictionary.alias_map.items()}
-        fields = field_dictionary.fields
+        index = index or self._index(field_dictionary)
 
         for legacy_name in points:
             lower_name = legacy_name.lower()
-            if lower_name in alias_map and field_dictionary.has_field(alias_map[lower_name]):
+            if lower_name in alias_map and index.has_field(alias_map[lower_name]):
                 mappings.append(
                     ParserMapping(
                         legacy_name=legacy_name,
@@ -137,7 +357,7 @@ class ParserAgent:
                 )
                 continue
 
-            if field_dictionary.has_field(legacy_name):
+            if index.has_field(legacy_name):
                 mappings.append(
                     ParserMapping(
                         legacy_name=legacy_name,
@@ -148,19 +368,7 @@ class ParserAgent:
                 )
                 continue
 
-            best_field = None
-            best_score = 0.0
-            legacy_tokens = self._tokens(legacy_name)
-
-            for field in fields:
-                target_tokens = self._tokens(field.field_name) | self._tokens(field.semantic_label)
-                if not target_tokens:
-                    continue
-                score = len(legacy_tokens & target_tokens) / len(legacy_tokens | target_tokens)
-                if score > best_score:
-                    best_score = score
-                    best_field = field.field_name
-
+            best_field, best_score = index.best_match(legacy_name)
             if best_field is None or best_score < 0.2:
                 unmapped.append(legacy_name)
                 continue
@@ -188,37 +396,9 @@ class ParserAgent:
 
         if raw_yaml_text:
             try:
-                payload = yaml.safe_load(raw_yaml_text)
-                points.update(self._extract_from_yaml(payload))
+                payload = load_yaml_text(raw_yaml_text)
+                points.update(collect_point_keys(payload, self._RESERVED_KEYS))
             except Exception:  # noqa: BLE001
                 pass
 
         return sorted(points)
-
-    def _extract_from_yaml(self, payload: Any) -> set[str]:
-        found: set[str] = set()
-        if isinstance(payload, dict):
-            for key, value in payload.items():
-                if key in self._RESERVED_KEYS:
-                    continue
-                if self._looks_like_point(key, value):
-                    found.add(str(key))
-                found.update(self._extract_from_yaml(value))
-        elif isinstance(payload, list):
-            for item in payload:
-                found.update(self._extract_from_yaml(item))
-        return found
-
-    def _looks_like_point(self, key: str, value: Any) -> bool:
-        if isinstance(value, (int, float)):
-            return False
-        if isinstance(value, str) and len(value) <= 3:
-            return False
-        if re.search(r"[A-Za-z].*\d|\d.*[A-Za-z]", key):
-            return True
-        if "_" in key and len(key) >= 4:
-            return True
-        return False
-
-    def _tokens(self, value: str) -> set[str]:
-        return {item for item in re.split(r"[^a-zA-Z0-9]+", value.lower()) if item}
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import itertools
+import random
+import time
+from collections import Counter
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
-from easyshift_maas.core.contracts import ScenarioTemplate, SceneContext
+from easyshift_maas.core.batch import BatchPipeline, SampleMatrix
+from easyshift_maas.core.contracts import GuardrailAction, ScenarioTemplate, SceneContext
 
 
 class RegressionCase(BaseModel):
@@ -22,6 +29,94 @@ class RegressionPlan(BaseModel):
     coverage: dict[str, float] = Field(default_factory=dict)
 
 
+class ConstraintCoverage(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    index: int
+    name: str
+    field_name: str
+    cases_targeted: int = 0
+    cases_binding: int = 0
+
+
+class GuardrailRuleCoverage(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    index: int
+    field_name: str
+    action: GuardrailAction
+    cases_targeted: int = 0
+    cases_fired: int = 0
+
+
+class RegressionSuiteReport(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    template_id: str
+    total_cases: int
+    cases_by_kind: dict[str, int] = Field(default_factory=dict)
+    executed_cases: int = 0
+    violation_cases: int = 0
+    solver_status: str
+    constraints: list[ConstraintCoverage] = Field(default_factory=list)
+    rules: list[GuardrailRuleCoverage] = Field(default_factory=list)
+    coverage: dict[str, float] = Field(default_factory=dict)
+    elapsed_ms: int = 0
+
+
+class RegressionSuite:
+    """Sample matrix plus how each case was generated and which checks it targets."""
+
+    def __init__(self, template_id: str, matrix: SampleMatrix) -> None:
+        self.template_id = template_id
+        self.matrix = matrix
+        self.kinds = bytearray()
+        self.constraint_targets: Counter[int] = Counter()
+        self.rule_targets: Counter[int] = Counter()
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+
+_KINDS = ("nominal", "boundary", "pairwise", "combinatorial", "random")
+
+# A level is one interesting value for a field plus the checks it exercises:
+# ("constraint" | "rule", index).
+_Level = tuple[float, tuple[tuple[str, int], ...]]
+
+
+def nominal_values(template: ScenarioTemplate) -> dict[str, float]:
+    """Interior operating point: 1.0, moved inside each constraint and guardrail."""
+
+    nominal = {item.field_name: 1.0 for item in template.field_dictionary.fields}
+
+    for constraint in template.constraints:
+        field = constraint.field_name
+        if constraint.operator.value == "ge" and constraint.lower_bound is not None:
+            nominal[field] = constraint.lower_bound + max(1.0, abs(constraint.lower_bound) * 0.05)
+        elif constraint.operator.value == "le" and constraint.upper_bound is not None:
+            nominal[field] = constraint.upper_bound - max(1.0, abs(constraint.upper_bound) * 0.05)
+        elif (
+            constraint.operator.value == "between"
+            and constraint.lower_bound is not None
+            and constraint.upper_bound is not None
+        ):
+            nominal[field] = (constraint.lower_bound + constraint.upper_bound) / 2.0
+        elif constraint.operator.value == "eq" and constraint.equals_value is not None:
+            nominal[field] = constraint.equals_value
+
+    for rule in template.guardrail.rules:
+        field = rule.field_name
+        if rule.min_value is not None and rule.max_value is not None:
+            nominal[field] = (rule.min_value + rule.max_value) / 2.0
+        elif rule.min_value is not None:
+            nominal[field] = rule.min_value + max(0.1, abs(rule.min_value) * 0.05)
+        elif rule.max_value is not None:
+            nominal[field] = rule.max_value - max(0.1, abs(rule.max_value) * 0.05)
+
+    return nominal
+
+
 class RegressionPlanner:
     """Builds synthetic regression suites to verify migration correctness."""
 
@@ -81,3 +176,163 @@ class RegressionPlanner:
         }
 
         return RegressionPlan(template_id=template.template_id, cases=cases, coverage=coverage)
+
+    def build_matrix(
+        self,
+        template: ScenarioTemplate,
+        *,
+        pairwise: bool = True,
+        combinatorial: bool = True,
+        random_cases: int = 0,
+        seed: Optional[int] = None,
+        max_cases: int = 100_000,
+    ) -> RegressionSuite:
+        """Build a large boundary suite as a compact :class:`SampleMatrix`.
+
+        Each field gets a set of levels: constraint edges and just outside them,
+        guardrail limits and just past them, and ``max_delta`` steps (baselines that
+        the optimizer moves by 0.5x / 1.5x ``max_delta``). Cases are added in order
+        nominal, single-field boundary, pairwise level combinations, full
+        combinations, then ``random_cases`` rows drawn uniformly (``seed``) between
+        each field's lowest and highest level, until ``max_cases`` is reached.
+        """
+
+        if max_cases <= 0:
+            raise ValueError("max_cases must be positive")
+        nominal = nominal_values(template)
+        fields = list(nominal)
+        suite = RegressionSuite(template.template_id, SampleMatrix(fields, nominal.values()))
+        levels = self._levels(template, fields, nominal)
+        axes = [(column, levels[column]) for column in range(len(fields)) if levels[column]]
+
+        def _add(kind: int, picks: list[tuple[int, _Level]]) -> bool:
+            if len(suite) >= max_cases:
+                return False
+            suite.matrix.append((column, level[0]) for column, level in picks)
+            suite.kinds.append(kind)
+            for _, (_, targets) in picks:
+                for target, idx in targets:
+                    (suite.constraint_targets if target == "constraint" else suite.rule_targets)[idx] += 1
+            return True
+
+        _add(0, [])
+        for column, options in axes:
+            for level in options:
+                _add(1, [(column, level)])
+        if pairwise:
+            for (left, left_levels), (right, right_levels) in itertools.combinations(axes, 2):
+                if len(suite) >= max_cases:
+                    break
+                for left_level, right_level in itertools.product(left_levels, right_levels):
+                    if not _add(2, [(left, left_level), (right, right_level)]):
+                        break
+        # Pairwise already covers every combination when at most two fields vary.
+        if combinatorial and len(axes) > 2:
+            for combo in itertools.product(*(options for _, options in axes)):
+                if not _add(3, [(column, level) for (column, _), level in zip(axes, combo)]):
+                    break
+        if random_cases > 0:
+            rng = random.Random(seed)
+            spans = []
+            for column, value in enumerate(nominal.values()):
+                values = [level[0] for level in levels[column]] or [value - 1.0, value + 1.0]
+                spans.append((column, min(values), max(values)))
+            for _ in range(random_cases):
+                if len(suite) >= max_cases:
+                    break
+                suite.matrix.append((column, rng.uniform(low, high)) for column, low, high in spans)
+                suite.kinds.append(4)
+        return suite
+
+    def evaluate_matrix(self, template: ScenarioTemplate, suite: RegressionSuite) -> RegressionSuiteReport:
+        """Run the suite through :class:`BatchPipeline` and report coverage."""
+
+        started = time.perf_counter()
+        result = BatchPipeline(template, suite.matrix.fields).run(suite.matrix)
+        kinds = Counter(suite.kinds)
+        constraints = [
+            ConstraintCoverage(
+                index=idx,
+                name=item.name,
+                field_name=item.field_name,
+                cases_targeted=suite.constraint_targets[idx],
+                cases_binding=result.constraint_binding[idx],
+            )
+            for idx, item in enumerate(template.constraints)
+        ]
+        rules = [
+            GuardrailRuleCoverage(
+                index=idx,
+                field_name=item.field_name,
+                action=item.action,
+                cases_targeted=suite.rule_targets[idx],
+                cases_fired=result.rule_fired[idx],
+            )
+            for idx, item in enumerate(template.guardrail.rules)
+        ]
+        return RegressionSuiteReport(
+            template_id=template.template_id,
+            total_cases=len(suite),
+            cases_by_kind={name: kinds[code] for code, name in enumerate(_KINDS) if kinds[code]},
+            executed_cases=sum(result.executed),
+            violation_cases=sum(result.violated),
+            solver_status=result.solver_status,
+            constraints=constraints,
+            rules=rules,
+            coverage={
+                "constraint_binding_ratio": _ratio(sum(1 for item in constraints if item.cases_binding), len(constraints)),
+                "rule_fired_ratio": _ratio(sum(1 for item in rules if item.cases_fired), len(rules)),
+            },
+            elapsed_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    def _levels(self, template: ScenarioTemplate, fields: list[str], nominal: dict[str, float]) -> list[list[_Level]]:
+        raw: dict[str, dict[float, list[tuple[str, int]]]] = {name: {} for name in fields}
+
+        def _mark(field: str, value: float, target: tuple[str, int]) -> None:
+            if field in raw:
+                raw[field].setdefault(value, []).append(target)
+
+        bounds: dict[str, list[float]] = {}
+        for idx, constraint in enumerate(template.constraints):
+            target = ("constraint", idx)
+            field = constraint.field_name
+            for bound, outward in ((constraint.lower_bound, -1.0), (constraint.upper_bound, 1.0)):
+                if bound is None:
+                    continue
+                _mark(field, bound, target)
+                _mark(field, bound + outward * _margin(bound), target)
+                bounds.setdefault(field, []).append(bound)
+            if constraint.equals_value is not None:
+                _mark(field, constraint.equals_value, target)
+                _mark(field, constraint.equals_value + _margin(constraint.equals_value), target)
+                bounds.setdefault(field, []).append(constraint.equals_value)
+
+        for idx, rule in enumerate(template.guardrail.rules):
+            target = ("rule", idx)
+            field = rule.field_name
+            if rule.min_value is not None:
+                _mark(field, rule.min_value, target)
+                _mark(field, rule.min_value - _margin(rule.min_value), target)
+            if rule.max_value is not None:
+                _mark(field, rule.max_value, target)
+                _mark(field, rule.max_value + _margin(rule.max_value), target)
+            if rule.max_delta is not None:
+                # The guardrail compares the setpoint with the context value, so a
+                # delta only appears where the optimizer moves the value: past a
+                # constraint bound, or via the objective shift on nominal.
+                anchors = bounds.get(field) or [nominal.get(field, 1.0)]
+                for anchor in anchors:
+                    for step in (0.5, 1.5):
+                        _mark(field, anchor - step * rule.max_delta, target)
+                        _mark(field, anchor + step * rule.max_delta, target)
+
+        return [sorted((value, tuple(targets)) for value, targets in raw[name].items()) for name in fields]
+
+
+def _margin(value: float) -> float:
+    return max(1e-3, abs(value) * 0.05)
+
+
+def _ratio(count: int, total: int) -> float:
+    return round(count / total, 4) if total else 1.0
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Protocol
+import threading
+from collections import OrderedDict, defaultdict
+from itertools import islice
+from typing import Iterator, Protocol
 
 from easyshift_maas.core.contracts import (
     ConstraintOperator,
@@ -9,7 +11,9 @@ from easyshift_maas.core.contracts import (
     MigrationDraft,
     MigrationValidationIssue,
     MigrationValidationReport,
+    ScenarioTemplate,
 )
+from easyshift_maas.core.template_diff import TemplateFingerprint
 
 
 class TemplateValidatorProtocol(Protocol):
@@ -17,57 +21,41 @@ class TemplateValidatorProtocol(Protocol):
 
 
 class TemplateValidator:
-    """Validator for migration drafts with correctness and conflict metrics."""
-
-    def validate(self, draft: MigrationDraft) -> MigrationValidationReport:
-        issues: list[MigrationValidationIssue] = []
-        template = draft.template
-        fields = set(template.field_dictionary.field_names())
-
-        if not template.objective.terms:
-            issues.append(
-                MigrationValidationIssue(
-                    code="OBJ_EMPTY",
-                    path="objective.terms",
-                    message="Objective terms cannot be empty.",
-                    severity=IssueSeverity.ERROR,
-                )
-            )
-
-        for idx, term in enumerate(template.objective.terms):
-            if term.field_name not in fields:
-                issues.append(
-                    MigrationValidationIssue(
-                        code="OBJ_FIELD_UNKNOWN",
-                        path=f"objective.terms[{idx}].field_name",
-                        message=f"Unknown field in objective: {term.field_name}",
-                        severity=IssueSeverity.ERROR,
-                    )
-                )
+    """Validator for migration drafts with correctness and conflict metrics.
+
+    When a :class:`TemplateFingerprint` is passed, per-field conflict results are
+    memoized by the digests of that field's constraints, so re-validating a draft
+    that changed a few constraints only re-checks the fields they touch. Callers that
+    only need pass/fail use :meth:`is_valid` or ``validate(..., fail_fast=True)``,
+    which stop at the first error.
+    """
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self.cache_size = cache_size
+        self._conflicts: OrderedDict[tuple, list[MigrationValidationIssue]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def validate(
+        self,
+        draft: MigrationDraft,
+        *,
+        fingerprint: TemplateFingerprint | None = None,
+        fail_fast: bool = False,
+    ) -> MigrationValidationReport:
+        """Validate ``draft``; with ``fail_fast`` stop at the first error.
 
-        for idx, feature in enumerate(template.prediction.feature_fields):
-            if feature not in fields:
-                issues.append(
-                    MigrationValidationIssue(
-                        code="PRED_FEATURE_UNKNOWN",
-                        path=f"prediction.feature_fields[{idx}]",
-                        message=f"Unknown prediction feature: {feature}",
-                        severity=IssueSeverity.ERROR,
-                    )
-                )
+        A fail-fast report lists only that first issue and its scores cover only the
+        checks run so far. ``valid`` is the same in both modes.
+        """
 
-        for idx, constraint in enumerate(template.constraints):
-            if constraint.field_name not in fields:
-                issues.append(
-                    MigrationValidationIssue(
-                        code="CONSTRAINT_FIELD_UNKNOWN",
-                        path=f"constraints[{idx}].field_name",
-                        message=f"Unknown field in constraint: {constraint.field_name}",
-                        severity=IssueSeverity.ERROR,
-                    )
-                )
+        template = draft.template
+        digests = fingerprint.constraints if fingerprint is not None and self.cache_size > 0 else None
+        found = self._iter_issues(template, digests)
+        issues = list(islice(found, 1)) if fail_fast else list(found)
 
-        conflict_count = self._check_constraint_conflicts(template.constraints, issues)
+        conflict_count = sum(1 for issue in issues if issue.code.startswith("CONSTRAINT_CONFLICT"))
         guardrail_coverage = self._guardrail_coverage(template)
         correctness_score = self._correctness_score(issues)
         conflict_rate = (
@@ -92,70 +80,155 @@ class TemplateValidator:
             issues=issues,
         )
 
-    def _check_constraint_conflicts(
+    def is_valid(self, draft: MigrationDraft, *, fingerprint: TemplateFingerprint | None = None) -> bool:
+        """Same answer as ``validate(draft).valid`` without building the report."""
+
+        template = draft.template
+        if self._guardrail_coverage(template) < 0.95:
+            return False
+        digests = fingerprint.constraints if fingerprint is not None and self.cache_size > 0 else None
+        # Every issue is an ERROR, so any issue at all makes the draft invalid.
+        return next(self._iter_issues(template, digests), None) is None
+
+    def _iter_issues(
+        self,
+        template: ScenarioTemplate,
+        digests: tuple[str, ...] | None,
+    ) -> Iterator[MigrationValidationIssue]:
+        # Lazy, so fail-fast callers only pay for the checks (and messages) they reach.
+        fields = set(template.field_dictionary.field_names())
+
+        if not template.objective.terms:
+            yield MigrationValidationIssue(
+                code="OBJ_EMPTY",
+                path="objective.terms",
+                message="Objective terms cannot be empty.",
+                severity=IssueSeverity.ERROR,
+            )
+
+        for idx, term in enumerate(template.objective.terms):
+            if term.field_name not in fields:
+                yield MigrationValidationIssue(
+                    code="OBJ_FIELD_UNKNOWN",
+                    path=f"objective.terms[{idx}].field_name",
+                    message=f"Unknown field in objective: {term.field_name}",
+                    severity=IssueSeverity.ERROR,
+                )
+
+        for idx, feature in enumerate(template.prediction.feature_fields):
+            if feature not in fields:
+                yield MigrationValidationIssue(
+                    code="PRED_FEATURE_UNKNOWN",
+                    path=f"prediction.feature_fields[{idx}]",
+                    message=f"Unknown prediction feature: {feature}",
+                    severity=IssueSeverity.ERROR,
+                )
+
+        for idx, constraint in enumerate(template.constraints):
+            if constraint.field_name not in fields:
+                yield MigrationValidationIssue(
+                    code="CONSTRAINT_FIELD_UNKNOWN",
+                    path=f"constraints[{idx}].field_name",
+                    message=f"Unknown field in constraint: {constraint.field_name}",
+                    severity=IssueSeverity.ERROR,
+                )
+
+        yield from self._iter_constraint_conflicts(template.constraints, digests)
+
+    def cache_stats(self) -> dict[str, int]:
+        with self._cache_lock:
+            return {"entries": len(self._conflicts), "hits": self._hits, "misses": self._misses}
+
+    def _iter_constraint_conflicts(
         self,
         constraints,
-        issues: list[MigrationValidationIssue],
-    ) -> int:
-        grouped: dict[str, list] = defaultdict(list)
-        for constraint in constraints:
-            grouped[constraint.field_name].append(constraint)
-
-        conflicts = 0
-        for field_name, items in grouped.items():
-            lowers = [item.lower_bound for item in items if item.lower_bound is not None]
-            uppers = [item.upper_bound for item in items if item.upper_bound is not None]
-            equals = [item.equals_value for item in items if item.equals_value is not None]
-
-            lower = max(lowers) if lowers else None
-            upper = min(uppers) if uppers else None
-
-            if lower is not None and upper is not None and lower > upper:
-                conflicts += 1
+        digests: tuple[str, ...] | None = None,
+    ) -> Iterator[MigrationValidationIssue]:
+        grouped: dict[str, list[int]] = defaultdict(list)
+        for idx, constraint in enumerate(constraints):
+            grouped[constraint.field_name].append(idx)
+
+        for field_name, indices in grouped.items():
+            items = [constraints[idx] for idx in indices]
+            if digests is None:
+                yield from self._field_conflicts(field_name, items)
+            else:
+                yield from self._cached_field_conflicts(field_name, items, tuple(digests[idx] for idx in indices))
+
+    def _cached_field_conflicts(
+        self,
+        field_name: str,
+        items: list,
+        digests: tuple[str, ...],
+    ) -> list[MigrationValidationIssue]:
+        key = (field_name, digests)
+        with self._cache_lock:
+            cached = self._conflicts.get(key)
+            if cached is not None:
+                self._conflicts.move_to_end(key)
+                self._hits += 1
+                return [issue.model_copy() for issue in cached]
+            self._misses += 1
+
+        found = self._field_conflicts(field_name, items)
+        with self._cache_lock:
+            self._conflicts[key] = [issue.model_copy() for issue in found]
+            while len(self._conflicts) > self.cache_size:
+                self._conflicts.popitem(last=False)
+        return found
+
+    def _field_conflicts(self, field_name: str, items: list) -> list[MigrationValidationIssue]:
+        # Every conflict yields exactly one issue, so the conflict count is len(result).
+        issues: list[MigrationValidationIssue] = []
+        lowers = [item.lower_bound for item in items if item.lower_bound is not None]
+        uppers = [item.upper_bound for item in items if item.upper_bound is not None]
+        equals = [item.equals_value for item in items if item.equals_value is not None]
+
+        lower = max(lowers) if lowers else None
+        upper = min(uppers) if uppers else None
+
+        if lower is not None and upper is not None and lower > upper:
+            issues.append(
+                MigrationValidationIssue(
+                    code="CONSTRAINT_CONFLICT_RANGE",
+                    path=f"constraints[{field_name}]",
+                    message=f"Conflicting range for {field_name}: lower {lower} > upper {upper}",
+                    severity=IssueSeverity.ERROR,
+                )
+            )
+
+        if equals:
+            eq = equals[0]
+            if lower is not None and eq < lower:
                 issues.append(
                     MigrationValidationIssue(
-                        code="CONSTRAINT_CONFLICT_RANGE",
+                        code="CONSTRAINT_CONFLICT_EQ_LOW",
                         path=f"constraints[{field_name}]",
-                        message=f"Conflicting range for {field_name}: lower {lower} > upper {upper}",
+                        message=f"Equality value {eq} < lower bound {lower} for {field_name}",
                         severity=IssueSeverity.ERROR,
                     )
                 )
-
-            if equals:
-                eq = equals[0]
-                if lower is not None and eq < lower:
-                    conflicts += 1
-                    issues.append(
-                        MigrationValidationIssue(
-                            code="CONSTRAINT_CONFLICT_EQ_LOW",
-                            path=f"constraints[{field_name}]",
-                            message=f"Equality value {eq} < lower bound {lower} for {field_name}",
-                            severity=IssueSeverity.ERROR,
-                        )
-                    )
-                if upper is not None and eq > upper:
-                    conflicts += 1
-                    issues.append(
-                        MigrationValidationIssue(
-                            code="CONSTRAINT_CONFLICT_EQ_HIGH",
-                            path=f"constraints[{field_name}]",
-                            message=f"Equality value {eq} > upper bound {upper} for {field_name}",
-                            severity=IssueSeverity.ERROR,
-                        )
-                    )
-
-            if all(item.operator == ConstraintOperator.EQ for item in items) and len(set(equals)) > 1:
-                conflicts += 1
+            if upper is not None and eq > upper:
                 issues.append(
                     MigrationValidationIssue(
-                        code="CONSTRAINT_CONFLICT_MULTIPLE_EQ",
+                        code="CONSTRAINT_CONFLICT_EQ_HIGH",
                         path=f"constraints[{field_name}]",
-                        message=f"Multiple equality constraints conflict on {field_name}",
+                        message=f"Equality value {eq} > upper bound {upper} for {field_name}",
                         severity=IssueSeverity.ERROR,
                     )
                 )
 
-        return conflicts
+        if all(item.operator == ConstraintOperator.EQ for item in items) and len(set(equals)) > 1:
+            issues.append(
+                MigrationValidationIssue(
+                    code="CONSTRAINT_CONFLICT_MULTIPLE_EQ",
+                    path=f"constraints[{field_name}]",
+                    message=f"Multiple equality constraints conflict on {field_name}",
+                    severity=IssueSeverity.ERROR,
+                )
+            )
+
+        return issues
 
     def _guardrail_coverage(self, template) -> float:
         objective_fields = {item.field_name for item in template.objective.terms}
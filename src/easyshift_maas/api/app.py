@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from easyshift_maas.agentic.batch import AgenticBatchSummarizer, BatchMigrationRunner
+from easyshift_maas.agentic.checkpoints import build_checkpoint_store_from_env
 from easyshift_maas.agentic.critic_agent import CriticAgent
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
@@ -14,35 +21,52 @@ from easyshift_maas.agentic.parser_agent import ParserAgent
 from easyshift_maas.agentic.template_validator import TemplateValidator
 from easyshift_maas.core.contracts import (
     AgenticRunReport,
+    AgenticRunState,
+    CatalogDiff,
     CatalogLoadMode,
     ContextBuildResult,
     CriticFeedback,
     DataSourceProfile,
     EvaluationReport,
     FieldDictionary,
+    JobRecord,
+    JobStatus,
     MigrationDraft,
+    MigrationManifest,
     MigrationValidationReport,
     ParserResult,
     PipelineResult,
+    RobustnessReport,
+    RobustnessSpec,
     ScenarioTemplate,
     SceneContext,
     SceneMetadata,
     SimulationSample,
     SnapshotMissingPolicy,
     SnapshotRequest,
+    SnapshotResult,
+    SnapshotWindow,
+    SnapshotWindowRequest,
     TemplateQualityGate,
     TemplateQualityReport,
 )
 from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+from easyshift_maas.core.template_diff import fingerprint_template
+from easyshift_maas.ingestion.catalog_diff import apply_catalog_diff, diff_catalogs
 from easyshift_maas.ingestion.catalog_loader import YamlCatalogLoader
+from easyshift_maas.ingestion.providers.file_provider import FileSnapshotProvider
 from easyshift_maas.ingestion.providers.mysql_provider import MySQLSnapshotProvider
 from easyshift_maas.ingestion.providers.redis_provider import RedisSnapshotProvider
 from easyshift_maas.ingestion.repository import InMemoryCatalogRepository, InMemoryDataSourceRegistry
 from easyshift_maas.ingestion.snapshot_provider import CompositeSnapshotProvider
+from easyshift_maas.jobs.queue import JobQueue
+from easyshift_maas.jobs.store import build_job_store_from_env
 from easyshift_maas.llm.client import RoleBasedLLMClient
 from easyshift_maas.observability import instrument_fastapi
+from easyshift_maas.quality.bulk import BulkQualityRunner, BulkQualitySummarizer
 from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
-from easyshift_maas.security.secrets import ChainedSecretResolver
+from easyshift_maas.replay.engine import ReplayEngine, iter_snapshot_recording
+from easyshift_maas.security.secrets import CachingSecretResolver, ChainedSecretResolver
 from easyshift_maas.templates.repository import InMemoryTemplateRepository
 
 
@@ -88,11 +112,17 @@ class AgenticRunRequest(BaseModel):
     legacy_points: list[str] = Field(default_factory=list)
     raw_yaml_text: Optional[str] = None
     max_iterations: int = Field(default=3, ge=1, le=8)
+    candidates_per_iteration: int = Field(default=1, ge=1, le=8)
     gate: TemplateQualityGate = Field(default_factory=TemplateQualityGate)
     regression_samples: list[SimulationSample] = Field(default_factory=list)
     publish_on_pass: bool = False
 
 
+class AgenticJobRequest(AgenticRunRequest):
+    tenant_id: str = Field(default="default", min_length=1, max_length=128)
+    priority: int = Field(default=0, ge=-100, le=100)
+
+
 class TemplatePublishRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -154,6 +184,7 @@ class CatalogImportRequest(BaseModel):
     yaml_text: Optional[str] = None
     yaml_path: Optional[str] = None
     source_profiles: list[DataSourceProfile] = Field(default_factory=list)
+    incremental: bool = False
 
     @model_validator(mode="after")
     def _check_yaml_input(self) -> "CatalogImportRequest":
@@ -169,8 +200,10 @@ class CatalogImportResponse(BaseModel):
 
     catalog_id: str
     binding_count: int
+    version: str
     warnings: list[str] = Field(default_factory=list)
     pending_confirmations: list[str] = Field(default_factory=list)
+    diff: Optional[CatalogDiff] = None
 
 
 class ContextBuildRequest(BaseModel):
@@ -184,6 +217,56 @@ class ContextBuildRequest(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class ContextWindowRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    catalog_id: str
+    start: datetime
+    end: datetime
+    step_sec: Optional[int] = Field(default=None, gt=0)
+    fields: Optional[list[str]] = None
+    scene_metadata: Optional[SceneMetadata] = None
+
+
+class ReplayJobRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    template_id: Optional[str] = None
+    version: Optional[str] = None
+    inline_template: Optional[ScenarioTemplate] = None
+    snapshots: list[SnapshotResult] = Field(default_factory=list)
+    recording_path: Optional[str] = None
+    speed: Optional[float] = Field(default=None, gt=0)
+    report_every: int = Field(default=100, ge=1, le=100000)
+
+    @model_validator(mode="after")
+    def _check_sources(self) -> "ReplayJobRequest":
+        has_id = self.template_id is not None
+        has_inline = self.inline_template is not None
+        if has_id == has_inline:
+            raise ValueError("exactly one of template_id or inline_template must be provided")
+        has_snapshots = bool(self.snapshots)
+        has_path = self.recording_path is not None
+        if has_snapshots == has_path:
+            raise ValueError("exactly one of snapshots or recording_path must be provided")
+        return self
+
+
+class RobustnessCheckRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    draft: Optional[MigrationDraft] = None
+    template: Optional[ScenarioTemplate] = None
+    spec: RobustnessSpec = Field(default_factory=RobustnessSpec)
+    base_samples: list[SimulationSample] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _check_source(self) -> "RobustnessCheckRequest":
+        if (self.draft is not None) == (self.template is not None):
+            raise ValueError("exactly one of draft or template must be provided")
+        return self
+
+
 class QualityCheckRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -201,7 +284,30 @@ class QualityCheckRequest(BaseModel):
         return self
 
 
-app = FastAPI(title="ReflexFlow-MaaS", version="0.3.0")
+class BulkQualityCheckRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    # Empty template_ids and inline_templates means every template in the repository.
+    template_ids: list[str] = Field(default_factory=list)
+    all_versions: bool = True
+    inline_templates: list[ScenarioTemplate] = Field(default_factory=list)
+    gate: TemplateQualityGate = Field(default_factory=TemplateQualityGate)
+    regression_samples: list[SimulationSample] = Field(default_factory=list)
+    max_workers: Optional[int] = Field(default=None, ge=0, le=256)
+    chunk_size: int = Field(default=8, ge=1, le=1000)
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    _fail_interrupted_jobs()
+    agentic_jobs.start()
+    yield
+    agentic_jobs.shutdown()
+    redis_snapshot_provider.close()
+    await llm_router.aclose()
+
+
+app = FastAPI(title="ReflexFlow-MaaS", version="0.3.0", lifespan=_lifespan)
 instrument_fastapi(app)
 
 llm_router = RoleBasedLLMClient()
@@ -211,7 +317,11 @@ validator = TemplateValidator()
 pipeline = PredictionOptimizationPipeline()
 quality_evaluator = TemplateQualityEvaluator(pipeline=pipeline, validator=validator)
 
-parser_agent = ParserAgent(llm_client=shared_llm)
+parser_agent = ParserAgent(
+    llm_client=shared_llm,
+    chunk_token_budget=int(os.getenv("REFLEXFLOW_PARSER_CHUNK_TOKENS", "6000")),
+    max_concurrency=int(os.getenv("REFLEXFLOW_PARSER_MAX_CONCURRENCY", "4")),
+)
 generator_agent = GeneratorAgent(llm_client=shared_llm)
 critic_agent = CriticAgent(llm_client=shared_llm)
 workflow = LangGraphMigrationWorkflow(
@@ -220,15 +330,28 @@ workflow = LangGraphMigrationWorkflow(
     critic_agent=critic_agent,
     validator=validator,
     quality_evaluator=quality_evaluator,
+    checkpoint_store=build_checkpoint_store_from_env(),
 )
 
 template_repository = InMemoryTemplateRepository()
 catalog_repository = InMemoryCatalogRepository()
 datasource_registry = InMemoryDataSourceRegistry()
 loader = YamlCatalogLoader()
-secret_resolver = ChainedSecretResolver()
+secret_resolver = CachingSecretResolver(ChainedSecretResolver())
+redis_snapshot_provider = RedisSnapshotProvider()
 snapshot_provider = CompositeSnapshotProvider(
-    providers=[RedisSnapshotProvider(), MySQLSnapshotProvider()]
+    providers=[redis_snapshot_provider, MySQLSnapshotProvider(), FileSnapshotProvider()]
+)
+catalog_repository.add_listener(snapshot_provider.invalidate_catalog)
+replay_engine = ReplayEngine(pipeline=pipeline)
+job_store = build_job_store_from_env()
+# Agentic runs get their own bounded pool so they never compete with request threads.
+agentic_jobs = JobQueue(
+    job_store,
+    lambda record, payload, cancelled: _run_agentic_job(record.job_id, payload, cancelled),
+    kind="agentic",
+    max_workers=int(os.getenv("REFLEXFLOW_AGENTIC_WORKERS", "2")),
+    tenant_limit=int(os.getenv("REFLEXFLOW_AGENTIC_TENANT_LIMIT", "1")),
 )
 
 
@@ -241,13 +364,26 @@ def import_catalog(request: CatalogImportRequest) -> CatalogImportResponse:
     if merged_profiles:
         datasource_registry.upsert_many(merged_profiles)
 
-    catalog_repository.put(result.catalog)
+    catalog = result.catalog
+    diff = None
+    if request.incremental:
+        try:
+            current = catalog_repository.get(catalog.catalog_id)
+        except KeyError:
+            current = None
+        if current is not None:
+            diff = diff_catalogs(current, catalog)
+            catalog = apply_catalog_diff(current, catalog, diff)
+
+    catalog_repository.put(catalog, diff)
 
     return CatalogImportResponse(
-        catalog_id=result.catalog.catalog_id,
-        binding_count=len(result.catalog.bindings),
+        catalog_id=catalog.catalog_id,
+        binding_count=len(catalog.bindings),
+        version=catalog.version,
         warnings=result.warnings,
         pending_confirmations=result.pending_confirmations,
+        diff=diff,
     )
 
 
@@ -303,9 +439,43 @@ def build_context(request: ContextBuildRequest) -> ContextBuildResult:
     return ContextBuildResult(scene_context=context, snapshot=snapshot)
 
 
+@app.post(
+    "/v1/contexts/window",
+    response_model=SnapshotWindow,
+    responses={404: {"model": ErrorResponse}},
+)
+def build_context_window(request: ContextWindowRequest) -> SnapshotWindow:
+    try:
+        catalog = catalog_repository.get(request.catalog_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    step_sec = request.step_sec
+    if step_sec is None:
+        step_sec = request.scene_metadata.granularity_sec if request.scene_metadata is not None else 60
+
+    try:
+        window_request = SnapshotWindowRequest(
+            catalog_id=request.catalog_id,
+            start=request.start,
+            end=request.end,
+            step_sec=step_sec,
+            fields=request.fields,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return snapshot_provider.fetch_window(
+        request=window_request,
+        catalog=catalog,
+        profiles=datasource_registry.list_profiles(),
+        secret_resolver=secret_resolver,
+    )
+
+
 @app.post("/v1/agentic/parse-points", response_model=ParserResult)
-def parse_points(request: ParsePointsRequest) -> ParserResult:
-    return parser_agent.parse(
+async def parse_points(request: ParsePointsRequest) -> ParserResult:
+    return await parser_agent.aparse(
         field_dictionary=request.field_dictionary,
         legacy_points=request.legacy_points,
         raw_yaml_text=request.raw_yaml_text,
@@ -313,8 +483,8 @@ def parse_points(request: ParsePointsRequest) -> ParserResult:
 
 
 @app.post("/v1/agentic/generate-draft", response_model=MigrationDraft)
-def generate_draft(request: GenerateDraftRequest) -> MigrationDraft:
-    return generator_agent.generate(
+async def generate_draft(request: GenerateDraftRequest) -> MigrationDraft:
+    return await generator_agent.agenerate(
         scene_metadata=request.scene_metadata,
         field_dictionary=request.field_dictionary,
         nl_requirements=request.nl_requirements,
@@ -325,8 +495,8 @@ def generate_draft(request: GenerateDraftRequest) -> MigrationDraft:
 
 
 @app.post("/v1/agentic/review-draft", response_model=CriticFeedback)
-def review_draft(request: ReviewDraftRequest) -> CriticFeedback:
-    return critic_agent.review(
+async def review_draft(request: ReviewDraftRequest) -> CriticFeedback:
+    return await critic_agent.areview(
         failed_draft=request.failed_draft,
         validation_report=request.validation_report,
         quality_report=request.quality_report,
@@ -334,8 +504,8 @@ def review_draft(request: ReviewDraftRequest) -> CriticFeedback:
 
 
 @app.post("/v1/agentic/run", response_model=AgenticRunReport)
-def run_agentic(request: AgenticRunRequest) -> AgenticRunReport:
-    report = workflow.run(
+async def run_agentic(request: AgenticRunRequest) -> AgenticRunReport:
+    report = await workflow.arun(
         scene_metadata=request.scene_metadata,
         field_dictionary=request.field_dictionary,
         nl_requirements=request.nl_requirements,
@@ -344,13 +514,93 @@ def run_agentic(request: AgenticRunRequest) -> AgenticRunReport:
         regression_samples=request.regression_samples,
         gate=request.gate,
         max_iterations=request.max_iterations,
+        candidates_per_iteration=request.candidates_per_iteration,
     )
+    _publish_if_approved(request.publish_on_pass, report)
+    return report
 
-    if request.publish_on_pass and report.status.value == "approved" and report.final_draft is not None:
-        template_repository.publish(report.final_draft.template)
-        report.published = True
 
-    return report
+@app.post("/v1/agentic/batch", response_class=StreamingResponse)
+async def run_agentic_batch(manifest: MigrationManifest) -> StreamingResponse:
+    """Stream one ``AgenticBatchItem`` per scene as NDJSON, then ``{"summary": ...}``."""
+
+    async def _lines() -> AsyncIterator[str]:
+        started = time.perf_counter()
+        summary = AgenticBatchSummarizer(total=len(manifest.scenes))
+        async for item in BatchMigrationRunner(workflow).iter_items(manifest):
+            if item.report is not None:
+                _publish_if_approved(manifest.publish_on_pass, item.report)
+            summary.add(item)
+            yield item.model_dump_json() + "\n"
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        yield json.dumps({"summary": summary.summary(elapsed_ms).model_dump(mode="json")}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@app.get(
+    "/v1/agentic/runs/{run_id}",
+    response_model=AgenticRunState,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_agentic_checkpoint(run_id: str) -> AgenticRunState:
+    try:
+        return workflow.checkpoint_store.load(run_id)  # type: ignore[union-attr]
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.post(
+    "/v1/agentic/runs/{run_id}/resume",
+    response_model=AgenticRunReport,
+    responses={404: {"model": ErrorResponse}},
+)
+async def resume_agentic_run(run_id: str) -> AgenticRunReport:
+    try:
+        return await workflow.aresume(run_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.post("/v1/agentic/jobs", response_model=JobRecord, status_code=202)
+def submit_agentic_job(request: AgenticJobRequest) -> JobRecord:
+    payload = request.model_dump(mode="json", exclude={"tenant_id", "priority"})
+    return agentic_jobs.submit(payload, tenant_id=request.tenant_id, priority=request.priority)
+
+
+@app.get(
+    "/v1/agentic/jobs/{job_id}",
+    response_model=JobRecord,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_agentic_job(job_id: str) -> JobRecord:
+    return _get_agentic_job(job_id)
+
+
+@app.get(
+    "/v1/agentic/jobs/{job_id}/result",
+    response_model=AgenticRunReport,
+    responses={404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},
+)
+def get_agentic_job_result(job_id: str) -> AgenticRunReport:
+    record = _get_agentic_job(job_id)
+    if record.status != JobStatus.SUCCEEDED or record.result is None:
+        raise HTTPException(status_code=409, detail=f"job is {record.status.value}: {job_id}")
+    return AgenticRunReport.model_validate(record.result)
+
+
+@app.post(
+    "/v1/agentic/jobs/{job_id}/cancel",
+    response_model=JobRecord,
+    responses={404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},
+)
+def cancel_agentic_job(job_id: str) -> JobRecord:
+    try:
+        return agentic_jobs.cancel(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
 @app.post("/v1/templates/validate", response_model=MigrationValidationReport)
@@ -368,13 +618,22 @@ def quality_check_template(request: QualityCheckRequest) -> TemplateQualityRepor
     )
 
 
+@app.post("/v1/templates/robustness", response_model=RobustnessReport)
+def robustness_check_template(request: RobustnessCheckRequest) -> RobustnessReport:
+    template = request.template if request.template is not None else request.draft.template  # type: ignore[union-attr]
+    return quality_evaluator.robustness(template, request.spec, request.base_samples or None)
+
+
 @app.post(
     "/v1/templates/publish",
     response_model=TemplatePublishResponse,
     responses={400: {"model": ErrorResponse}},
 )
 def publish_template(request: TemplatePublishRequest) -> TemplatePublishResponse:
-    validation = validator.validate(request.draft)
+    # Fail-fast only changes the report of a failing draft (first error only); the full
+    # issue list is available from /v1/templates/validate.
+    fingerprint = fingerprint_template(request.draft.template)
+    validation = validator.validate(request.draft, fingerprint=fingerprint, fail_fast=request.validate_before_publish)
     if request.validate_before_publish and not validation.valid:
         raise HTTPException(
             status_code=400,
@@ -388,6 +647,7 @@ def publish_template(request: TemplatePublishRequest) -> TemplatePublishResponse
         template=request.draft.template,
         regression_samples=request.regression_samples,
         gate=request.quality_gate,
+        fingerprint=fingerprint,
     )
     if request.enforce_quality_gate and not quality.passed:
         raise HTTPException(
@@ -482,6 +742,71 @@ def evaluate(request: EvaluateRequest) -> EvaluationReport:
     )
 
 
+@app.post(
+    "/v1/replay/jobs",
+    response_model=JobRecord,
+    status_code=202,
+    responses={404: {"model": ErrorResponse}},
+)
+def submit_replay_job(request: ReplayJobRequest, background_tasks: BackgroundTasks) -> JobRecord:
+    template = _resolve_template(
+        template_id=request.template_id,
+        version=request.version,
+        inline_template=request.inline_template,
+    )
+    job = job_store.create("replay")
+    background_tasks.add_task(_run_replay_job, job.job_id, template, request)
+    return job
+
+
+@app.get(
+    "/v1/replay/jobs/{job_id}",
+    response_model=JobRecord,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_replay_job(job_id: str) -> JobRecord:
+    try:
+        return job_store.get(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.post(
+    "/v1/templates/quality-check/bulk",
+    response_model=JobRecord,
+    status_code=202,
+    responses={404: {"model": ErrorResponse}},
+)
+def submit_bulk_quality_check(request: BulkQualityCheckRequest, background_tasks: BackgroundTasks) -> JobRecord:
+    templates = list(request.inline_templates)
+    template_ids = request.template_ids
+    if not template_ids and not templates:
+        template_ids = template_repository.list_template_ids()
+    for template_id in template_ids:
+        try:
+            versions = template_repository.list_versions(template_id) if request.all_versions else [None]
+            if not versions:
+                raise KeyError(f"template not found: {template_id}")
+            templates.extend(template_repository.get(template_id, version) for version in versions)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+    job = job_store.create("quality_bulk")
+    background_tasks.add_task(_run_bulk_quality_job, job.job_id, templates, request)
+    return job
+
+
+@app.get(
+    "/v1/templates/quality-check/bulk/{job_id}",
+    response_model=JobRecord,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_bulk_quality_job(job_id: str) -> JobRecord:
+    try:
+        return job_store.get(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
 @app.get("/health")
 def health() -> dict[str, Any]:
     return {
@@ -497,11 +822,122 @@ def health() -> dict[str, Any]:
             "deterministic_validator": "ready",
             "quality_evaluator": "ready",
             "pipeline": "ready",
+            "replay_engine": "ready",
             "llm_router": "enabled" if shared_llm is not None else "fallback_only",
         },
+        "llm_cache": llm_router.cache.stats() if llm_router.cache is not None else None,
+        "quality_cache": quality_evaluator.cache_stats(),
+        "agentic_jobs": agentic_jobs.stats(),
     }
 
 
+def _publish_if_approved(publish_on_pass: bool, report: AgenticRunReport) -> None:
+    if publish_on_pass and report.status.value == "approved" and report.final_draft is not None:
+        template_repository.publish(report.final_draft.template)
+        report.published = True
+
+
+def _run_agentic_job(job_id: str, payload: dict[str, Any], cancelled: Callable[[], bool]) -> dict[str, Any]:
+    request = AgenticRunRequest.model_validate(payload)
+    # The job id doubles as the run id, so a job re-queued after a restart continues
+    # from its last checkpoint instead of repeating LLM calls.
+    try:
+        report = workflow.resume(job_id, cancel_check=cancelled)
+    except KeyError:
+        report = _start_agentic_job(job_id, request, cancelled)
+    _publish_if_approved(request.publish_on_pass, report)
+    return report.model_dump(mode="json")
+
+
+def _start_agentic_job(job_id: str, request: AgenticRunRequest, cancelled: Callable[[], bool]) -> AgenticRunReport:
+    return workflow.run(
+        scene_metadata=request.scene_metadata,
+        field_dictionary=request.field_dictionary,
+        nl_requirements=request.nl_requirements,
+        legacy_points=request.legacy_points,
+        raw_yaml_text=request.raw_yaml_text,
+        regression_samples=request.regression_samples,
+        gate=request.gate,
+        max_iterations=request.max_iterations,
+        candidates_per_iteration=request.candidates_per_iteration,
+        cancel_check=cancelled,
+        run_id=job_id,
+    )
+
+
+def _get_agentic_job(job_id: str) -> JobRecord:
+    try:
+        record = job_store.get(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if record.kind != "agentic":
+        raise HTTPException(status_code=404, detail=f"job not found: {job_id}")
+    return record
+
+
+def _fail_interrupted_jobs() -> None:
+    # Replay and bulk jobs keep no payload, so ones a previous process left unfinished
+    # cannot be resumed; agentic jobs are re-queued by JobQueue.start instead.
+    for record in job_store.list_jobs():
+        if record.kind != "agentic" and record.status in (JobStatus.PENDING, JobStatus.RUNNING):
+            job_store.update(record.job_id, status=JobStatus.FAILED, error="interrupted by restart")
+
+
+def _run_replay_job(job_id: str, template: ScenarioTemplate, request: ReplayJobRequest) -> None:
+    job_store.update(job_id, status=JobStatus.RUNNING)
+    snapshots = request.snapshots if request.snapshots else iter_snapshot_recording(str(request.recording_path))
+    published = 0.0
+    try:
+        for report in replay_engine.iter_reports(
+            template,
+            snapshots,
+            speed=request.speed,
+            report_every=request.report_every,
+            metadata={"replay_job_id": job_id},
+        ):
+            now = time.perf_counter()
+            # Like bulk jobs, publish progress at most twice a second; the final report always goes out.
+            if not report.completed and now - published < 0.5:
+                continue
+            published = now
+            job_store.update(job_id, result=report.model_dump(mode="json"))
+    except Exception as exc:  # noqa: BLE001
+        job_store.update(job_id, status=JobStatus.FAILED, error=f"{type(exc).__name__}: {exc}")
+        return
+    job_store.update(job_id, status=JobStatus.SUCCEEDED)
+
+
+def _run_bulk_quality_job(job_id: str, templates: list[ScenarioTemplate], request: BulkQualityCheckRequest) -> None:
+    job_store.update(job_id, status=JobStatus.RUNNING)
+    runner = BulkQualityRunner(max_workers=request.max_workers, chunk_size=request.chunk_size)
+    summary = BulkQualitySummarizer(total=len(templates))
+    items: list[dict[str, Any]] = []
+    started = published = time.perf_counter()
+    try:
+        for item in runner.iter_items(templates, request.regression_samples, request.gate):
+            summary.add(item)
+            items.append(item.model_dump(mode="json"))
+            now = time.perf_counter()
+            # Progress is re-serialized on every update, so publish it at most twice a second.
+            if now - published < 0.5:
+                continue
+            published = now
+            elapsed_ms = int((now - started) * 1000)
+            job_store.update(
+                job_id,
+                result={"summary": summary.summary(elapsed_ms).model_dump(mode="json"), "items": list(items)},
+            )
+    except Exception as exc:  # noqa: BLE001
+        job_store.update(job_id, status=JobStatus.FAILED, error=f"{type(exc).__name__}: {exc}")
+        return
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    job_store.update(
+        job_id,
+        status=JobStatus.SUCCEEDED,
+        result={"summary": summary.summary(elapsed_ms).model_dump(mode="json"), "items": items},
+    )
+
+
 def _resolve_template(
     template_id: Optional[str],
     version: Optional[str],
@@ -1,35 +1,47 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from easyshift_maas.agentic.batch import AgenticBatchSummarizer, BatchMigrationRunner
 from easyshift_maas.agentic.critic_agent import CriticAgent
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
 from easyshift_maas.agentic.parser_agent import ParserAgent
+from easyshift_maas.agentic.regression_planner import RegressionPlanner
 from easyshift_maas.agentic.template_validator import TemplateValidator
 from easyshift_maas.core.contracts import (
     CatalogLoadMode,
     DataSourceProfile,
     FieldDictionary,
     MigrationDraft,
+    MigrationManifest,
     ScenarioTemplate,
     SceneContext,
     SceneMetadata,
     SimulationSample,
     SnapshotMissingPolicy,
     SnapshotRequest,
+    SnapshotWindowRequest,
     TemplateQualityGate,
 )
 from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
 from easyshift_maas.ingestion.catalog_loader import YamlCatalogLoader
+from easyshift_maas.ingestion.providers.file_provider import FileSnapshotProvider
 from easyshift_maas.ingestion.providers.mysql_provider import MySQLSnapshotProvider
 from easyshift_maas.ingestion.providers.redis_provider import RedisSnapshotProvider
 from easyshift_maas.ingestion.snapshot_provider import CompositeSnapshotProvider
+from easyshift_maas.llm.client import RoleBasedLLMClient
+from easyshift_maas.llm.stub_server import StubLLMConfig, serve_stub_llm
+from easyshift_maas.quality.bulk import BulkQualityRunner, BulkQualitySummarizer
 from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
-from easyshift_maas.security.secrets import ChainedSecretResolver
+from easyshift_maas.replay.engine import ReplayEngine, iter_snapshot_recording
+from easyshift_maas.security.secrets import CachingSecretResolver, ChainedSecretResolver
 
 
 def _load_json(path: str) -> Any:
@@ -106,6 +118,39 @@ def cmd_run_agentic(
     _print_json(report.model_dump(mode="json"))
 
 
+async def _run_agentic_batch(manifest: MigrationManifest) -> None:
+    router = RoleBasedLLMClient()
+    llm = router if router.is_available() else None
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        validator=TemplateValidator(),
+        quality_evaluator=TemplateQualityEvaluator(),
+    )
+    summary = AgenticBatchSummarizer(total=len(manifest.scenes))
+    started = time.perf_counter()
+    try:
+        async for item in BatchMigrationRunner(workflow).iter_items(manifest):
+            summary.add(item)
+            print(json.dumps(item.model_dump(mode="json"), ensure_ascii=False), flush=True)
+    finally:
+        await router.aclose()
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    print(json.dumps({"summary": summary.summary(elapsed_ms).model_dump(mode="json")}, ensure_ascii=False), flush=True)
+
+
+def cmd_run_agentic_batch(manifest_path: str, concurrency: int | None) -> None:
+    manifest = MigrationManifest.model_validate(_load_json(manifest_path))
+    if concurrency is not None:
+        manifest.max_concurrency = concurrency
+    base = Path(manifest_path).parent
+    for entry in manifest.scenes:
+        if entry.raw_yaml_path is not None:
+            entry.raw_yaml_path = str(base / entry.raw_yaml_path)
+    asyncio.run(_run_agentic_batch(manifest))
+
+
 def cmd_validate_draft(draft_path: str) -> None:
     draft = MigrationDraft.model_validate(_load_json(draft_path))
     report = TemplateValidator().validate(draft)
@@ -137,6 +182,66 @@ def cmd_quality_check(
     _print_json(report.model_dump(mode="json"))
 
 
+def _load_templates(path: str) -> list[ScenarioTemplate]:
+    source = Path(path)
+    if source.is_dir():
+        return [
+            ScenarioTemplate.model_validate_json(item.read_text(encoding="utf-8"))
+            for item in sorted(source.glob("*.json"))
+        ]
+    if source.suffix == ".jsonl":
+        with source.open(encoding="utf-8") as handle:
+            return [ScenarioTemplate.model_validate_json(line) for line in handle if line.strip()]
+    payload = _load_json(path)
+    items = payload if isinstance(payload, list) else [payload]
+    return [ScenarioTemplate.model_validate(item) for item in items]
+
+
+def cmd_quality_check_bulk(
+    *,
+    templates_path: str,
+    samples_path: str | None,
+    workers: int | None,
+    chunk_size: int,
+) -> None:
+    templates = _load_templates(templates_path)
+    samples: list[SimulationSample] = []
+    if samples_path:
+        samples = [SimulationSample.model_validate(item) for item in _load_json(samples_path)]
+
+    runner = BulkQualityRunner(max_workers=workers, chunk_size=chunk_size)
+    summary = BulkQualitySummarizer(total=len(templates))
+    started = time.perf_counter()
+    for item in runner.iter_items(templates, samples, TemplateQualityGate()):
+        summary.add(item)
+        print(json.dumps(item.model_dump(mode="json"), ensure_ascii=False), flush=True)
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    print(json.dumps({"summary": summary.summary(elapsed_ms).model_dump(mode="json")}, ensure_ascii=False), flush=True)
+
+
+def cmd_regression_suite(
+    *,
+    template_path: str,
+    random_cases: int,
+    seed: int | None,
+    max_cases: int,
+    pairwise: bool,
+    combinatorial: bool,
+) -> None:
+    template = ScenarioTemplate.model_validate(_load_json(template_path))
+    planner = RegressionPlanner()
+    suite = planner.build_matrix(
+        template,
+        pairwise=pairwise,
+        combinatorial=combinatorial,
+        random_cases=random_cases,
+        seed=seed,
+        max_cases=max_cases,
+    )
+    report = planner.evaluate_matrix(template, suite)
+    _print_json(report.model_dump(mode="json"))
+
+
 def cmd_load_catalog(yaml_path: str, mode: str) -> None:
     loader = YamlCatalogLoader()
     result = loader.load(yaml_path=yaml_path, mode=CatalogLoadMode(mode))
@@ -155,9 +260,9 @@ def cmd_build_context(
     profiles = [DataSourceProfile.model_validate(item) for item in _load_json(profiles_path)]
 
     snapshot_provider = CompositeSnapshotProvider(
-        providers=[RedisSnapshotProvider(), MySQLSnapshotProvider()]
+        providers=[RedisSnapshotProvider(), MySQLSnapshotProvider(), FileSnapshotProvider()]
     )
-    secret_resolver = ChainedSecretResolver()
+    secret_resolver = CachingSecretResolver(ChainedSecretResolver())
 
     request = SnapshotRequest(
         catalog_id=catalog.catalog_id,
@@ -175,6 +280,38 @@ def cmd_build_context(
     _print_json({"scene_context": context.model_dump(mode="json"), "snapshot": snapshot.model_dump(mode="json")})
 
 
+def cmd_fetch_window(
+    catalog_path: str,
+    profiles_path: str,
+    start: str,
+    end: str,
+    step_sec: int,
+    fields: list[str],
+) -> None:
+    from easyshift_maas.core.contracts import PointCatalog
+
+    catalog = PointCatalog.model_validate(_load_json(catalog_path))
+    profiles = [DataSourceProfile.model_validate(item) for item in _load_json(profiles_path)]
+
+    snapshot_provider = CompositeSnapshotProvider(
+        providers=[RedisSnapshotProvider(), MySQLSnapshotProvider(), FileSnapshotProvider()]
+    )
+    request = SnapshotWindowRequest(
+        catalog_id=catalog.catalog_id,
+        start=datetime.fromisoformat(start),
+        end=datetime.fromisoformat(end),
+        step_sec=step_sec,
+        fields=fields or None,
+    )
+    window = snapshot_provider.fetch_window(
+        request=request,
+        catalog=catalog,
+        profiles=profiles,
+        secret_resolver=CachingSecretResolver(ChainedSecretResolver()),
+    )
+    _print_json(window.model_dump(mode="json"))
+
+
 def cmd_simulate(template_path: str, context_path: str) -> None:
     template = ScenarioTemplate.model_validate(_load_json(template_path))
     context = SceneContext.model_validate(_load_json(context_path))
@@ -182,6 +319,42 @@ def cmd_simulate(template_path: str, context_path: str) -> None:
     _print_json(result.model_dump(mode="json"))
 
 
+def cmd_replay(template_path: str, recording_path: str, speed: float | None, report_every: int) -> None:
+    template = ScenarioTemplate.model_validate(_load_json(template_path))
+    snapshots = iter_snapshot_recording(recording_path)
+    engine = ReplayEngine()
+
+    if report_every <= 0:
+        _print_json(engine.run(template, snapshots, speed=speed).model_dump(mode="json"))
+        return
+
+    for report in engine.iter_reports(template, snapshots, speed=speed, report_every=report_every):
+        print(json.dumps(report.model_dump(mode="json"), ensure_ascii=False), flush=True)
+
+
+def cmd_stub_llm(
+    *,
+    host: str,
+    port: int,
+    latency_ms: float,
+    jitter_ms: float,
+    error_rate: float,
+    error_status: int,
+    seed: int,
+    responses_path: str | None,
+) -> None:
+    config = StubLLMConfig(
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        error_rate=error_rate,
+        error_status=error_status,
+        seed=seed,
+        responses=_load_json(responses_path) if responses_path else {},
+    )
+    print(f"stub LLM listening on http://{host}:{port}/v1", flush=True)
+    serve_stub_llm(config, host=host, port=port)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="ReflexFlow-MaaS CLI")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -204,6 +377,12 @@ def build_parser() -> argparse.ArgumentParser:
     run_agentic.add_argument("--max-iterations", type=int, default=3)
     run_agentic.add_argument("--requirement", action="append", default=[])
 
+    run_batch = sub.add_parser(
+        "run-agentic-batch", help="Run the reflection flow for every scene of a manifest, one JSON line each"
+    )
+    run_batch.add_argument("--manifest", required=True)
+    run_batch.add_argument("--concurrency", type=int, help="Scenes in flight (default: manifest max_concurrency)")
+
     validate = sub.add_parser("validate-draft", help="Validate migration draft JSON")
     validate.add_argument("--draft", required=True)
 
@@ -213,6 +392,22 @@ def build_parser() -> argparse.ArgumentParser:
     quality_group.add_argument("--draft")
     quality.add_argument("--samples")
 
+    quality_bulk = sub.add_parser(
+        "quality-check-bulk", help="Quality-check many templates in parallel, streaming one JSON line each"
+    )
+    quality_bulk.add_argument("--templates", required=True, help="Directory of *.json, a JSON list or a JSONL file")
+    quality_bulk.add_argument("--samples")
+    quality_bulk.add_argument("--workers", type=int, help="Worker processes; 0 runs in-process (default: CPU count)")
+    quality_bulk.add_argument("--chunk-size", type=int, default=8)
+
+    regression = sub.add_parser("regression-suite", help="Generate and run a boundary regression suite for a template")
+    regression.add_argument("--template", required=True)
+    regression.add_argument("--random-cases", type=int, default=0)
+    regression.add_argument("--seed", type=int)
+    regression.add_argument("--max-cases", type=int, default=100_000)
+    regression.add_argument("--no-pairwise", action="store_true")
+    regression.add_argument("--no-combinatorial", action="store_true")
+
     load_catalog = sub.add_parser("load-catalog", help="Load point catalog from YAML")
     load_catalog.add_argument("--yaml", required=True)
     load_catalog.add_argument("--mode", choices=["standard", "legacy"], default="standard")
@@ -223,10 +418,34 @@ def build_parser() -> argparse.ArgumentParser:
     build_context.add_argument("--field", action="append", default=[])
     build_context.add_argument("--missing-policy", choices=["error", "drop", "zero"], default="error")
 
+    fetch_window = sub.add_parser("fetch-window", help="Fetch a resampled history window for a catalog")
+    fetch_window.add_argument("--catalog", required=True)
+    fetch_window.add_argument("--profiles", required=True)
+    fetch_window.add_argument("--start", required=True)
+    fetch_window.add_argument("--end", required=True)
+    fetch_window.add_argument("--step-sec", type=int, default=60)
+    fetch_window.add_argument("--field", action="append", default=[])
+
     simulate = sub.add_parser("simulate", help="Run one prediction-optimization simulation")
     simulate.add_argument("--template", required=True)
     simulate.add_argument("--context", required=True)
 
+    replay = sub.add_parser("replay", help="Backtest a template against a recorded snapshot JSONL file")
+    replay.add_argument("--template", required=True)
+    replay.add_argument("--recording", required=True)
+    replay.add_argument("--speed", type=float, help="Multiple of recorded time; omit to run unpaced")
+    replay.add_argument("--report-every", type=int, default=0, help="Stream a JSON line every N ticks")
+
+    stub_llm = sub.add_parser("stub-llm", help="Serve a deterministic OpenAI-compatible stub LLM for local load tests")
+    stub_llm.add_argument("--host", default="127.0.0.1")
+    stub_llm.add_argument("--port", type=int, default=8900)
+    stub_llm.add_argument("--latency-ms", type=float, default=0.0)
+    stub_llm.add_argument("--jitter-ms", type=float, default=0.0)
+    stub_llm.add_argument("--error-rate", type=float, default=0.0)
+    stub_llm.add_argument("--error-status", type=int, default=500)
+    stub_llm.add_argument("--seed", type=int, default=0)
+    stub_llm.add_argument("--responses", help="JSON object of canned answers keyed by parser/generator/critic")
+
     return parser
 
 
@@ -252,6 +471,10 @@ def main() -> None:
         )
         return
 
+    if args.command == "run-agentic-batch":
+        cmd_run_agentic_batch(args.manifest, args.concurrency)
+        return
+
     if args.command == "validate-draft":
         cmd_validate_draft(args.draft)
         return
@@ -260,6 +483,26 @@ def main() -> None:
         cmd_quality_check(template_path=args.template, draft_path=args.draft, samples_path=args.samples)
         return
 
+    if args.command == "quality-check-bulk":
+        cmd_quality_check_bulk(
+            templates_path=args.templates,
+            samples_path=args.samples,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+        return
+
+    if args.command == "regression-suite":
+        cmd_regression_suite(
+            template_path=args.template,
+            random_cases=args.random_cases,
+            seed=args.seed,
+            max_cases=args.max_cases,
+            pairwise=not args.no_pairwise,
+            combinatorial=not args.no_combinatorial,
+        )
+        return
+
     if args.command == "load-catalog":
         cmd_load_catalog(args.yaml, args.mode)
         return
@@ -273,8 +516,36 @@ def main() -> None:
         )
         return
 
+    if args.command == "fetch-window":
+        cmd_fetch_window(
+            catalog_path=args.catalog,
+            profiles_path=args.profiles,
+            start=args.start,
+            end=args.end,
+            step_sec=args.step_sec,
+            fields=args.field,
+        )
+        return
+
     if args.command == "simulate":
         cmd_simulate(args.template, args.context)
         return
 
+    if args.command == "replay":
+        cmd_replay(args.template, args.recording, args.speed, args.report_every)
+        return
+
+    if args.command == "stub-llm":
+        cmd_stub_llm(
+            host=args.host,
+            port=args.port,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+            responses_path=args.responses,
+        )
+        return
+
     parser.error(f"unknown command: {args.command}")
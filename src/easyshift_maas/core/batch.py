@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, NamedTuple, Optional
+
+from easyshift_maas.core.contracts import (
+    ConstraintOperator,
+    GuardrailAction,
+    ObjectiveDirection,
+    ScenarioTemplate,
+    SceneContext,
+)
+
+
+class SampleMatrix:
+    """Compact set of scene contexts over a fixed field list.
+
+    Every row is the ``nominal`` vector with a few overridden columns, stored in CSR
+    layout (``offsets``/``columns``/``values`` arrays), so boundary and pairwise suites
+    cost a handful of numbers per case instead of a full dict.
+    """
+
+    def __init__(self, fields: list[str], nominal: Iterable[float]) -> None:
+        self.fields = list(fields)
+        self.nominal = array("d", nominal)
+        if len(self.nominal) != len(self.fields):
+            raise ValueError("nominal vector must have one value per field")
+        self.offsets = array("q", [0])
+        self.columns = array("l")
+        self.values = array("d")
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, overrides: Iterable[tuple[int, float]]) -> None:
+        for column, value in overrides:
+            self.columns.append(column)
+            self.values.append(value)
+        self.offsets.append(len(self.columns))
+
+    def overrides(self, row: int) -> list[tuple[int, float]]:
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return list(zip(self.columns[start:end], self.values[start:end]))
+
+    def row_values(self, row: int) -> list[float]:
+        values = self.nominal.tolist()
+        for column, value in self.overrides(row):
+            values[column] = value
+        return values
+
+    def context(self, row: int) -> SceneContext:
+        return SceneContext(values=dict(zip(self.fields, self.row_values(row))))
+
+
+class FieldOutcome(NamedTuple):
+    violations: int
+    rejected: bool
+    fired_rules: tuple[int, ...]
+    binding_constraints: tuple[int, ...]
+    objective: float = 0.0
+
+
+class BatchResult:
+    """Per-row outcomes of :meth:`BatchPipeline.run` plus per-constraint/rule counts."""
+
+    def __init__(self, rows: int, solver_status: str, constraints: int, rules: int) -> None:
+        self.solver_status = solver_status
+        self.executed = bytearray(rows)
+        self.violated = bytearray(rows)
+        self.violations = array("l", bytes(rows * array("l").itemsize))
+        self.objective = array("d", bytes(rows * array("d").itemsize))
+        self.constraint_binding = [0] * constraints
+        self.rule_fired = [0] * rules
+
+    def __len__(self) -> int:
+        return len(self.executed)
+
+
+class _FieldProgram(NamedTuple):
+    feature: bool
+    objective_factor: Optional[float]
+    # +weight for MIN terms, -weight for MAX terms, in term order.
+    objective_weights: tuple[float, ...]
+    # (constraint index, operator, a, b) in solve order.
+    constraints: tuple[tuple[int, ConstraintOperator, float, float], ...]
+    # (rule index, min, max, max_delta, rejects, clips) in rule order.
+    rules: tuple[tuple[int, Optional[float], Optional[float], Optional[float], bool, bool], ...]
+
+
+class BatchPipeline:
+    """Evaluate many contexts against one template without building pydantic objects.
+
+    Produces the same ``executed`` / violation / ``solver_status`` outcome as
+    :class:`PredictionOptimizationPipeline` with its default predictor, optimizer and
+    guardrail. Every stage of those is field-local (a field's setpoint and rule checks
+    only read that field's context value), so each row is scored from the nominal row
+    plus its overridden fields, and per-field results are memoized by value. The
+    objective value is summed per field, so it can differ from the optimizer's in the
+    last float digit.
+    """
+
+    _MEMO_LIMIT = 4096
+
+    def __init__(self, template: ScenarioTemplate, fields: list[str]) -> None:
+        self.fields = list(fields)
+        spec = template.prediction
+        gain = 1.0 + min(spec.horizon_steps, 10) * 0.005
+        self._gain = gain
+        features = set(spec.feature_fields)
+
+        factors: dict[str, float] = {}
+        weights: dict[str, list[float]] = {}
+        for term in template.objective.terms:
+            if term.direction == ObjectiveDirection.MIN:
+                factors[term.field_name] = 1.0 - 0.02 * term.weight
+                weights.setdefault(term.field_name, []).append(term.weight)
+            else:
+                factors[term.field_name] = 1.0 + 0.02 * term.weight
+                weights.setdefault(term.field_name, []).append(-term.weight)
+
+        infeasible = False
+        constraint_ops: dict[str, list] = {}
+        ordered = sorted(enumerate(template.constraints), key=lambda item: item[1].priority)
+        for idx, constraint in ordered:
+            op = constraint.operator
+            if op == ConstraintOperator.LE and constraint.upper_bound is not None:
+                entry = (idx, op, constraint.upper_bound, constraint.upper_bound)
+            elif op == ConstraintOperator.GE and constraint.lower_bound is not None:
+                entry = (idx, op, constraint.lower_bound, constraint.lower_bound)
+            elif op == ConstraintOperator.EQ and constraint.equals_value is not None:
+                entry = (idx, op, constraint.equals_value, constraint.equals_value)
+            elif (
+                op == ConstraintOperator.BETWEEN
+                and constraint.lower_bound is not None
+                and constraint.upper_bound is not None
+            ):
+                if constraint.lower_bound > constraint.upper_bound:
+                    infeasible = True
+                    continue
+                entry = (idx, op, constraint.lower_bound, constraint.upper_bound)
+            else:
+                continue
+            constraint_ops.setdefault(constraint.field_name, []).append(entry)
+        self.solver_status = "infeasible" if infeasible else "solved"
+        self.constraint_count = len(template.constraints)
+
+        rule_ops: dict[str, list] = {}
+        for idx, rule in enumerate(template.guardrail.rules):
+            rule_ops.setdefault(rule.field_name, []).append(
+                (
+                    idx,
+                    rule.min_value,
+                    rule.max_value,
+                    rule.max_delta,
+                    rule.action == GuardrailAction.REJECT,
+                    rule.action == GuardrailAction.CLIP,
+                )
+            )
+        self.rule_count = len(template.guardrail.rules)
+
+        def _program(name: str) -> _FieldProgram:
+            return _FieldProgram(
+                feature=name in features,
+                objective_factor=factors.get(name),
+                objective_weights=tuple(weights.get(name, ())),
+                constraints=tuple(constraint_ops.get(name, ())),
+                rules=tuple(rule_ops.get(name, ())),
+            )
+
+        self._programs = [_program(name) for name in self.fields]
+        self._memo: list[dict[float, FieldOutcome]] = [{} for _ in self.fields]
+
+        # Fields the template touches but the matrix does not carry are absent from
+        # every context, so their outcome is the same for all rows.
+        columns = set(self.fields)
+        extra = (set(factors) | set(constraint_ops) | set(rule_ops)) - columns
+        self._static = [self._field_outcome(_program(name), None) for name in sorted(extra)]
+
+    def field_outcome(self, column: int, value: float) -> FieldOutcome:
+        memo = self._memo[column]
+        outcome = memo.get(value)
+        if outcome is None:
+            outcome = self._field_outcome(self._programs[column], value)
+            # Boundary levels repeat across many rows; noise draws never do.
+            if len(memo) < self._MEMO_LIMIT:
+                memo[value] = outcome
+        return outcome
+
+    def run(self, matrix: SampleMatrix) -> BatchResult:
+        if matrix.fields != self.fields:
+            raise ValueError("matrix fields do not match the compiled field list")
+        result = BatchResult(len(matrix), self.solver_status, self.constraint_count, self.rule_count)
+        binding = result.constraint_binding
+        fired = result.rule_fired
+
+        base = [self.field_outcome(column, value) for column, value in enumerate(matrix.nominal)]
+        base.extend(self._static)
+        base_violations = sum(item.violations for item in base)
+        base_objective = sum(item.objective for item in base)
+        base_rejects = sum(1 for item in base if item.rejected)
+        rows = len(matrix)
+        for item in base:
+            for idx in item.binding_constraints:
+                binding[idx] += rows
+            for idx in item.fired_rules:
+                fired[idx] += rows
+
+        offsets, columns, values = matrix.offsets, matrix.columns, matrix.values
+        executed, violated = result.executed, result.violated
+        row_violations, row_objective = result.violations, result.objective
+        for row in range(rows):
+            violations = base_violations
+            objective = base_objective
+            rejects = base_rejects
+            start, end = offsets[row], offsets[row + 1]
+            # Later overrides of the same column win, like dict assignment.
+            overridden = dict(zip(columns[start:end], values[start:end]))
+            for column, value in overridden.items():
+                old = base[column]
+                new = self.field_outcome(column, value)
+                if new is old:
+                    continue
+                violations += new.violations - old.violations
+                objective += new.objective - old.objective
+                rejects += new.rejected - old.rejected
+                for idx in old.binding_constraints:
+                    binding[idx] -= 1
+                for idx in new.binding_constraints:
+                    binding[idx] += 1
+                for idx in old.fired_rules:
+                    fired[idx] -= 1
+                for idx in new.fired_rules:
+                    fired[idx] += 1
+            executed[row] = rejects == 0
+            violated[row] = violations > 0
+            row_violations[row] = violations
+            row_objective[row] = objective
+        return result
+
+    def _field_outcome(self, program: _FieldProgram, value: Optional[float]) -> FieldOutcome:
+        # Mirrors HeuristicPredictor -> ProjectedHeuristicOptimizer -> RuleGuardrail for
+        # one field; ``value=None`` means the field is absent from the context.
+        context_value = 0.0 if value is None else value
+        setpoint = value
+        if program.objective_factor is not None:
+            base = context_value * self._gain if program.feature else context_value
+            setpoint = base * program.objective_factor
+
+        binding: list[int] = []
+        for idx, op, low, high in program.constraints:
+            current = context_value if setpoint is None else setpoint
+            if op == ConstraintOperator.LE:
+                setpoint = min(current, high)
+            elif op == ConstraintOperator.GE:
+                setpoint = max(current, low)
+            elif op == ConstraintOperator.EQ:
+                setpoint = low
+            else:
+                setpoint = min(max(current, low), high)
+            if setpoint != current:
+                binding.append(idx)
+
+        objective = 0.0
+        for weight in program.objective_weights:
+            objective += weight * setpoint
+
+        violations = 0
+        rejected = False
+        fired: list[int] = []
+        for idx, min_value, max_value, max_delta, rejects, clips in program.rules:
+            if setpoint is None:
+                violations += 1
+                rejected = True
+                fired.append(idx)
+                continue
+            current = setpoint
+            hits = 0
+            if min_value is not None and current < min_value:
+                hits += 1
+                if clips:
+                    setpoint = min_value
+            if max_value is not None and current > max_value:
+                hits += 1
+                if clips:
+                    setpoint = max_value
+            if max_delta is not None and value is not None and abs(current - value) > max_delta:
+                hits += 1
+                if clips:
+                    setpoint = value + max_delta if current > value else value - max_delta
+            if hits:
+                violations += hits
+                rejected = rejected or rejects
+                fired.append(idx)
+
+        return FieldOutcome(violations, rejected, tuple(fired), tuple(binding), objective)
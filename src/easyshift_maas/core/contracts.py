@@ -52,6 +52,19 @@ class IssueSeverity(str, Enum):
 class DataSourceKind(str, Enum):
     REDIS = "redis"
     MYSQL = "mysql"
+    FILE = "file"
+
+
+class FileSourceFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    NPY = "npy"
+
+
+class RedisSubscriptionMode(str, Enum):
+    POLL = "poll"
+    KEYSPACE = "keyspace"
+    STREAM = "stream"
 
 
 class CatalogLoadMode(str, Enum):
@@ -71,6 +84,19 @@ class AgenticRunStatus(str, Enum):
     FAILED = "failed"
 
 
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class NoiseKind(str, Enum):
+    GAUSSIAN = "gaussian"
+    UNIFORM = "uniform"
+
+
 class SceneMetadata(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -92,6 +118,11 @@ class DataSourceOptions(BaseModel):
     mysql_point_column: str = "point_id"
     mysql_value_column: str = "value"
     mysql_ts_column: Optional[str] = None
+    redis_subscription: RedisSubscriptionMode = RedisSubscriptionMode.POLL
+    redis_stream_key: Optional[str] = None
+    file_path: Optional[str] = None
+    file_format: Optional[FileSourceFormat] = None
+    file_ts_column: str = "ts"
 
 
 class DataSourceProfile(BaseModel):
@@ -134,6 +165,18 @@ class PointCatalog(BaseModel):
         return self
 
 
+class CatalogDiff(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    catalog_id: str
+    added: list[str] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    changed: list[str] = Field(default_factory=list)
+    unchanged_count: int = Field(default=0, ge=0)
+    catalog_fields_changed: list[str] = Field(default_factory=list)
+    affected_kinds: list[DataSourceKind] = Field(default_factory=list)
+
+
 class SnapshotRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -150,9 +193,40 @@ class SnapshotResult(BaseModel):
     quality_flags: dict[str, str] = Field(default_factory=dict)
     missing_fields: list[str] = Field(default_factory=list)
     source_latency_ms: dict[str, int] = Field(default_factory=dict)
+    value_timestamps: dict[str, datetime] = Field(default_factory=dict)
     collected_at: datetime = Field(default_factory=now_utc)
 
 
+class SnapshotWindowRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    catalog_id: str
+    start: datetime
+    end: datetime
+    step_sec: int = Field(default=60, gt=0)
+    fields: Optional[list[str]] = None
+
+    @model_validator(mode="after")
+    def _check_range(self) -> "SnapshotWindowRequest":
+        if self.end < self.start:
+            raise ValueError("end must be >= start")
+        steps = (self.end - self.start).total_seconds() / self.step_sec
+        if steps > 100_000:
+            raise ValueError("window too large: at most 100000 steps per request")
+        return self
+
+
+class SnapshotWindow(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    fields: list[str] = Field(default_factory=list)
+    timestamps: list[datetime] = Field(default_factory=list)
+    values: list[list[Optional[float]]] = Field(default_factory=list)
+    quality_flags: dict[str, str] = Field(default_factory=dict)
+    missing_fields: list[str] = Field(default_factory=list)
+    source_latency_ms: dict[str, int] = Field(default_factory=dict)
+
+
 class FieldDefinition(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -328,6 +402,8 @@ class ReflectionStep(BaseModel):
     validation_errors: list[str] = Field(default_factory=list)
     quality_errors: list[str] = Field(default_factory=list)
     critic_feedback: Optional[CriticFeedback] = None
+    candidates_evaluated: int = Field(default=1, ge=1)
+    changed_sections: list[str] = Field(default_factory=list)
     timestamp: datetime = Field(default_factory=now_utc)
 
 
@@ -341,6 +417,10 @@ class LLMProviderConfig(BaseModel):
     model: str
     temperature: float = Field(default=0.1, ge=0.0, le=2.0)
     timeout_s: int = Field(default=30, ge=1, le=300)
+    max_connections: int = Field(default=20, ge=1)
+    max_keepalive_connections: int = Field(default=10, ge=0)
+    keepalive_expiry_s: float = Field(default=30.0, ge=0.0)
+    http2: bool = False
 
 
 class MigrationRisk(BaseModel):
@@ -417,6 +497,89 @@ class TemplateQualityReport(BaseModel):
     issues: list[TemplateQualityIssue] = Field(default_factory=list)
 
 
+class BulkQualityItem(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    template_id: str
+    version: str
+    report: Optional[TemplateQualityReport] = None
+    error: Optional[str] = None
+    # True when an identical template earlier in the batch supplied the report.
+    deduplicated: bool = False
+    elapsed_ms: int = 0
+
+
+class BulkQualitySummary(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    total: int = 0
+    completed: int = 0
+    passed: int = 0
+    failed: int = 0
+    errored: int = 0
+    deduplicated: int = 0
+    mean_overall_score: float = 0.0
+    min_overall_score: Optional[float] = None
+    issue_counts: dict[str, int] = Field(default_factory=dict)
+    elapsed_ms: int = 0
+
+
+class FieldNoiseSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Optional[NoiseKind] = None
+    # Absolute scale: standard deviation (gaussian) or half-width (uniform).
+    scale: float = Field(ge=0.0)
+
+
+class RobustnessSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    draws: int = Field(default=1000, ge=1, le=200_000)
+    seed: Optional[int] = None
+    noise: NoiseKind = NoiseKind.GAUSSIAN
+    relative_scale: float = Field(default=0.02, ge=0.0)
+    min_scale: float = Field(default=0.01, ge=0.0)
+    field_noise: dict[str, FieldNoiseSpec] = Field(default_factory=dict)
+    dimension_correlation: float = Field(default=0.0, ge=0.0, le=1.0)
+    controllable_only: bool = False
+    confidence: float = Field(default=0.95, gt=0.0, lt=1.0)
+    batch_size: int = Field(default=4096, ge=1)
+
+
+class MetricSummary(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    mean: float
+    std: float
+    ci_low: float
+    ci_high: float
+    p05: float
+    p50: float
+    p95: float
+    min: float
+    max: float
+
+
+class RobustnessReport(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    template_id: str
+    draws: int
+    seed: Optional[int] = None
+    approval_rate: float = Field(ge=0.0, le=1.0)
+    approval_ci_low: float = Field(ge=0.0, le=1.0)
+    approval_ci_high: float = Field(ge=0.0, le=1.0)
+    violation_rate: float = Field(ge=0.0, le=1.0)
+    violations: MetricSummary
+    objective_value: MetricSummary
+    # Aligned with template.guardrail.rules; None when a custom pipeline ran draw by
+    # draw, since its guardrail's violations cannot be attributed to rules.
+    rule_fire_rates: Optional[list[float]] = None
+    solver_status: str
+    elapsed_ms: int = 0
+
+
 class SceneContext(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -487,17 +650,37 @@ class EvaluationReport(BaseModel):
     expectation_match_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
 
 
-class AgenticRunState(BaseModel):
+class ReplayReport(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    run_id: str = Field(default_factory=lambda: f"run-{uuid4().hex}")
-    scene_metadata: SceneMetadata
-    field_dictionary: FieldDictionary
-    nl_requirements: list[str] = Field(default_factory=list)
-    parser_result: Optional[ParserResult] = None
-    current_draft: Optional[MigrationDraft] = None
-    reflections: list[ReflectionStep] = Field(default_factory=list)
-    iteration: int = 0
+    template_id: str
+    total_ticks: int = Field(default=0, ge=0)
+    approved_ticks: int = Field(default=0, ge=0)
+    approval_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    violation_ticks: int = Field(default=0, ge=0)
+    violation_counts: dict[str, int] = Field(default_factory=dict)
+    incomplete_ticks: int = Field(default=0, ge=0)
+    mean_objective: float = 0.0
+    objective_trajectory: list[float] = Field(default_factory=list)
+    first_tick_at: Optional[datetime] = None
+    last_tick_at: Optional[datetime] = None
+    elapsed_ms: int = Field(default=0, ge=0)
+    completed: bool = False
+
+
+class JobRecord(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    job_id: str = Field(default_factory=lambda: f"job-{uuid4().hex}")
+    kind: str
+    status: JobStatus = JobStatus.PENDING
+    tenant_id: Optional[str] = None
+    priority: int = 0
+    cancel_requested: bool = False
+    created_at: datetime = Field(default_factory=now_utc)
+    updated_at: datetime = Field(default_factory=now_utc)
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
 
 
 class AgenticRunReport(BaseModel):
@@ -513,3 +696,92 @@ class AgenticRunReport(BaseModel):
     blocked_reason: Optional[str] = None
     iterations_used: int = Field(default=0, ge=0)
     published: bool = False
+
+
+class AgenticRunState(BaseModel):
+    """Checkpoint of a reflection run: its inputs plus everything produced so far."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    run_id: str = Field(default_factory=lambda: f"run-{uuid4().hex}")
+    scene_metadata: SceneMetadata
+    field_dictionary: FieldDictionary
+    nl_requirements: list[str] = Field(default_factory=list)
+    legacy_points: list[str] = Field(default_factory=list)
+    raw_yaml_text: Optional[str] = None
+    regression_samples: list[SimulationSample] = Field(default_factory=list)
+    gate: Optional[TemplateQualityGate] = None
+    max_iterations: int = Field(default=3, ge=0)
+    candidates_per_iteration: int = Field(default=1, ge=0)
+    parser_result: Optional[ParserResult] = None
+    current_draft: Optional[MigrationDraft] = None
+    reflections: list[ReflectionStep] = Field(default_factory=list)
+    iteration: int = 0
+    # Drafts generated for ``iteration`` that have not been reviewed yet.
+    candidate_drafts: list[MigrationDraft] = Field(default_factory=list)
+    last_validation: Optional[MigrationValidationReport] = None
+    last_quality: Optional[TemplateQualityReport] = None
+    correction_instruction: Optional[str] = None
+    # Last completed node: parse, generate, score, review or done.
+    last_step: Optional[str] = None
+    report: Optional[AgenticRunReport] = None
+    updated_at: datetime = Field(default_factory=now_utc)
+
+
+class MigrationManifestEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    scene_metadata: SceneMetadata
+    # Falls back to the manifest-level dictionary when omitted.
+    field_dictionary: Optional[FieldDictionary] = None
+    nl_requirements: list[str] = Field(default_factory=list)
+    legacy_points: list[str] = Field(default_factory=list)
+    raw_yaml_text: Optional[str] = None
+    raw_yaml_path: Optional[str] = None
+    max_iterations: Optional[int] = Field(default=None, ge=1, le=8)
+
+
+class MigrationManifest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    scenes: list[MigrationManifestEntry] = Field(min_length=1)
+    field_dictionary: Optional[FieldDictionary] = None
+    max_iterations: int = Field(default=3, ge=1, le=8)
+    candidates_per_iteration: int = Field(default=1, ge=1, le=8)
+    gate: TemplateQualityGate = Field(default_factory=TemplateQualityGate)
+    regression_samples: list[SimulationSample] = Field(default_factory=list)
+    max_concurrency: int = Field(default=4, ge=1, le=64)
+    # Caps LLM calls in flight across all scenes; None leaves them at scenes x per-scene fan-out.
+    max_llm_concurrency: Optional[int] = Field(default=None, ge=1, le=256)
+    publish_on_pass: bool = False
+
+    @model_validator(mode="after")
+    def _check_dictionaries(self) -> "MigrationManifest":
+        if self.field_dictionary is None:
+            missing = [item.scene_metadata.scene_id for item in self.scenes if item.field_dictionary is None]
+            if missing:
+                raise ValueError(f"scenes without field_dictionary and no manifest default: {missing}")
+        return self
+
+
+class AgenticBatchItem(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    index: int = Field(ge=0)
+    scene_id: str
+    report: Optional[AgenticRunReport] = None
+    error: Optional[str] = None
+    elapsed_ms: int = 0
+
+
+class AgenticBatchSummary(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    total: int = 0
+    completed: int = 0
+    approved: int = 0
+    blocked: int = 0
+    errored: int = 0
+    published: int = 0
+    mean_iterations: float = 0.0
+    elapsed_ms: int = 0
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def canonical_digest(payload: Any) -> str:
+    """Return a stable SHA-256 hex digest of a JSON-compatible payload."""
+
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def model_digest(model: BaseModel) -> str:
+    """SHA-256 of a pydantic model's JSON, serialized in schema order by pydantic-core.
+
+    Much faster than :func:`canonical_digest` for large models. Dict-valued fields keep
+    insertion order, so equal models can (rarely) hash differently; use it for cache
+    keys where a spurious miss is harmless, not for identity.
+    """
+
+    return hashlib.sha256(model.__pydantic_serializer__.to_json(model)).hexdigest()
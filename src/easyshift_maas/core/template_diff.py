@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from easyshift_maas.core.contracts import ScenarioTemplate
+from easyshift_maas.core.hashing import canonical_digest, model_digest
+
+TEMPLATE_SECTIONS = (
+    "scene_metadata",
+    "field_dictionary",
+    "objective",
+    "constraints",
+    "prediction",
+    "optimization",
+    "guardrail",
+)
+
+# Sections read by the optimizer step of PredictionOptimizationPipeline.
+PLAN_SECTIONS = ("objective", "constraints", "optimization")
+
+
+@dataclass(frozen=True)
+class TemplateFingerprint:
+    """Per-section content digests of a template (``created_at`` excluded).
+
+    ``header`` covers the scalar fields (id, version, notes). Constraints are also
+    hashed one by one so checks can be keyed by the constraints they actually read.
+    """
+
+    header: str
+    sections: dict[str, str]
+    constraints: tuple[str, ...]
+
+    @property
+    def digest(self) -> str:
+        return canonical_digest({"header": self.header, "sections": self.sections})
+
+    def changed_sections(self, previous: "TemplateFingerprint | None") -> list[str]:
+        if previous is None:
+            return ["header", *TEMPLATE_SECTIONS]
+        changed = ["header"] if previous.header != self.header else []
+        changed.extend(name for name in TEMPLATE_SECTIONS if previous.sections[name] != self.sections[name])
+        return changed
+
+
+def fingerprint_template(template: ScenarioTemplate) -> TemplateFingerprint:
+    constraints = tuple(model_digest(item) for item in template.constraints)
+    sections: dict[str, str] = {}
+    for name in TEMPLATE_SECTIONS:
+        if name == "constraints":
+            sections[name] = canonical_digest(list(constraints))
+        else:
+            sections[name] = model_digest(getattr(template, name))
+    header: dict[str, Any] = {
+        "template_id": template.template_id,
+        "version": template.version,
+        "notes": template.notes,
+    }
+    return TemplateFingerprint(header=canonical_digest(header), sections=sections, constraints=constraints)
@@ -1,3 +1,4 @@
+from easyshift_maas.ingestion.catalog_index import CatalogIndex, CatalogIndexCache
 from easyshift_maas.ingestion.catalog_loader import CatalogLoadResult, CatalogLoaderProtocol, YamlCatalogLoader
 from easyshift_maas.ingestion.repository import (
     CatalogRepositoryProtocol,
@@ -9,9 +10,12 @@ from easyshift_maas.ingestion.snapshot_provider import (
     CompositeSnapshotProvider,
     SnapshotProviderProtocol,
     SourceSnapshotProviderProtocol,
+    WindowSourceSnapshotProviderProtocol,
 )
 
 __all__ = [
+    "CatalogIndex",
+    "CatalogIndexCache",
     "CatalogLoadResult",
     "CatalogLoaderProtocol",
     "YamlCatalogLoader",
@@ -22,4 +26,5 @@ __all__ = [
     "CompositeSnapshotProvider",
     "SnapshotProviderProtocol",
     "SourceSnapshotProviderProtocol",
+    "WindowSourceSnapshotProviderProtocol",
 ]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import re
+
+from easyshift_maas.core.contracts import CatalogDiff, DataSourceKind, PointBinding, PointCatalog, now_utc
+
+_CATALOG_FIELDS = ("refresh_sec", "source_profile")
+_TRAILING_NUMBER = re.compile(r"(\d+)$")
+
+
+def diff_catalogs(current: PointCatalog, incoming: PointCatalog) -> CatalogDiff:
+    """Compare two versions of a catalog binding by binding, keyed by ``point_id``."""
+
+    if current.catalog_id != incoming.catalog_id:
+        raise ValueError(f"catalog id mismatch: {current.catalog_id} != {incoming.catalog_id}")
+
+    old_bindings = {item.point_id: item for item in current.bindings}
+    new_bindings = {item.point_id: item for item in incoming.bindings}
+
+    added = [point_id for point_id in new_bindings if point_id not in old_bindings]
+    removed = [point_id for point_id in old_bindings if point_id not in new_bindings]
+    changed = [
+        point_id
+        for point_id, item in new_bindings.items()
+        if point_id in old_bindings and old_bindings[point_id] != item
+    ]
+    catalog_fields_changed = [
+        name for name in _CATALOG_FIELDS if getattr(current, name) != getattr(incoming, name)
+    ]
+
+    affected: set[DataSourceKind] = set()
+    if "source_profile" in catalog_fields_changed:
+        # Profile selection for every kind depends on the preferred profile name.
+        affected.update(item.source_type for item in current.bindings)
+        affected.update(item.source_type for item in incoming.bindings)
+    else:
+        for point_id in added:
+            affected.add(new_bindings[point_id].source_type)
+        for point_id in removed:
+            affected.add(old_bindings[point_id].source_type)
+        for point_id in changed:
+            affected.add(old_bindings[point_id].source_type)
+            affected.add(new_bindings[point_id].source_type)
+
+    return CatalogDiff(
+        catalog_id=current.catalog_id,
+        added=added,
+        removed=removed,
+        changed=changed,
+        unchanged_count=len(new_bindings) - len(added) - len(changed),
+        catalog_fields_changed=catalog_fields_changed,
+        affected_kinds=sorted(affected, key=lambda kind: kind.value),
+    )
+
+
+def is_empty_diff(diff: CatalogDiff) -> bool:
+    return not (diff.added or diff.removed or diff.changed or diff.catalog_fields_changed)
+
+
+def apply_catalog_diff(current: PointCatalog, incoming: PointCatalog, diff: CatalogDiff) -> PointCatalog:
+    """Return the next catalog version, reusing unchanged binding objects from ``current``.
+
+    An empty diff returns ``current`` itself so identity-keyed caches stay valid.
+    """
+
+    if is_empty_diff(diff):
+        return current
+
+    old_bindings = {item.point_id: item for item in current.bindings}
+    replaced = set(diff.added) | set(diff.changed)
+    bindings: list[PointBinding] = [
+        item if item.point_id in replaced else old_bindings[item.point_id] for item in incoming.bindings
+    ]
+    update = {name: getattr(incoming, name) for name in diff.catalog_fields_changed}
+    update.update({"bindings": bindings, "version": bump_version(current.version), "created_at": now_utc()})
+    return current.model_copy(update=update)
+
+
+def bump_version(version: str) -> str:
+    """Increment the trailing integer of a version label (``v7`` -> ``v8``)."""
+
+    match = _TRAILING_NUMBER.search(version)
+    if match is None:
+        return f"{version}.1"
+    number = match.group(1)
+    return f"{version[: match.start()]}{int(number) + 1:0{len(number)}d}"
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, defaultdict
+
+from easyshift_maas.core.contracts import CatalogDiff, DataSourceKind, DataSourceProfile, PointBinding, PointCatalog
+
+_ProfileMemo = tuple[tuple[DataSourceProfile, ...], dict[DataSourceKind, DataSourceProfile | None]]
+
+
+class CatalogIndex:
+    """Lookups derived once from a catalog version: enabled bindings grouped by
+    source kind, a field -> bindings index, and the last resolved profiles.
+    """
+
+    def __init__(self, catalog: PointCatalog) -> None:
+        groups: dict[DataSourceKind, list[PointBinding]] = defaultdict(list)
+        by_field: dict[str, list[PointBinding]] = defaultdict(list)
+        self._position: dict[str, int] = {}
+        for position, item in enumerate(catalog.bindings):
+            if not item.enabled:
+                continue
+            groups[item.source_type].append(item)
+            by_field[item.field_name].append(item)
+            self._position[item.point_id] = position
+
+        self.catalog = catalog
+        self.groups = dict(groups)
+        self.by_field = dict(by_field)
+
+        self._profiles_seen: tuple[DataSourceProfile, ...] = ()
+        self._profiles_resolved: dict[DataSourceKind, DataSourceProfile | None] = {}
+        self._lock = threading.Lock()
+
+    def select(self, fields: list[str] | None) -> dict[DataSourceKind, list[PointBinding]]:
+        """Group the enabled bindings for ``fields`` (all when empty), in catalog order."""
+
+        if not fields:
+            return self.groups
+
+        selected = [item for field in dict.fromkeys(fields) for item in self.by_field.get(field, [])]
+        selected.sort(key=lambda item: self._position[item.point_id])
+        grouped: dict[DataSourceKind, list[PointBinding]] = defaultdict(list)
+        for item in selected:
+            grouped[item.source_type].append(item)
+        return grouped
+
+    def profile_for(self, kind: DataSourceKind, profiles: list[DataSourceProfile]) -> DataSourceProfile | None:
+        """Return the profile serving ``kind``, memoized while ``profiles`` holds the same objects."""
+
+        with self._lock:
+            seen = self._profiles_seen
+            if len(seen) != len(profiles) or any(a is not b for a, b in zip(seen, profiles)):
+                self._profiles_seen = tuple(profiles)
+                self._profiles_resolved = {}
+            if kind not in self._profiles_resolved:
+                self._profiles_resolved[kind] = select_profile(
+                    kind=kind,
+                    preferred_name=self.catalog.source_profile,
+                    profiles=profiles,
+                )
+            return self._profiles_resolved[kind]
+
+    def resolved_profiles(self, exclude: set[DataSourceKind]) -> _ProfileMemo:
+        with self._lock:
+            resolved = {kind: item for kind, item in self._profiles_resolved.items() if kind not in exclude}
+            return self._profiles_seen, resolved
+
+    def seed_profiles(
+        self,
+        seen: tuple[DataSourceProfile, ...],
+        resolved: dict[DataSourceKind, DataSourceProfile | None],
+    ) -> None:
+        with self._lock:
+            self._profiles_seen = seen
+            self._profiles_resolved = dict(resolved)
+
+
+class CatalogIndexCache:
+    """Keep one ``CatalogIndex`` per catalog id, rebuilt when the catalog object changes."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CatalogIndex] = OrderedDict()
+        self._seeds: dict[str, _ProfileMemo] = {}
+        self._lock = threading.Lock()
+
+    def get(self, catalog: PointCatalog) -> CatalogIndex:
+        with self._lock:
+            index = self._entries.get(catalog.catalog_id)
+            if index is not None and index.catalog is catalog:
+                self._entries.move_to_end(catalog.catalog_id)
+                return index
+
+        index = CatalogIndex(catalog)
+        with self._lock:
+            seed = self._seeds.pop(catalog.catalog_id, None)
+        if seed is not None:
+            index.seed_profiles(*seed)
+        with self._lock:
+            self._entries[catalog.catalog_id] = index
+            self._entries.move_to_end(catalog.catalog_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return index
+
+    def invalidate(self, catalog_id: str | None = None, diff: CatalogDiff | None = None) -> None:
+        """Drop cached indexes; with a ``diff`` the next build keeps state for unaffected kinds."""
+
+        with self._lock:
+            if catalog_id is None:
+                self._entries.clear()
+                self._seeds.clear()
+                return
+            index = self._entries.pop(catalog_id, None)
+            self._seeds.pop(catalog_id, None)
+            if index is not None and diff is not None:
+                self._seeds[catalog_id] = index.resolved_profiles(exclude=set(diff.affected_kinds))
+
+
+def select_profile(
+    *,
+    kind: DataSourceKind,
+    preferred_name: str,
+    profiles: list[DataSourceProfile],
+) -> DataSourceProfile | None:
+    kind_profiles = [item for item in profiles if item.kind == kind]
+    if not kind_profiles:
+        return None
+
+    for profile in kind_profiles:
+        if profile.name == preferred_name:
+            return profile
+    return kind_profiles[0]
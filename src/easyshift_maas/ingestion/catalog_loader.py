@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Protocol
 
-import yaml
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from easyshift_maas.core.contracts import (
     CatalogLoadMode,
     DataSourceKind,
+    DataSourceOptions,
     DataSourceProfile,
     FieldDefinition,
     FieldDictionary,
@@ -17,6 +20,14 @@ from easyshift_maas.core.contracts import (
     PointCatalog,
     SceneMetadata,
 )
+from easyshift_maas.ingestion.legacy_scan import (
+    iter_point_entries,
+    load_yaml_text,
+    sanitize_field_name,
+    scan_section_tags,
+)
+
+_BINDINGS_ADAPTER = TypeAdapter(list[PointBinding])
 
 
 class CatalogLoadResult(BaseModel):
@@ -42,7 +53,14 @@ class CatalogLoaderProtocol(Protocol):
 
 
 class YamlCatalogLoader:
-    """Load point catalogs from standard/legacy YAML into canonical contracts."""
+    """Load point catalogs from standard/legacy YAML into canonical contracts.
+
+    ``yaml_path`` may also point at a ``.json`` document or an ``.ndjson``/``.jsonl``
+    file whose first line is the document without bindings and whose remaining
+    lines are one binding each. Results are cached by content digest (files are
+    still read on every call). A cache hit returns the cached result itself, so
+    results are read-only: copy them (``model_copy(deep=True)``) before editing.
+    """
 
     _LEGACY_RESERVED_KEYS = {
         "scene",
@@ -52,6 +70,7 @@ class YamlCatalogLoader:
         "template_override",
         "redis_config",
         "mysql_config",
+        "file_config",
         "historical_data",
         "duration",
         "heartbeat_db",
@@ -66,6 +85,7 @@ class YamlCatalogLoader:
         "real_time_inputs",
         "reference_values_send",
     }
+    _LEGACY_SOURCE_KINDS = {item.value for item in DataSourceKind}
     _LEGACY_SECTION_HINTS = {
         "inputs",
         "real_time_inputs",
@@ -76,6 +96,13 @@ class YamlCatalogLoader:
         "output_var",
     }
 
+    _NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
+    def __init__(self, cache_size: int = 8) -> None:
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[Any, ...], CatalogLoadResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def load(
         self,
         *,
@@ -83,29 +110,69 @@ class YamlCatalogLoader:
         yaml_path: str | None = None,
         mode: CatalogLoadMode = CatalogLoadMode.STANDARD,
     ) -> CatalogLoadResult:
-        payload = self._read_payload(yaml_text=yaml_text, yaml_path=yaml_path)
-        if mode == CatalogLoadMode.STANDARD:
-            return self._load_standard(payload)
-        return self._load_legacy(payload)
-
-    def _read_payload(self, *, yaml_text: str | None, yaml_path: str | None) -> dict[str, Any]:
         if bool(yaml_text) == bool(yaml_path):
             raise ValueError("exactly one of yaml_text or yaml_path must be provided")
 
         if yaml_text is not None:
-            loaded = yaml.safe_load(yaml_text)
+            text, text_format = yaml_text, "text"
+        else:
+            path = Path(str(yaml_path))
+            text = path.read_text(encoding="utf-8")
+            suffix = path.suffix.lower()
+            text_format = "ndjson" if suffix in self._NDJSON_SUFFIXES else "json" if suffix == ".json" else "text"
+
+        # Keyed by content, so an in-place edit that keeps mtime and size still misses.
+        cache_key = None
+        if self._cache_size > 0:
+            cache_key = (hashlib.sha256(text.encode("utf-8")).hexdigest(), text_format, mode.value)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    return cached
+
+        payload = self._read_payload(text, text_format)
+        if mode == CatalogLoadMode.STANDARD:
+            result = self._load_standard(payload)
         else:
-            loaded = yaml.safe_load(Path(str(yaml_path)).read_text(encoding="utf-8"))
+            result = self._load_legacy(payload)
+
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _read_payload(self, text: str, text_format: str) -> dict[str, Any]:
+        if text_format == "ndjson":
+            loaded = self._parse_ndjson(text)
+        elif text_format == "json":
+            loaded = json.loads(text)
+        else:
+            loaded = load_yaml_text(text)
 
         if not isinstance(loaded, dict):
             raise ValueError("yaml root must be a mapping")
         return loaded
 
+    def _parse_ndjson(self, text: str) -> dict[str, Any]:
+        lines = (line for line in text.splitlines() if line.strip())
+        header = json.loads(next(lines, "{}"))
+        if not isinstance(header, dict):
+            raise ValueError("ndjson catalog header must be a mapping")
+        catalog_data = header.setdefault("point_catalog", {})
+        if not isinstance(catalog_data, dict):
+            raise ValueError("ndjson catalog header point_catalog must be a mapping")
+        bindings = catalog_data.setdefault("bindings", [])
+        bindings.extend(json.loads(line) for line in lines)
+        return header
+
     def _load_standard(self, payload: dict[str, Any]) -> CatalogLoadResult:
         warnings: list[str] = []
         pending: list[str] = []
 
-        scene_data = payload.get("scene", {"scene_id": "catalog-scene"})
+        scene_data = dict(payload.get("scene", {"scene_id": "catalog-scene"}))
         if "scene_id" not in scene_data:
             scene_data["scene_id"] = "catalog-scene"
         scene = SceneMetadata.model_validate(scene_data)
@@ -118,33 +185,27 @@ class YamlCatalogLoader:
 
         catalog_data = payload.get("point_catalog", {})
         bindings_raw = catalog_data.get("bindings", [])
-        bindings: list[PointBinding] = []
+        candidates: list[dict[str, Any]] = []
         for idx, item in enumerate(bindings_raw):
             if not isinstance(item, dict):
                 warnings.append(f"invalid binding at index {idx}: expected mapping")
                 continue
             point_id = str(item.get("point_id") or item.get("id") or f"point_{idx}")
-            source_type = str(item.get("source_type") or "redis").lower()
-            source_ref = str(item.get("source_ref") or point_id)
-            field_name = str(item.get("field_name") or self._sanitize_field_name(point_id))
-            unit = str(item.get("unit") or "dimensionless")
             tags = item.get("tags") or []
             transform = item.get("transform")
-            enabled = bool(item.get("enabled", True))
-            try:
-                binding = PointBinding(
-                    point_id=point_id,
-                    source_type=DataSourceKind(source_type),
-                    source_ref=source_ref,
-                    field_name=field_name,
-                    unit=unit,
-                    transform=None if transform is None else str(transform),
-                    enabled=enabled,
-                    tags=[str(tag) for tag in tags] if isinstance(tags, list) else [],
-                )
-                bindings.append(binding)
-            except Exception as exc:  # noqa: BLE001
-                warnings.append(f"invalid binding {point_id}: {exc}")
+            candidates.append(
+                {
+                    "point_id": point_id,
+                    "source_type": str(item.get("source_type") or "redis").lower(),
+                    "source_ref": str(item.get("source_ref") or point_id),
+                    "field_name": str(item.get("field_name") or sanitize_field_name(point_id)),
+                    "unit": str(item.get("unit") or "dimensionless"),
+                    "transform": None if transform is None else str(transform),
+                    "enabled": bool(item.get("enabled", True)),
+                    "tags": [str(tag) for tag in tags] if isinstance(tags, list) else [],
+                }
+            )
+        bindings = self._validate_bindings(candidates, warnings)
 
         if not bindings:
             raise ValueError("point_catalog.bindings cannot be empty in standard mode")
@@ -195,41 +256,44 @@ class YamlCatalogLoader:
 
         profiles = self._parse_legacy_profiles(payload, warnings)
 
-        bindings: list[PointBinding] = []
-        for key, value in payload.items():
-            if key in self._LEGACY_RESERVED_KEYS:
-                continue
-            if self._looks_like_point_entry(key, value):
-                field_name = self._sanitize_field_name(key)
-                source_kind = DataSourceKind.REDIS
-                if isinstance(value, dict):
-                    source_name = str(value.get("source_type") or value.get("provider") or "redis").lower()
-                    source_kind = DataSourceKind(source_name) if source_name in {"redis", "mysql"} else DataSourceKind.REDIS
-                    source_ref = str(value.get("source_ref") or value.get("tag") or value.get("key") or key)
-                    unit = str(value.get("unit") or "dimensionless")
-                    tags = value.get("tags") or []
-                    transform = value.get("transform")
-                else:
-                    source_ref = str(value) if isinstance(value, str) and value else key
-                    unit = "dimensionless"
-                    tags = []
-                    transform = None
-
-                bindings.append(
-                    PointBinding(
-                        point_id=str(key),
-                        source_type=source_kind,
-                        source_ref=source_ref,
-                        field_name=field_name,
-                        unit=unit,
-                        transform=None if transform is None else str(transform),
-                        enabled=True,
-                        tags=[str(item) for item in tags] if isinstance(tags, list) else [],
-                    )
-                )
+        candidates: list[dict[str, Any]] = []
+        for key, value in iter_point_entries(payload, self._LEGACY_RESERVED_KEYS):
+            field_name = sanitize_field_name(key)
+            source_kind = DataSourceKind.REDIS
+            if isinstance(value, dict):
+                source_name = str(value.get("source_type") or value.get("provider") or "redis").lower()
+                source_kind = DataSourceKind(source_name) if source_name in self._LEGACY_SOURCE_KINDS else DataSourceKind.REDIS
+                source_ref = str(value.get("source_ref") or value.get("tag") or value.get("key") or key)
+                unit = str(value.get("unit") or "dimensionless")
+                tags = value.get("tags") or []
+                transform = value.get("transform")
+            else:
+                source_ref = str(value) if isinstance(value, str) and value else key
+                unit = "dimensionless"
+                tags = []
+                transform = None
+
+            candidates.append(
+                {
+                    "point_id": str(key),
+                    "source_type": source_kind,
+                    "source_ref": source_ref,
+                    "field_name": field_name,
+                    "unit": unit,
+                    "transform": None if transform is None else str(transform),
+                    "enabled": True,
+                    "tags": [str(item) for item in tags] if isinstance(tags, list) else [],
+                }
+            )
+        bindings = _BINDINGS_ADAPTER.validate_python(candidates)
 
         if not bindings:
-            bindings = self._extract_from_nested_inputs(payload)
+            bindings = _BINDINGS_ADAPTER.validate_python(
+                [
+                    {"point_id": point_id, "source_type": DataSourceKind.REDIS, "source_ref": tag, "field_name": field_name}
+                    for point_id, field_name, tag in scan_section_tags(payload, self._LEGACY_SECTION_HINTS)
+                ]
+            )
             if bindings:
                 warnings.append(
                     "legacy fallback parser used nested sections and auto-mapped point tags"
@@ -311,6 +375,18 @@ class YamlCatalogLoader:
             )
             warnings.append("legacy mysql_config detected; using conn_ref=env:REFLEXFLOW_MYSQL_CONN")
 
+        file_config = payload.get("file_config")
+        if isinstance(file_config, dict) and file_config.get("path"):
+            profiles.append(
+                DataSourceProfile(
+                    name="legacy-file",
+                    kind=DataSourceKind.FILE,
+                    conn_ref="env:REFLEXFLOW_FILE_CONN",
+                    options=DataSourceOptions(file_path=str(file_config["path"])),
+                )
+            )
+            warnings.append("legacy file_config detected; serving points from a recorded file")
+
         if not profiles:
             profiles.append(
                 DataSourceProfile(
@@ -342,78 +418,21 @@ class YamlCatalogLoader:
             seen.add(binding.field_name)
         return FieldDictionary(fields=fields)
 
-    def _extract_from_nested_inputs(self, payload: dict[str, Any]) -> list[PointBinding]:
-        bindings: list[PointBinding] = []
-        for section_name, section in payload.items():
-            if not isinstance(section, dict):
-                continue
-            if section_name not in self._LEGACY_SECTION_HINTS and not self._section_looks_like_points(section):
-                continue
+    def _validate_bindings(self, candidates: list[dict[str, Any]], warnings: list[str]) -> list[PointBinding]:
+        try:
+            return _BINDINGS_ADAPTER.validate_python(candidates)
+        except ValidationError:
+            pass
 
-            for key, value in section.items():
-                if isinstance(value, str) and self._value_looks_like_point_tag(value):
-                    point_id = f"{section_name}:{key}"
-                    field_name = self._sanitize_field_name(key)
-                    bindings.append(
-                        PointBinding(
-                            point_id=point_id,
-                            source_type=DataSourceKind.REDIS,
-                            source_ref=value,
-                            field_name=field_name,
-                            unit="dimensionless",
-                        )
-                    )
-                elif isinstance(value, list):
-                    for idx, item in enumerate(value):
-                        if not isinstance(item, str) or not self._value_looks_like_point_tag(item):
-                            continue
-                        point_id = f"{section_name}:{key}:{idx}"
-                        field_name = self._sanitize_field_name(f"{key}_{idx}")
-                        bindings.append(
-                            PointBinding(
-                                point_id=point_id,
-                                source_type=DataSourceKind.REDIS,
-                                source_ref=item,
-                                field_name=field_name,
-                                unit="dimensionless",
-                            )
-                        )
+        # Slow path only when something is invalid, to report each bad binding.
+        bindings: list[PointBinding] = []
+        for item in candidates:
+            try:
+                bindings.append(PointBinding.model_validate(item))
+            except Exception as exc:  # noqa: BLE001
+                warnings.append(f"invalid binding {item['point_id']}: {exc}")
         return bindings
 
-    def _sanitize_field_name(self, raw: str) -> str:
-        name = re.sub(r"[^a-zA-Z0-9]+", "_", raw).strip("_").lower()
-        return name or "field"
-
-    def _looks_like_point_entry(self, key: str, value: Any) -> bool:
-        if isinstance(value, dict):
-            if any(name in value for name in ("source_ref", "field_name", "tag", "key")):
-                return True
-        if isinstance(value, str) and value:
-            if self._value_looks_like_point_tag(value):
-                return True
-            return bool(re.search(r"[A-Z]{2,}[0-9]", key)) or key.isupper()
-        return False
-
-    def _section_looks_like_points(self, section: dict[str, Any]) -> bool:
-        if not section:
-            return False
-        total = len(section)
-        tag_like = 0
-        for value in section.values():
-            if isinstance(value, str) and self._value_looks_like_point_tag(value):
-                tag_like += 1
-            elif isinstance(value, list):
-                if any(isinstance(item, str) and self._value_looks_like_point_tag(item) for item in value):
-                    tag_like += 1
-        return tag_like >= max(3, int(total * 0.3))
-
-    def _value_looks_like_point_tag(self, value: str) -> bool:
-        text = value.strip()
-        if not text:
-            return False
-        # Industrial tags are usually uppercase/digit/underscore mixed codes.
-        return bool(re.fullmatch(r"[A-Za-z0-9_:-]{4,}", text)) and bool(re.search(r"[A-Z]", text))
-
     def _deduplicate_binding_ids(self, bindings: list[PointBinding], warnings: list[str]) -> list[PointBinding]:
         deduped: list[PointBinding] = []
         used: dict[str, int] = {}
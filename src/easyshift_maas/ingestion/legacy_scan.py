@@ -0,0 +1,139 @@
+"""YAML parsing and legacy point discovery, shared by the catalog loader and parser agent."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator
+
+import yaml
+
+# libyaml's loader is several times faster; fall back to the pure-Python one when absent.
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_TAG_PATTERN = re.compile(r"[A-Za-z0-9_:-]{4,}")
+_UPPERCASE = re.compile(r"[A-Z]")
+_CODE_KEY = re.compile(r"[A-Z]{2,}[0-9]")
+_ALNUM_KEY = re.compile(r"[A-Za-z].*\d|\d.*[A-Za-z]")
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]+")
+_ENTRY_MARKERS = ("source_ref", "field_name", "tag", "key")
+
+
+def load_yaml_text(text: str) -> Any:
+    """Parse a YAML (or JSON) document, trying the JSON parser first for ``{``-prefixed text."""
+
+    if text.lstrip().startswith("{"):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return yaml.load(text, Loader=_SAFE_LOADER)
+
+
+def sanitize_field_name(raw: str) -> str:
+    name = _NON_ALNUM.sub("_", raw).strip("_").lower()
+    return name or "field"
+
+
+def is_point_tag(value: str) -> bool:
+    text = value.strip()
+    if not text:
+        return False
+    # Industrial tags are usually uppercase/digit/underscore mixed codes.
+    return bool(_TAG_PATTERN.fullmatch(text)) and bool(_UPPERCASE.search(text))
+
+
+def is_point_entry(key: str, value: Any) -> bool:
+    """Top-level legacy entry that maps a point name to a tag or a binding spec."""
+
+    if isinstance(value, dict):
+        if any(name in value for name in _ENTRY_MARKERS):
+            return True
+    if isinstance(value, str) and value:
+        if is_point_tag(value):
+            return True
+        return bool(_CODE_KEY.search(key)) or key.isupper()
+    return False
+
+
+def iter_point_entries(payload: dict[str, Any], skip_keys: frozenset[str] | set[str]) -> Iterator[tuple[Any, Any]]:
+    """Top-level ``(key, value)`` pairs of ``payload`` that pass :func:`is_point_entry`."""
+
+    for key, value in payload.items():
+        if key not in skip_keys and is_point_entry(key, value):
+            yield key, value
+
+
+def is_point_key(key: str, value: Any) -> bool:
+    """Looser check used for mapping hints: any key that reads like a point name."""
+
+    if isinstance(value, (int, float)):
+        return False
+    if isinstance(value, str) and len(value) <= 3:
+        return False
+    if _ALNUM_KEY.search(key):
+        return True
+    if "_" in key and len(key) >= 4:
+        return True
+    return False
+
+
+def iter_mapping_items(payload: Any, skip_keys: frozenset[str] | set[str]) -> Iterator[tuple[Any, Any]]:
+    """Yield every ``(key, value)`` of every nested mapping, skipping ``skip_keys`` subtrees.
+
+    Uses an explicit stack, so arbitrarily deep configs do not hit the recursion limit.
+    """
+
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in skip_keys:
+                    continue
+                yield key, value
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
+def collect_point_keys(payload: Any, skip_keys: frozenset[str] | set[str]) -> set[str]:
+    return {str(key) for key, value in iter_mapping_items(payload, skip_keys) if is_point_key(key, value)}
+
+
+def scan_section_tags(payload: dict[str, Any], section_hints: frozenset[str] | set[str]) -> list[tuple[str, str, str]]:
+    """Find point tags inside grouped sections (``inputs: {name: TAG}``).
+
+    Returns ``(point_id, field_name, source_ref)`` in document order. A section is
+    used when its name is a known hint or when enough of its entries carry tags.
+    """
+
+    found: list[tuple[str, str, str]] = []
+    for section_name, section in payload.items():
+        if not isinstance(section, dict) or not section:
+            continue
+
+        # (key, list index or None, tag); field names are derived only for accepted sections.
+        candidates: list[tuple[Any, int | None, str]] = []
+        tagged_keys = 0
+        for key, value in section.items():
+            if isinstance(value, str):
+                if is_point_tag(value):
+                    tagged_keys += 1
+                    candidates.append((key, None, value))
+            elif isinstance(value, list):
+                before = len(candidates)
+                for idx, item in enumerate(value):
+                    if isinstance(item, str) and is_point_tag(item):
+                        candidates.append((key, idx, item))
+                if len(candidates) > before:
+                    tagged_keys += 1
+
+        if section_name not in section_hints and tagged_keys < max(3, int(len(section) * 0.3)):
+            continue
+        for key, idx, tag in candidates:
+            if idx is None:
+                found.append((f"{section_name}:{key}", sanitize_field_name(key), tag))
+            else:
+                found.append((f"{section_name}:{key}:{idx}", sanitize_field_name(f"{key}_{idx}"), tag))
+    return found
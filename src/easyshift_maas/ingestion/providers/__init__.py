@@ -1,4 +1,5 @@
+from easyshift_maas.ingestion.providers.file_provider import FileSnapshotProvider
 from easyshift_maas.ingestion.providers.mysql_provider import MySQLSnapshotProvider
 from easyshift_maas.ingestion.providers.redis_provider import RedisSnapshotProvider
 
-__all__ = ["RedisSnapshotProvider", "MySQLSnapshotProvider"]
+__all__ = ["RedisSnapshotProvider", "MySQLSnapshotProvider", "FileSnapshotProvider"]
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import mmap
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol, Sequence
+
+from easyshift_maas.core.contracts import (
+    DataSourceKind,
+    DataSourceProfile,
+    FileSourceFormat,
+    PointBinding,
+    SnapshotRequest,
+    SnapshotResult,
+    SnapshotWindow,
+    SnapshotWindowRequest,
+)
+from easyshift_maas.ingestion.snapshot_provider import WindowAccumulator, apply_transform, to_epoch_seconds
+from easyshift_maas.security.secrets import SecretResolverProtocol
+
+
+class FileRecording(Protocol):
+    """Wide-format recording: one timestamp column plus one column per source_ref."""
+
+    timestamps: Sequence[float]
+
+    def has_column(self, name: str) -> bool: ...
+
+    def value(self, name: str, row: int) -> float | None: ...
+
+
+class CsvRecording:
+    """CSV recording parsed from a memory map into compact ``array('d')`` columns."""
+
+    def __init__(self, path: Path, ts_column: str) -> None:
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            reader = csv.reader(io.TextIOWrapper(io.BufferedReader(_MmapReader(mapped)), encoding="utf-8", newline=""))
+            header = next(reader, None)
+            if not header or ts_column not in header:
+                raise ValueError(f"csv recording must have a '{ts_column}' column: {path}")
+            ts_idx = header.index(ts_column)
+            names = [name for idx, name in enumerate(header) if idx != ts_idx]
+            columns = [array("d") for _ in names]
+            timestamps = array("d")
+            for row in reader:
+                if not row:
+                    continue
+                timestamps.append(to_epoch_seconds(row[ts_idx]))
+                cells = row[:ts_idx] + row[ts_idx + 1 :]
+                for column, cell in zip(columns, cells):
+                    column.append(_parse_cell(cell))
+                for column in columns[len(cells) :]:
+                    column.append(math.nan)
+
+        _require_sorted(timestamps, path)
+        self.timestamps = timestamps
+        self._columns = dict(zip(names, columns))
+
+    def has_column(self, name: str) -> bool:
+        return name in self._columns
+
+    def value(self, name: str, row: int) -> float | None:
+        raw = self._columns[name][row]
+        return None if math.isnan(raw) else raw
+
+
+class NpyRecording:
+    """2-D ``.npy`` recording opened with ``mmap_mode='r'``.
+
+    Column names come from a ``<file>.columns.json`` sidecar; the first column holds
+    epoch-second timestamps.
+    """
+
+    def __init__(self, path: Path, ts_column: str) -> None:
+        import numpy  # type: ignore
+
+        sidecar = path.with_name(f"{path.name}.columns.json")
+        if not sidecar.exists():
+            raise FileNotFoundError(sidecar)
+        names = json.loads(sidecar.read_text(encoding="utf-8"))
+        self._data = numpy.load(path, mmap_mode="r")
+        if self._data.ndim != 2 or self._data.shape[1] != len(names):
+            raise ValueError(f"npy recording shape {self._data.shape} does not match {len(names)} columns")
+        if ts_column not in names:
+            raise ValueError(f"npy recording must have a '{ts_column}' column: {path}")
+        self._index = {name: idx for idx, name in enumerate(names) if name != ts_column}
+        self.timestamps = self._data[:, names.index(ts_column)]
+        if bool(numpy.any(numpy.diff(self.timestamps) < 0)):
+            raise ValueError(f"recording timestamps must be in ascending order: {path}")
+
+    def has_column(self, name: str) -> bool:
+        return name in self._index
+
+    def value(self, name: str, row: int) -> float | None:
+        raw = float(self._data[row, self._index[name]])
+        return None if math.isnan(raw) else raw
+
+
+class ParquetRecording:
+    """Parquet recording read through a memory-mapped Arrow table."""
+
+    def __init__(self, path: Path, ts_column: str) -> None:
+        import pyarrow.parquet as pq  # type: ignore
+
+        self._table = pq.read_table(path, memory_map=True)
+        if ts_column not in self._table.column_names:
+            raise ValueError(f"parquet recording must have a '{ts_column}' column: {path}")
+        self._names = {name for name in self._table.column_names if name != ts_column}
+        self.timestamps = array("d", (to_epoch_seconds(item) for item in self._table.column(ts_column).to_pylist()))
+        _require_sorted(self.timestamps, path)
+
+    def has_column(self, name: str) -> bool:
+        return name in self._names
+
+    def value(self, name: str, row: int) -> float | None:
+        raw = self._table.column(name)[row].as_py()
+        if raw is None:
+            return None
+        parsed = float(raw)
+        return None if math.isnan(parsed) else parsed
+
+
+_RECORDING_TYPES: dict[FileSourceFormat, type] = {
+    FileSourceFormat.CSV: CsvRecording,
+    FileSourceFormat.NPY: NpyRecording,
+    FileSourceFormat.PARQUET: ParquetRecording,
+}
+
+
+class FileSnapshotProvider:
+    """Serve snapshots and history windows from recorded CSV/Parquet/NPY files.
+
+    The recording path is ``options.file_path`` or the ``path`` key of the resolved
+    ``conn_ref``. Recordings are opened once and reused until the file changes.
+    """
+
+    kind = DataSourceKind.FILE
+
+    def __init__(self) -> None:
+        self._recordings: dict[str, tuple[int, int, FileRecording]] = {}
+        self._lock = threading.Lock()
+
+    def fetch_bindings(
+        self,
+        bindings: list[PointBinding],
+        profile: DataSourceProfile,
+        request: SnapshotRequest,
+        secret_resolver: SecretResolverProtocol,
+    ) -> SnapshotResult:
+        started = time.perf_counter()
+        values: dict[str, float] = {}
+        quality_flags: dict[str, str] = {}
+        missing_fields: list[str] = []
+        value_timestamps: dict[str, datetime] = {}
+
+        try:
+            recording = self._open(profile, secret_resolver)
+        except Exception as exc:  # noqa: BLE001
+            latency = int((time.perf_counter() - started) * 1000)
+            return SnapshotResult(
+                values=values,
+                quality_flags={item.field_name: _error_flag(exc) for item in bindings},
+                missing_fields=sorted({item.field_name for item in bindings}),
+                source_latency_ms={"file": latency},
+            )
+
+        timestamps = recording.timestamps
+        if request.at is None:
+            row = len(timestamps) - 1
+        else:
+            row = bisect_right(timestamps, to_epoch_seconds(request.at)) - 1
+
+        for item in bindings:
+            if row < 0 or not recording.has_column(item.source_ref):
+                missing_fields.append(item.field_name)
+                quality_flags[item.field_name] = "missing"
+                continue
+            raw = recording.value(item.source_ref, row)
+            if raw is None:
+                missing_fields.append(item.field_name)
+                quality_flags[item.field_name] = "missing"
+                continue
+            try:
+                values[item.field_name] = apply_transform(raw, item.transform)
+                quality_flags[item.field_name] = "ok"
+                value_timestamps[item.field_name] = datetime.fromtimestamp(float(timestamps[row]), tz=timezone.utc)
+            except Exception as exc:  # noqa: BLE001
+                missing_fields.append(item.field_name)
+                quality_flags[item.field_name] = f"transform_error:{exc}"
+
+        latency = int((time.perf_counter() - started) * 1000)
+        return SnapshotResult(
+            values=values,
+            quality_flags=quality_flags,
+            missing_fields=sorted(set(missing_fields)),
+            source_latency_ms={"file": latency},
+            value_timestamps=value_timestamps,
+        )
+
+    def fetch_window_bindings(
+        self,
+        bindings: list[PointBinding],
+        profile: DataSourceProfile,
+        request: SnapshotWindowRequest,
+        secret_resolver: SecretResolverProtocol,
+    ) -> SnapshotWindow:
+        started = time.perf_counter()
+        accumulator = WindowAccumulator(bindings, request)
+
+        try:
+            recording = self._open(profile, secret_resolver)
+        except Exception as exc:  # noqa: BLE001
+            accumulator.quality_flags.update({item.field_name: _error_flag(exc) for item in bindings})
+            return accumulator.result("file", int((time.perf_counter() - started) * 1000))
+
+        timestamps = recording.timestamps
+        lower = bisect_right(timestamps, to_epoch_seconds(request.start) - request.step_sec)
+        upper = bisect_right(timestamps, to_epoch_seconds(request.end))
+        for source_ref in accumulator.source_refs:
+            if not recording.has_column(source_ref):
+                continue
+            for row in range(lower, upper):
+                raw = recording.value(source_ref, row)
+                if raw is not None:
+                    accumulator.add(source_ref, float(timestamps[row]), raw)
+
+        return accumulator.result("file", int((time.perf_counter() - started) * 1000))
+
+    def _open(self, profile: DataSourceProfile, secret_resolver: SecretResolverProtocol) -> FileRecording:
+        raw_path = profile.options.file_path
+        if raw_path is None:
+            raw_path = secret_resolver.resolve(profile.conn_ref).get("path")
+        if not raw_path:
+            raise ValueError("file data source requires options.file_path or a conn_ref with 'path'")
+
+        path = Path(str(raw_path))
+        stat = path.stat()
+        fmt = profile.options.file_format or _infer_format(path)
+        key = f"{path.resolve()}:{fmt.value}:{profile.options.file_ts_column}"
+
+        with self._lock:
+            cached = self._recordings.get(key)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+        recording = _RECORDING_TYPES[fmt](path, profile.options.file_ts_column)
+        with self._lock:
+            self._recordings[key] = (stat.st_mtime_ns, stat.st_size, recording)
+        return recording
+
+
+class _MmapReader(io.RawIOBase):
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._mapped.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def _infer_format(path: Path) -> FileSourceFormat:
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix in {"csv", "txt"}:
+        return FileSourceFormat.CSV
+    if suffix in {"parquet", "pq"}:
+        return FileSourceFormat.PARQUET
+    if suffix == "npy":
+        return FileSourceFormat.NPY
+    raise ValueError(f"cannot infer file format from suffix: {path.suffix}")
+
+
+def _require_sorted(timestamps: Sequence[float], path: Path) -> None:
+    # Row lookups bisect the timestamp column, so an unsorted recording would silently
+    # serve the wrong rows.
+    for row in range(1, len(timestamps)):
+        if timestamps[row] < timestamps[row - 1]:
+            raise ValueError(f"recording timestamps must be in ascending order: {path} (row {row})")
+
+
+def _parse_cell(cell: str) -> float:
+    text = cell.strip()
+    if not text:
+        return math.nan
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _error_flag(exc: Exception) -> str:
+    if isinstance(exc, ImportError):
+        return f"file_dependency_missing:{exc.name or 'unknown'}"
+    return f"file_error:{type(exc).__name__}"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import time
+from datetime import timedelta
 from typing import Any
 
 from easyshift_maas.core.contracts import (
@@ -10,8 +11,10 @@ from easyshift_maas.core.contracts import (
     PointBinding,
     SnapshotRequest,
     SnapshotResult,
+    SnapshotWindow,
+    SnapshotWindowRequest,
 )
-from easyshift_maas.ingestion.snapshot_provider import apply_transform
+from easyshift_maas.ingestion.snapshot_provider import WindowAccumulator, apply_transform
 from easyshift_maas.security.secrets import SecretResolverProtocol
 
 
@@ -45,13 +48,6 @@ class MySQLSnapshotProvider:
             )
 
         try:
-            conn = secret_resolver.resolve(profile.conn_ref)
-            host = str(conn.get("host", "127.0.0.1"))
-            port = int(conn.get("port", 3306))
-            user = str(conn.get("user", "root"))
-            password = str(conn.get("password", ""))
-            database = str(conn.get("database", conn.get("db", "")))
-
             table = self._ident(profile.options.mysql_table)
             point_col = self._ident(profile.options.mysql_point_column)
             value_col = self._ident(profile.options.mysql_value_column)
@@ -70,22 +66,12 @@ class MySQLSnapshotProvider:
                 query += f" AND {ts_col} <= %s"
                 args.append(request.at)
 
-            ssl_options = None
-            if profile.options.tls:
-                ssl_options = {"ssl": {}}
-
             by_point: dict[str, float] = {}
-            connection = pymysql.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=database,
-                connect_timeout=max(1, int(profile.options.timeout_ms / 1000)),
-                read_timeout=max(1, int(profile.options.timeout_ms / 1000)),
-                write_timeout=max(1, int(profile.options.timeout_ms / 1000)),
+            connection = self._connect(
+                pymysql,
+                profile,
+                secret_resolver.resolve(profile.conn_ref),
                 cursorclass=pymysql.cursors.Cursor,
-                **(ssl_options or {}),
             )
 
             try:
@@ -129,6 +115,88 @@ class MySQLSnapshotProvider:
             source_latency_ms={"mysql": latency},
         )
 
+    def fetch_window_bindings(
+        self,
+        bindings: list[PointBinding],
+        profile: DataSourceProfile,
+        request: SnapshotWindowRequest,
+        secret_resolver: SecretResolverProtocol,
+    ) -> SnapshotWindow:
+        started = time.perf_counter()
+        accumulator = WindowAccumulator(bindings, request)
+
+        def failed(flag: str) -> SnapshotWindow:
+            accumulator.quality_flags.update({item.field_name: flag for item in bindings})
+            return accumulator.result("mysql", int((time.perf_counter() - started) * 1000))
+
+        if profile.options.mysql_ts_column is None:
+            return failed("mysql_ts_column_missing")
+
+        try:
+            import pymysql  # type: ignore
+        except Exception:  # noqa: BLE001
+            return failed("mysql_dependency_missing")
+
+        try:
+            table = self._ident(profile.options.mysql_table)
+            point_col = self._ident(profile.options.mysql_point_column)
+            value_col = self._ident(profile.options.mysql_value_column)
+            ts_col = self._ident(profile.options.mysql_ts_column)
+
+            source_refs = accumulator.source_refs
+            placeholders = ",".join(["%s"] * len(source_refs))
+            query = (
+                f"SELECT {point_col}, {ts_col}, {value_col} FROM {table} "
+                f"WHERE {point_col} IN ({placeholders}) AND {ts_col} > %s AND {ts_col} <= %s "
+                f"ORDER BY {ts_col}"
+            )
+            args: list[Any] = [*source_refs, request.start - timedelta(seconds=request.step_sec), request.end]
+
+            # Server-side cursor: rows are streamed in fixed-size chunks instead of
+            # materializing the whole history on the client.
+            connection = self._connect(
+                pymysql,
+                profile,
+                secret_resolver.resolve(profile.conn_ref),
+                cursorclass=pymysql.cursors.SSCursor,
+            )
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, args)
+                    while True:
+                        rows = cursor.fetchmany(profile.options.batch_size)
+                        if not rows:
+                            break
+                        for point_id, ts, raw_value in rows:
+                            parsed = self._to_float(raw_value)
+                            if parsed is not None and ts is not None:
+                                accumulator.add(str(point_id), ts, parsed)
+            finally:
+                connection.close()
+        except Exception as exc:  # noqa: BLE001
+            return failed(f"mysql_error:{type(exc).__name__}")
+
+        return accumulator.result("mysql", int((time.perf_counter() - started) * 1000))
+
+    def _connect(self, pymysql: Any, profile: DataSourceProfile, conn: dict[str, Any], *, cursorclass: Any) -> Any:
+        ssl_options = None
+        if profile.options.tls:
+            ssl_options = {"ssl": {}}
+
+        timeout_s = max(1, int(profile.options.timeout_ms / 1000))
+        return pymysql.connect(
+            host=str(conn.get("host", "127.0.0.1")),
+            port=int(conn.get("port", 3306)),
+            user=str(conn.get("user", "root")),
+            password=str(conn.get("password", "")),
+            database=str(conn.get("database", conn.get("db", ""))),
+            connect_timeout=timeout_s,
+            read_timeout=timeout_s,
+            write_timeout=timeout_s,
+            cursorclass=cursorclass,
+            **(ssl_options or {}),
+        )
+
     def _ident(self, value: str) -> str:
         if not self._IDENTIFIER_RE.match(value):
             raise ValueError(f"invalid SQL identifier: {value}")
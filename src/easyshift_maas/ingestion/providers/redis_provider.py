@@ -1,22 +1,179 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Callable
 
 from easyshift_maas.core.contracts import (
     DataSourceKind,
     DataSourceProfile,
     PointBinding,
+    RedisSubscriptionMode,
     SnapshotRequest,
     SnapshotResult,
+    now_utc,
 )
+from easyshift_maas.core.hashing import canonical_digest
 from easyshift_maas.ingestion.snapshot_provider import apply_transform
 from easyshift_maas.security.secrets import SecretResolverProtocol
 
+RedisClientFactory = Callable[[DataSourceProfile, dict[str, Any]], Any]
+
+
+class RedisPointMirror:
+    """Local copy of point values kept current by keyspace notifications or a stream.
+
+    Keys are loaded with ``MGET`` the first time they are requested. After that only
+    keys reported as changed are re-read (keyspace mode) or the new value is taken
+    straight from the stream entry (stream mode). Notifications are drained at read
+    time, so no background thread is needed.
+    """
+
+    _STREAM_READ_COUNT = 1000
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        mode: RedisSubscriptionMode,
+        db: int = 0,
+        stream_key: str | None = None,
+    ) -> None:
+        if mode == RedisSubscriptionMode.STREAM and not stream_key:
+            raise ValueError("redis_stream_key is required for stream subscription mode")
+        self._client = client
+        self._mode = mode
+        self._channel_prefix = f"__keyspace@{db}__:"
+        self._stream_key = stream_key
+        self._stream_last_id: str | None = None
+        self._pubsub: Any = None
+        self._values: dict[str, Any] = {}
+        self._updated_at: dict[str, datetime] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+
+    def read(self, keys: list[str], batch_size: int) -> dict[str, tuple[Any, datetime]]:
+        with self._lock:
+            self._drain()
+            self._watch([key for key in keys if key not in self._values])
+
+            stale = [key for key in keys if key not in self._values or key in self._dirty]
+            for idx in range(0, len(stale), batch_size):
+                chunk = stale[idx : idx + batch_size]
+                loaded_at = now_utc()
+                for key, raw in zip(chunk, self._client.mget(chunk)):
+                    self._values[key] = raw
+                    self._updated_at[key] = loaded_at
+                    self._dirty.discard(key)
+
+            return {key: (self._values[key], self._updated_at[key]) for key in keys}
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_pubsub()
+            close_client = getattr(self._client, "close", None)
+            if close_client is not None:
+                try:
+                    close_client()
+                except Exception:  # noqa: BLE001
+                    pass
+
+    def _watch(self, new_keys: list[str]) -> None:
+        # Subscribe before the initial MGET so no change between the two is lost.
+        if self._mode == RedisSubscriptionMode.KEYSPACE:
+            if not new_keys:
+                return
+            if self._pubsub is None:
+                self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(*[f"{self._channel_prefix}{key}" for key in new_keys])
+        elif self._stream_last_id is None:
+            latest = self._client.xrevrange(self._stream_key, count=1)
+            self._stream_last_id = self._decode(latest[0][0]) if latest else "0-0"
+
+    def _drain(self) -> None:
+        try:
+            if self._mode == RedisSubscriptionMode.KEYSPACE:
+                self._drain_keyspace()
+            else:
+                self._drain_stream()
+        except Exception:  # noqa: BLE001
+            # Lost notifications cannot be replayed; fall back to a full re-read.
+            self._resync()
+
+    def _drain_keyspace(self) -> None:
+        if self._pubsub is None:
+            return
+        while True:
+            message = self._pubsub.get_message(timeout=0.0)
+            if message is None:
+                return
+            if message.get("type") != "message":
+                continue
+            channel = self._decode(message.get("channel"))
+            if channel.startswith(self._channel_prefix):
+                self._dirty.add(channel[len(self._channel_prefix) :])
+
+    def _drain_stream(self) -> None:
+        if self._stream_last_id is None:
+            return
+        while True:
+            response = self._client.xread({self._stream_key: self._stream_last_id}, count=self._STREAM_READ_COUNT)
+            if not response:
+                return
+            entries = response[0][1]
+            if not entries:
+                return
+            for entry_id, fields in entries:
+                entry_id = self._decode(entry_id)
+                observed_at = self._stream_entry_time(entry_id)
+                for raw_key, raw_value in fields.items():
+                    key = self._decode(raw_key)
+                    if key not in self._values:
+                        continue
+                    self._values[key] = raw_value
+                    self._updated_at[key] = observed_at
+                    self._dirty.discard(key)
+                self._stream_last_id = entry_id
+
+    def _resync(self) -> None:
+        self._close_pubsub()
+        self._values.clear()
+        self._updated_at.clear()
+        self._dirty.clear()
+        self._stream_last_id = None
+
+    def _close_pubsub(self) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            self._pubsub.close()
+        except Exception:  # noqa: BLE001
+            pass
+        self._pubsub = None
+
+    def _stream_entry_time(self, entry_id: str) -> datetime:
+        try:
+            millis = int(entry_id.split("-", 1)[0])
+        except ValueError:
+            return now_utc()
+        return datetime.fromtimestamp(millis / 1000.0, tz=timezone.utc)
+
+    def _decode(self, raw: Any) -> str:
+        if isinstance(raw, bytes):
+            return raw.decode("utf-8", errors="ignore")
+        return str(raw)
+
 
 class RedisSnapshotProvider:
     kind = DataSourceKind.REDIS
 
+    def __init__(self, client_factory: RedisClientFactory | None = None) -> None:
+        self._client_factory = client_factory
+        # Mirror key -> (digest of the resolved connection, mirror).
+        self._mirrors: dict[str, tuple[str, RedisPointMirror]] = {}
+        self._mirrors_lock = threading.Lock()
+
     def fetch_bindings(
         self,
         bindings: list[PointBinding],
@@ -28,57 +185,52 @@ class RedisSnapshotProvider:
         values: dict[str, float] = {}
         quality_flags: dict[str, str] = {}
         missing_fields: list[str] = []
+        value_timestamps: dict[str, datetime] = {}
 
-        try:
-            import redis  # type: ignore
-        except Exception:  # noqa: BLE001
-            latency = int((time.perf_counter() - started) * 1000)
-            return SnapshotResult(
-                values=values,
-                quality_flags={item.field_name: "redis_dependency_missing" for item in bindings},
-                missing_fields=[item.field_name for item in bindings],
-                source_latency_ms={"redis": latency},
-            )
+        factory = self._client_factory
+        if factory is None:
+            try:
+                import redis  # type: ignore
+            except Exception:  # noqa: BLE001
+                latency = int((time.perf_counter() - started) * 1000)
+                return SnapshotResult(
+                    values=values,
+                    quality_flags={item.field_name: "redis_dependency_missing" for item in bindings},
+                    missing_fields=[item.field_name for item in bindings],
+                    source_latency_ms={"redis": latency},
+                )
 
-        try:
-            conn = secret_resolver.resolve(profile.conn_ref)
-            host = str(conn.get("host", "127.0.0.1"))
-            port = int(conn.get("port", 6379))
-            db = int(conn.get("db", 0))
-            password = conn.get("password")
-            client = redis.Redis(
-                host=host,
-                port=port,
-                db=db,
-                password=password,
-                ssl=bool(profile.options.tls or conn.get("tls", False)),
-                socket_timeout=profile.options.timeout_ms / 1000.0,
-                decode_responses=False,
-            )
+            def factory(profile: DataSourceProfile, conn: dict[str, Any]) -> Any:
+                return redis.Redis(
+                    host=str(conn.get("host", "127.0.0.1")),
+                    port=int(conn.get("port", 6379)),
+                    db=int(conn.get("db", 0)),
+                    password=conn.get("password"),
+                    ssl=bool(profile.options.tls or conn.get("tls", False)),
+                    socket_timeout=profile.options.timeout_ms / 1000.0,
+                    decode_responses=False,
+                )
 
+        try:
             batch_size = profile.options.batch_size
-            for idx in range(0, len(bindings), batch_size):
-                chunk = bindings[idx : idx + batch_size]
-                keys = [item.source_ref for item in chunk]
-                raw_values = client.mget(keys)
-                for item, raw in zip(chunk, raw_values):
-                    if raw is None:
-                        missing_fields.append(item.field_name)
-                        quality_flags[item.field_name] = "missing"
-                        continue
-
-                    parsed = self._to_float(raw)
-                    if parsed is None:
-                        missing_fields.append(item.field_name)
-                        quality_flags[item.field_name] = "parse_error"
-                        continue
-
-                    try:
-                        values[item.field_name] = apply_transform(parsed, item.transform)
-                        quality_flags[item.field_name] = "ok"
-                    except Exception as exc:  # noqa: BLE001
-                        missing_fields.append(item.field_name)
-                        quality_flags[item.field_name] = f"transform_error:{exc}"
+            if profile.options.redis_subscription != RedisSubscriptionMode.POLL and request.at is None:
+                mirror = self._get_mirror(profile, request, secret_resolver, factory)
+                mirrored = mirror.read([item.source_ref for item in bindings], batch_size)
+                for item in bindings:
+                    raw, observed_at = mirrored[item.source_ref]
+                    if self._apply_raw(item, raw, values, quality_flags, missing_fields):
+                        value_timestamps[item.field_name] = observed_at
+            else:
+                conn = secret_resolver.resolve(profile.conn_ref)
+                client = factory(profile, conn)
+                for idx in range(0, len(bindings), batch_size):
+                    chunk = bindings[idx : idx + batch_size]
+                    keys = [item.source_ref for item in chunk]
+                    raw_values = client.mget(keys)
+                    read_at = now_utc()
+                    for item, raw in zip(chunk, raw_values):
+                        if self._apply_raw(item, raw, values, quality_flags, missing_fields):
+                            value_timestamps[item.field_name] = read_at
         except Exception as exc:  # noqa: BLE001
             for item in bindings:
                 if item.field_name not in quality_flags:
@@ -91,8 +243,79 @@ class RedisSnapshotProvider:
             quality_flags=quality_flags,
             missing_fields=sorted(set(missing_fields)),
             source_latency_ms={"redis": latency},
+            value_timestamps=value_timestamps,
         )
 
+    def close(self) -> None:
+        with self._mirrors_lock:
+            mirrors = [mirror for _, mirror in self._mirrors.values()]
+            self._mirrors.clear()
+        for mirror in mirrors:
+            mirror.close()
+
+    def _get_mirror(
+        self,
+        profile: DataSourceProfile,
+        request: SnapshotRequest,
+        secret_resolver: SecretResolverProtocol,
+        factory: RedisClientFactory,
+    ) -> RedisPointMirror:
+        options = profile.options
+        stream_key = None
+        if options.redis_stream_key:
+            stream_key = options.redis_stream_key.format(catalog_id=request.catalog_id)
+        key = f"{profile.name}:{options.redis_subscription.value}:{stream_key or ''}"
+        # A changed connection (e.g. a rotated secret) replaces the mirror and closes the
+        # old one, so rotations do not leave clients and subscriptions behind.
+        conn = secret_resolver.resolve(profile.conn_ref)
+        conn_digest = canonical_digest(conn)
+
+        replaced: RedisPointMirror | None = None
+        with self._mirrors_lock:
+            entry = self._mirrors.get(key)
+            if entry is not None and entry[0] == conn_digest:
+                return entry[1]
+            if entry is not None:
+                replaced = entry[1]
+            mirror = RedisPointMirror(
+                factory(profile, conn),
+                mode=options.redis_subscription,
+                db=int(conn.get("db", 0)),
+                stream_key=stream_key,
+            )
+            self._mirrors[key] = (conn_digest, mirror)
+        if replaced is not None:
+            replaced.close()
+        return mirror
+
+    def _apply_raw(
+        self,
+        item: PointBinding,
+        raw: Any,
+        values: dict[str, float],
+        quality_flags: dict[str, str],
+        missing_fields: list[str],
+    ) -> bool:
+        if raw is None:
+            missing_fields.append(item.field_name)
+            quality_flags[item.field_name] = "missing"
+            return False
+
+        parsed = self._to_float(raw)
+        if parsed is None:
+            missing_fields.append(item.field_name)
+            quality_flags[item.field_name] = "parse_error"
+            return False
+
+        try:
+            values[item.field_name] = apply_transform(parsed, item.transform)
+            quality_flags[item.field_name] = "ok"
+            return True
+        except Exception as exc:  # noqa: BLE001
+            missing_fields.append(item.field_name)
+            quality_flags[item.field_name] = f"transform_error:{exc}"
+            return False
+
     def _to_float(self, raw: Any) -> float | None:
         if isinstance(raw, (int, float)):
             return float(raw)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Callable, Protocol
 
-from easyshift_maas.core.contracts import DataSourceProfile, PointCatalog
+from easyshift_maas.core.contracts import CatalogDiff, DataSourceProfile, PointCatalog
+
+CatalogListener = Callable[[str, CatalogDiff | None], None]
 
 
 class CatalogRepositoryProtocol(Protocol):
-    def put(self, catalog: PointCatalog) -> PointCatalog: ...
+    def put(self, catalog: PointCatalog, diff: CatalogDiff | None = None) -> PointCatalog: ...
 
     def get(self, catalog_id: str) -> PointCatalog: ...
 
@@ -26,9 +28,18 @@ class DataSourceRegistryProtocol(Protocol):
 class InMemoryCatalogRepository:
     def __init__(self) -> None:
         self._storage: dict[str, PointCatalog] = {}
+        self._listeners: list[CatalogListener] = []
+
+    def add_listener(self, listener: CatalogListener) -> None:
+        """Register a callback invoked with the catalog id (and diff, if known) when a catalog is replaced."""
+        self._listeners.append(listener)
 
-    def put(self, catalog: PointCatalog) -> PointCatalog:
+    def put(self, catalog: PointCatalog, diff: CatalogDiff | None = None) -> PointCatalog:
+        previous = self._storage.get(catalog.catalog_id)
         self._storage[catalog.catalog_id] = catalog
+        if previous is not None and previous is not catalog:
+            for listener in self._listeners:
+                listener(catalog.catalog_id, diff)
         return catalog
 
     def get(self, catalog_id: str) -> PointCatalog:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import math
 from collections import defaultdict
-from typing import Protocol
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol
 
 from easyshift_maas.core.contracts import (
+    CatalogDiff,
     DataSourceKind,
     DataSourceProfile,
     PointBinding,
@@ -11,7 +14,10 @@ from easyshift_maas.core.contracts import (
     SnapshotMissingPolicy,
     SnapshotRequest,
     SnapshotResult,
+    SnapshotWindow,
+    SnapshotWindowRequest,
 )
+from easyshift_maas.ingestion.catalog_index import CatalogIndexCache
 from easyshift_maas.security.secrets import SecretResolverProtocol
 
 
@@ -27,6 +33,18 @@ class SourceSnapshotProviderProtocol(Protocol):
     ) -> SnapshotResult: ...
 
 
+class WindowSourceSnapshotProviderProtocol(Protocol):
+    kind: DataSourceKind
+
+    def fetch_window_bindings(
+        self,
+        bindings: list[PointBinding],
+        profile: DataSourceProfile,
+        request: SnapshotWindowRequest,
+        secret_resolver: SecretResolverProtocol,
+    ) -> SnapshotWindow: ...
+
+
 class SnapshotProviderProtocol(Protocol):
     def fetch(
         self,
@@ -40,6 +58,10 @@ class SnapshotProviderProtocol(Protocol):
 class CompositeSnapshotProvider:
     def __init__(self, providers: list[SourceSnapshotProviderProtocol]) -> None:
         self._providers = {provider.kind: provider for provider in providers}
+        self._indexes = CatalogIndexCache()
+
+    def invalidate_catalog(self, catalog_id: str | None = None, diff: CatalogDiff | None = None) -> None:
+        self._indexes.invalidate(catalog_id, diff)
 
     def fetch(
         self,
@@ -48,21 +70,14 @@ class CompositeSnapshotProvider:
         profiles: list[DataSourceProfile],
         secret_resolver: SecretResolverProtocol,
     ) -> SnapshotResult:
-        selected_fields = set(request.fields or [])
-        selected_bindings = [
-            item
-            for item in catalog.bindings
-            if item.enabled and (not selected_fields or item.field_name in selected_fields)
-        ]
-
-        grouped: dict[DataSourceKind, list[PointBinding]] = defaultdict(list)
-        for binding in selected_bindings:
-            grouped[binding.source_type].append(binding)
+        index = self._indexes.get(catalog)
+        grouped = index.select(request.fields)
 
         merged_values: dict[str, float] = {}
         merged_flags: dict[str, str] = {}
         merged_missing: list[str] = []
         merged_latency: dict[str, int] = {}
+        merged_timestamps: dict[str, datetime] = {}
 
         for kind, bindings in grouped.items():
             provider = self._providers.get(kind)
@@ -72,7 +87,7 @@ class CompositeSnapshotProvider:
                     merged_flags[binding.field_name] = f"provider_missing:{kind.value}"
                 continue
 
-            profile = self._select_profile(kind=kind, preferred_name=catalog.source_profile, profiles=profiles)
+            profile = index.profile_for(kind, profiles)
             if profile is None:
                 for binding in bindings:
                     merged_missing.append(binding.field_name)
@@ -89,6 +104,7 @@ class CompositeSnapshotProvider:
             merged_flags.update(partial.quality_flags)
             merged_missing.extend(partial.missing_fields)
             merged_latency.update(partial.source_latency_ms)
+            merged_timestamps.update(partial.value_timestamps)
 
         merged_missing = sorted(set(merged_missing))
 
@@ -102,6 +118,7 @@ class CompositeSnapshotProvider:
             for field in merged_missing:
                 merged_flags.pop(field, None)
                 merged_values.pop(field, None)
+                merged_timestamps.pop(field, None)
             merged_missing = []
 
         return SnapshotResult(
@@ -109,23 +126,62 @@ class CompositeSnapshotProvider:
             quality_flags=merged_flags,
             missing_fields=merged_missing,
             source_latency_ms=merged_latency,
+            value_timestamps=merged_timestamps,
         )
 
-    def _select_profile(
+    def fetch_window(
         self,
-        *,
-        kind: DataSourceKind,
-        preferred_name: str,
+        request: SnapshotWindowRequest,
+        catalog: PointCatalog,
         profiles: list[DataSourceProfile],
-    ) -> DataSourceProfile | None:
-        kind_profiles = [item for item in profiles if item.kind == kind]
-        if not kind_profiles:
-            return None
+        secret_resolver: SecretResolverProtocol,
+    ) -> SnapshotWindow:
+        index = self._indexes.get(catalog)
+        grouped = index.select(request.fields)
+        timestamps = window_timestamps(request.start, request.end, request.step_sec)
+
+        rows: dict[str, list[float | None]] = {}
+        merged_flags: dict[str, str] = {}
+        merged_missing: list[str] = []
+        merged_latency: dict[str, int] = {}
+
+        for kind, bindings in grouped.items():
+            provider = self._providers.get(kind)
+            fetch_window_bindings = getattr(provider, "fetch_window_bindings", None)
+            if fetch_window_bindings is None:
+                reason = "provider_missing" if provider is None else "window_unsupported"
+                for binding in bindings:
+                    merged_missing.append(binding.field_name)
+                    merged_flags[binding.field_name] = f"{reason}:{kind.value}"
+                continue
+
+            profile = index.profile_for(kind, profiles)
+            if profile is None:
+                for binding in bindings:
+                    merged_missing.append(binding.field_name)
+                    merged_flags[binding.field_name] = f"profile_missing:{kind.value}"
+                continue
 
-        for profile in kind_profiles:
-            if profile.name == preferred_name:
-                return profile
-        return kind_profiles[0]
+            partial = fetch_window_bindings(
+                bindings=bindings,
+                profile=profile,
+                request=request,
+                secret_resolver=secret_resolver,
+            )
+            rows.update(zip(partial.fields, partial.values))
+            merged_flags.update(partial.quality_flags)
+            merged_missing.extend(partial.missing_fields)
+            merged_latency.update(partial.source_latency_ms)
+
+        fields = list(dict.fromkeys(item.field_name for items in grouped.values() for item in items))
+        return SnapshotWindow(
+            fields=fields,
+            timestamps=timestamps,
+            values=[rows.get(field) or [None] * len(timestamps) for field in fields],
+            quality_flags=merged_flags,
+            missing_fields=sorted(set(merged_missing)),
+            source_latency_ms=merged_latency,
+        )
 
 
 def apply_transform(raw: float, transform: str | None) -> float:
@@ -147,3 +203,79 @@ def apply_transform(raw: float, transform: str | None) -> float:
         add = float(values[1])
         return raw * mul + add
     raise ValueError(f"unsupported transform: {transform}")
+
+
+def window_timestamps(start: datetime, end: datetime, step_sec: int) -> list[datetime]:
+    count = int((end - start).total_seconds() // step_sec) + 1
+    return [start + timedelta(seconds=step_sec * idx) for idx in range(count)]
+
+
+def to_epoch_seconds(value: Any) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return float(text)
+        except ValueError:
+            return to_epoch_seconds(datetime.fromisoformat(text.replace("Z", "+00:00")))
+    raise TypeError(f"unsupported timestamp value: {value!r}")
+
+
+class WindowAccumulator:
+    """Resample ``(source_ref, ts, value)`` observations onto a fixed step grid.
+
+    Grid point ``t_k`` holds the last observation in ``(t_k - step, t_k]``, which
+    matches the as-of semantics of ``SnapshotRequest.at`` with a one-step lookback.
+    Observations must be added in timestamp order.
+    """
+
+    def __init__(self, bindings: list[PointBinding], request: SnapshotWindowRequest) -> None:
+        self.timestamps = window_timestamps(request.start, request.end, request.step_sec)
+        self.fields = list(dict.fromkeys(item.field_name for item in bindings))
+        self.quality_flags: dict[str, str] = {}
+        self._start = to_epoch_seconds(request.start)
+        self._step = float(request.step_sec)
+        self._rows: dict[str, list[float | None]] = {
+            field: [None] * len(self.timestamps) for field in self.fields
+        }
+        self._targets: dict[str, list[PointBinding]] = defaultdict(list)
+        for item in bindings:
+            self._targets[item.source_ref].append(item)
+
+    @property
+    def source_refs(self) -> list[str]:
+        return list(self._targets.keys())
+
+    def add(self, source_ref: str, ts: Any, raw: float) -> None:
+        index = math.ceil((to_epoch_seconds(ts) - self._start) / self._step)
+        if index < 0 or index >= len(self.timestamps):
+            return
+        for item in self._targets.get(source_ref, []):
+            try:
+                self._rows[item.field_name][index] = apply_transform(raw, item.transform)
+            except Exception as exc:  # noqa: BLE001
+                self.quality_flags[item.field_name] = f"transform_error:{exc}"
+
+    def result(self, source_name: str, latency_ms: int) -> SnapshotWindow:
+        missing: list[str] = []
+        for field, row in self._rows.items():
+            if field in self.quality_flags:
+                missing.append(field)
+            elif all(value is None for value in row):
+                missing.append(field)
+                self.quality_flags[field] = "missing"
+            else:
+                self.quality_flags[field] = "ok"
+        return SnapshotWindow(
+            fields=self.fields,
+            timestamps=self.timestamps,
+            values=[self._rows[field] for field in self.fields],
+            quality_flags=self.quality_flags,
+            missing_fields=sorted(missing),
+            source_latency_ms={source_name: latency_ms},
+        )
@@ -0,0 +1,11 @@
+from easyshift_maas.jobs.queue import JobHandler, JobQueue
+from easyshift_maas.jobs.store import InMemoryJobStore, JobStoreProtocol, SQLiteJobStore, build_job_store_from_env
+
+__all__ = [
+    "InMemoryJobStore",
+    "JobHandler",
+    "JobQueue",
+    "JobStoreProtocol",
+    "SQLiteJobStore",
+    "build_job_store_from_env",
+]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import Counter
+from typing import Any, Callable
+
+from easyshift_maas.core.contracts import JobRecord, JobStatus
+from easyshift_maas.jobs.store import JobStoreProtocol
+
+# handler(record, payload, cancelled) -> result dict. ``cancelled()`` turns True once
+# cancellation was requested; handlers should check it between steps and raise.
+JobHandler = Callable[[JobRecord, dict[str, Any], Callable[[], bool]], dict[str, Any]]
+
+_FINISHED = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobQueue:
+    """Bounded worker pool for one job kind, with priorities and per-tenant caps.
+
+    Jobs run on ``max_workers`` daemon threads, highest ``priority`` first and FIFO
+    within a priority. A tenant never has more than ``tenant_limit`` jobs running, so a
+    burst from one tenant cannot hold every worker. Records and request payloads live
+    in the job store; with :class:`SQLiteJobStore`, :meth:`start` picks up jobs that
+    were pending or running when the process stopped.
+    """
+
+    def __init__(
+        self,
+        store: JobStoreProtocol,
+        handler: JobHandler,
+        *,
+        kind: str,
+        max_workers: int = 2,
+        tenant_limit: int = 2,
+    ) -> None:
+        if max_workers <= 0 or tenant_limit <= 0:
+            raise ValueError("max_workers and tenant_limit must be positive")
+        self.store = store
+        self.handler = handler
+        self.kind = kind
+        self.max_workers = max_workers
+        self.tenant_limit = tenant_limit
+        self._cond = threading.Condition()
+        # (-priority, sequence, job_id, tenant); a plain list scanned in order, since
+        # the first entry may belong to a tenant that is at its cap.
+        self._pending: list[tuple[int, int, str, str]] = []
+        self._running: Counter[str] = Counter()
+        self._cancelled: set[str] = set()
+        self._sequence = itertools.count()
+        self._threads: list[threading.Thread] = []
+        # Bumped by shutdown(), so workers of an earlier start() exit once idle.
+        self._generation = 0
+
+    def start(self) -> None:
+        """Start the workers once, re-queueing unfinished jobs from the store."""
+
+        with self._cond:
+            if self._threads:
+                return
+            for record in self.store.list_jobs(self.kind):
+                if record.status in _FINISHED:
+                    continue
+                if record.cancel_requested:
+                    self.store.update(record.job_id, status=JobStatus.CANCELLED, error="cancelled")
+                    continue
+                if record.status == JobStatus.RUNNING:
+                    self.store.update(record.job_id, status=JobStatus.PENDING)
+                self._enqueue(record)
+            self._threads = [
+                threading.Thread(
+                    target=self._work, args=(self._generation,), name=f"{self.kind}-worker-{idx}", daemon=True
+                )
+                for idx in range(self.max_workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def shutdown(self) -> None:
+        """Stop taking jobs; pending ones stay in the store for the next start."""
+
+        with self._cond:
+            self._generation += 1
+            self._pending.clear()
+            self._threads = []
+            self._cond.notify_all()
+
+    def submit(
+        self,
+        payload: dict[str, Any],
+        *,
+        tenant_id: str = "default",
+        priority: int = 0,
+    ) -> JobRecord:
+        # Start first: start() re-queues every unfinished record, this one included.
+        self.start()
+        record = self.store.create(self.kind, tenant_id=tenant_id, priority=priority, payload=payload)
+        with self._cond:
+            self._enqueue(record)
+            self._cond.notify()
+        return record
+
+    def cancel(self, job_id: str) -> JobRecord:
+        """Cancel a pending job now, or ask a running one to stop at its next step."""
+
+        with self._cond:
+            record = self.store.get(job_id)
+            if record.kind != self.kind:
+                raise KeyError(f"job not found: {job_id}")
+            if record.status in _FINISHED:
+                raise ValueError(f"job already {record.status.value}: {job_id}")
+            queued = next((entry for entry in self._pending if entry[2] == job_id), None)
+            if queued is not None:
+                self._pending.remove(queued)
+                return self.store.update(
+                    job_id, status=JobStatus.CANCELLED, error="cancelled", cancel_requested=True
+                )
+            self._cancelled.add(job_id)
+            return self.store.update(job_id, cancel_requested=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "workers": len(self._threads),
+                "pending": len(self._pending),
+                "running": sum(self._running.values()),
+            }
+
+    def _enqueue(self, record: JobRecord) -> None:
+        self._pending.append((-record.priority, next(self._sequence), record.job_id, record.tenant_id or "default"))
+
+    def _pick(self) -> tuple[int, int, str, str] | None:
+        eligible = (entry for entry in self._pending if self._running[entry[3]] < self.tenant_limit)
+        entry = min(eligible, default=None)
+        if entry is not None:
+            self._pending.remove(entry)
+        return entry
+
+    def _work(self, generation: int) -> None:
+        while True:
+            with self._cond:
+                entry = None
+                while generation == self._generation:
+                    entry = self._pick()
+                    if entry is not None:
+                        break
+                    self._cond.wait()
+                if entry is None:
+                    return
+                _, _, job_id, tenant = entry
+                self._running[tenant] += 1
+            try:
+                self._execute(job_id)
+            finally:
+                with self._cond:
+                    self._running[tenant] -= 1
+                    self._cancelled.discard(job_id)
+                    # A finished job may unblock a capped tenant for another worker.
+                    self._cond.notify_all()
+
+    def _execute(self, job_id: str) -> None:
+        record = self.store.update(job_id, status=JobStatus.RUNNING)
+
+        def cancelled() -> bool:
+            return job_id in self._cancelled
+
+        try:
+            result = self.handler(record, self.store.payload(job_id) or {}, cancelled)
+        except Exception as exc:  # noqa: BLE001
+            if cancelled():
+                self.store.update(job_id, status=JobStatus.CANCELLED, error="cancelled")
+            else:
+                self.store.update(job_id, status=JobStatus.FAILED, error=f"{type(exc).__name__}: {exc}")
+            return
+        self.store.update(job_id, status=JobStatus.SUCCEEDED, result=result)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Protocol
+
+from easyshift_maas.core.contracts import JobRecord, JobStatus, now_utc
+
+
+class JobStoreProtocol(Protocol):
+    def create(
+        self,
+        kind: str,
+        *,
+        tenant_id: str | None = None,
+        priority: int = 0,
+        payload: dict[str, Any] | None = None,
+    ) -> JobRecord: ...
+
+    def get(self, job_id: str) -> JobRecord: ...
+
+    def payload(self, job_id: str) -> dict[str, Any] | None: ...
+
+    def update(
+        self,
+        job_id: str,
+        *,
+        status: JobStatus | None = None,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+        cancel_requested: bool | None = None,
+    ) -> JobRecord: ...
+
+    def list_jobs(self, kind: str | None = None) -> list[JobRecord]: ...
+
+
+def _changes(
+    status: JobStatus | None,
+    result: dict[str, Any] | None,
+    error: str | None,
+    cancel_requested: bool | None,
+) -> dict[str, Any]:
+    changes: dict[str, Any] = {"updated_at": now_utc()}
+    if status is not None:
+        changes["status"] = status
+    if result is not None:
+        changes["result"] = result
+    if error is not None:
+        changes["error"] = error
+    if cancel_requested is not None:
+        changes["cancel_requested"] = cancel_requested
+    return changes
+
+
+class InMemoryJobStore:
+    """Thread-safe job records for work run in the background of an API request."""
+
+    def __init__(self) -> None:
+        self._storage: dict[str, JobRecord] = {}
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        kind: str,
+        *,
+        tenant_id: str | None = None,
+        priority: int = 0,
+        payload: dict[str, Any] | None = None,
+    ) -> JobRecord:
+        record = JobRecord(kind=kind, tenant_id=tenant_id, priority=priority)
+        with self._lock:
+            self._storage[record.job_id] = record
+            if payload is not None:
+                self._payloads[record.job_id] = payload
+        return record
+
+    def get(self, job_id: str) -> JobRecord:
+        with self._lock:
+            if job_id not in self._storage:
+                raise KeyError(f"job not found: {job_id}")
+            return self._storage[job_id]
+
+    def payload(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            if job_id not in self._storage:
+                raise KeyError(f"job not found: {job_id}")
+            return self._payloads.get(job_id)
+
+    def update(
+        self,
+        job_id: str,
+        *,
+        status: JobStatus | None = None,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+        cancel_requested: bool | None = None,
+    ) -> JobRecord:
+        changes = _changes(status, result, error, cancel_requested)
+        with self._lock:
+            if job_id not in self._storage:
+                raise KeyError(f"job not found: {job_id}")
+            record = self._storage[job_id].model_copy(update=changes)
+            self._storage[job_id] = record
+            return record
+
+    def list_jobs(self, kind: str | None = None) -> list[JobRecord]:
+        with self._lock:
+            records = list(self._storage.values())
+        if kind is not None:
+            records = [item for item in records if item.kind == kind]
+        return sorted(records, key=lambda item: item.created_at)
+
+
+class SQLiteJobStore:
+    """Job records persisted to a local SQLite file so they survive a restart.
+
+    Each row holds the JSON record plus the request payload the job was submitted
+    with, which lets a queue re-run jobs that were pending or running when the
+    process stopped. The database runs in WAL mode like the LLM response cache.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        " job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, created_at TEXT NOT NULL,"
+        " record TEXT NOT NULL, payload TEXT)",
+        "CREATE INDEX IF NOT EXISTS jobs_kind_created ON jobs (kind, created_at)",
+    )
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+
+    def create(
+        self,
+        kind: str,
+        *,
+        tenant_id: str | None = None,
+        priority: int = 0,
+        payload: dict[str, Any] | None = None,
+    ) -> JobRecord:
+        record = JobRecord(kind=kind, tenant_id=tenant_id, priority=priority)
+        encoded = json.dumps(payload, ensure_ascii=False) if payload is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, created_at, record, payload) VALUES (?, ?, ?, ?, ?)",
+                (record.job_id, kind, record.created_at.isoformat(), record.model_dump_json(), encoded),
+            )
+        return record
+
+    def get(self, job_id: str) -> JobRecord:
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"job not found: {job_id}")
+        return JobRecord.model_validate_json(row[0])
+
+    def payload(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"job not found: {job_id}")
+        return json.loads(row[0]) if row[0] is not None else None
+
+    def update(
+        self,
+        job_id: str,
+        *,
+        status: JobStatus | None = None,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+        cancel_requested: bool | None = None,
+    ) -> JobRecord:
+        changes = _changes(status, result, error, cancel_requested)
+        with self._lock:
+            row = self._conn.execute("SELECT record FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"job not found: {job_id}")
+            record = JobRecord.model_validate_json(row[0]).model_copy(update=changes)
+            self._conn.execute("UPDATE jobs SET record = ? WHERE job_id = ?", (record.model_dump_json(), job_id))
+        return record
+
+    def list_jobs(self, kind: str | None = None) -> list[JobRecord]:
+        with self._lock:
+            if kind is None:
+                rows = self._conn.execute("SELECT record FROM jobs ORDER BY created_at").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT record FROM jobs WHERE kind = ? ORDER BY created_at", (kind,)
+                ).fetchall()
+        return [JobRecord.model_validate_json(row[0]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_job_store_from_env() -> InMemoryJobStore | SQLiteJobStore:
+    """Persist jobs to SQLite when ``REFLEXFLOW_JOB_STORE_PATH`` is set."""
+
+    path = os.getenv("REFLEXFLOW_JOB_STORE_PATH")
+    if not path:
+        return InMemoryJobStore()
+    return SQLiteJobStore(path)
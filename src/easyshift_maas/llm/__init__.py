@@ -1,3 +1,14 @@
-from easyshift_maas.llm.client import LLMClientProtocol, RoleBasedLLMClient
+from easyshift_maas.llm.cache import LLMResponseCacheProtocol, SQLiteLLMResponseCache
+from easyshift_maas.llm.client import AsyncLLMClientProtocol, LLMClientProtocol, RoleBasedLLMClient, acomplete_json
+from easyshift_maas.llm.stub_server import StubLLMConfig, build_stub_llm_app
 
-__all__ = ["LLMClientProtocol", "RoleBasedLLMClient"]
+__all__ = [
+    "LLMClientProtocol",
+    "AsyncLLMClientProtocol",
+    "RoleBasedLLMClient",
+    "acomplete_json",
+    "LLMResponseCacheProtocol",
+    "SQLiteLLMResponseCache",
+    "StubLLMConfig",
+    "build_stub_llm_app",
+]
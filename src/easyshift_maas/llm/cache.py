@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Protocol
+
+from easyshift_maas.core.hashing import canonical_digest
+
+
+class LLMResponseCacheProtocol(Protocol):
+    def should_cache(self, temperature: float) -> bool: ...
+
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    def put(self, key: str, payload: dict[str, Any]) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def stats(self) -> dict[str, float]: ...
+
+
+def llm_cache_key(
+    *,
+    role: str,
+    model: str,
+    base_url: str | None,
+    system_prompt: str,
+    user_payload: dict[str, Any],
+    temperature: float,
+) -> str:
+    """Content address of one completion request."""
+
+    return canonical_digest(
+        {
+            "role": role,
+            "model": model,
+            "base_url": base_url,
+            "system_prompt": system_prompt,
+            "user_payload": user_payload,
+            "temperature": round(float(temperature), 4),
+        }
+    )
+
+
+class SQLiteLLMResponseCache:
+    """On-disk LLM response cache keyed by :func:`llm_cache_key`.
+
+    Entries expire after ``ttl_s`` and the least recently read entries are evicted
+    once more than ``max_entries`` are stored. Requests above ``max_temperature`` are
+    not cached, since their answers are meant to vary. The database runs in WAL mode
+    so several API workers can share one file.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        " key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache (last_access)",
+    )
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 10_000,
+        ttl_s: float = 7 * 24 * 3600.0,
+        max_temperature: float = 0.3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.max_temperature = max_temperature
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def should_cache(self, temperature: float) -> bool:
+        return temperature <= self.max_temperature
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute("SELECT payload, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl_s:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._entries -= 1
+                self._misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self._hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        now = self._clock()
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM llm_cache WHERE key = ?", (key,)).fetchone() is not None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now),
+            )
+            if not exists:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict(now)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries -= self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._entries = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": self._entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        # Drop expired rows first, then trim to 90% of capacity so eviction is amortized.
+        expired = self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_s,)).rowcount
+        remaining = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        target = max(1, int(self.max_entries * 0.9))
+        trimmed = 0
+        if remaining > self.max_entries:
+            trimmed = self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access LIMIT ?)",
+                (remaining - target,),
+            ).rowcount
+        self._entries = remaining - trimmed
+        self._evictions += expired + trimmed
+
+
+def build_llm_cache_from_env() -> SQLiteLLMResponseCache | None:
+    """Build the response cache when ``REFLEXFLOW_LLM_CACHE_PATH`` is set."""
+
+    path = os.getenv("REFLEXFLOW_LLM_CACHE_PATH")
+    if not path:
+        return None
+    return SQLiteLLMResponseCache(
+        path,
+        max_entries=int(os.getenv("REFLEXFLOW_LLM_CACHE_MAX_ENTRIES", "10000")),
+        ttl_s=float(os.getenv("REFLEXFLOW_LLM_CACHE_TTL_SEC", str(7 * 24 * 3600))),
+        max_temperature=float(os.getenv("REFLEXFLOW_LLM_CACHE_MAX_TEMPERATURE", "0.3")),
+    )
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import inspect
 import os
-from typing import Any, Protocol
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Protocol, TypeVar
+
+from pydantic import BaseModel
 
 from easyshift_maas.core.contracts import LLMProviderConfig
+from easyshift_maas.llm.cache import LLMResponseCacheProtocol, build_llm_cache_from_env, llm_cache_key
 from easyshift_maas.llm.providers.openai_compatible import OpenAICompatibleProvider
 from easyshift_maas.llm.providers.profiles import build_role_configs_from_env
 
 
+# Raises when a payload is unusable; clients that take it cache only payloads it accepts.
+PayloadValidator = Callable[[dict[str, Any]], Any]
+
+
 class LLMClientProtocol(Protocol):
+    """Sync LLM client.
+
+    ``validate`` is optional for implementations: clients that accept it should run
+    it before caching an answer, so a schema-invalid answer is never replayed.
+    """
+
     def complete_json(
         self,
         *,
@@ -16,15 +34,114 @@ class LLMClientProtocol(Protocol):
         system_prompt: str,
         user_payload: dict[str, Any],
         temperature: float = 0.1,
+        validate: PayloadValidator | None = None,
     ) -> tuple[dict[str, Any], dict[str, Any]]: ...
 
 
+class AsyncLLMClientProtocol(Protocol):
+    async def acomplete_json(
+        self,
+        *,
+        role: str,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        temperature: float = 0.1,
+        validate: PayloadValidator | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]: ...
+
+
+def _accepts_validate(method: Callable[..., Any]) -> bool:
+    # Checked per call (cheap next to an LLM round trip) so any client can opt in.
+    try:
+        return "validate" in inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+async def acomplete_json(
+    client: LLMClientProtocol,
+    *,
+    role: str,
+    system_prompt: str,
+    user_payload: dict[str, Any],
+    temperature: float = 0.1,
+    validate: PayloadValidator | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Await ``client.acomplete_json`` when available, else run ``complete_json`` in a thread.
+
+    ``validate`` is passed on only when the client's method accepts it.
+    """
+
+    kwargs: dict[str, Any] = {
+        "role": role,
+        "system_prompt": system_prompt,
+        "user_payload": user_payload,
+        "temperature": temperature,
+    }
+    native = getattr(client, "acomplete_json", None)
+    if validate is not None and _accepts_validate(native if native is not None else client.complete_json):
+        kwargs["validate"] = validate
+    if native is not None:
+        return await native(**kwargs)
+    return await asyncio.to_thread(client.complete_json, **kwargs)
+
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+# When set, every async agent call holds a permit while it waits on the model, so
+# concurrent runs that share it (e.g. a batch migration) share one LLM call budget.
+llm_call_limit: ContextVar[asyncio.Semaphore | None] = ContextVar("llm_call_limit", default=None)
+
+
+def complete_validated(
+    client: LLMClientProtocol,
+    schema: type[OutputT],
+    **request: Any,
+) -> tuple[OutputT, dict[str, Any]]:
+    """``complete_json`` followed by ``schema`` validation.
+
+    Clients whose ``complete_json`` accepts ``validate`` get the schema as that
+    callback, so an invalid answer is never cached and an agent's retry reaches the
+    model again.
+    """
+
+    if _accepts_validate(client.complete_json):
+        request["validate"] = schema.model_validate
+    payload, meta = client.complete_json(**request)
+    return schema.model_validate(payload), meta
+
+
+async def acomplete_validated(
+    client: LLMClientProtocol,
+    schema: type[OutputT],
+    **request: Any,
+) -> tuple[OutputT, dict[str, Any]]:
+    """Async :func:`complete_validated`, holding an :data:`llm_call_limit` permit when one is set."""
+
+    async with llm_call_limit.get() or contextlib.nullcontext():
+        payload, meta = await acomplete_json(client, **request, validate=schema.model_validate)
+    return schema.model_validate(payload), meta
+
+
 class RoleBasedLLMClient:
-    """Role-aware LLM router backed by OpenAI-compatible chat completions."""
+    """Role-aware LLM router backed by OpenAI-compatible chat completions.
 
-    def __init__(self, role_configs: dict[str, LLMProviderConfig] | None = None) -> None:
+    With a response cache (passed in, or built from ``REFLEXFLOW_LLM_CACHE_PATH``)
+    identical low-temperature requests are answered from the cache; ``meta["cache"]``
+    reports ``hit``, ``miss`` or ``bypass``. With a ``validate`` callback a fresh answer
+    is cached only once it passes, and a cached answer that fails is dropped and
+    requested again.
+    """
+
+    def __init__(
+        self,
+        role_configs: dict[str, LLMProviderConfig] | None = None,
+        cache: LLMResponseCacheProtocol | None = None,
+    ) -> None:
         self.role_configs = role_configs or build_role_configs_from_env()
+        self.cache = cache if cache is not None else build_llm_cache_from_env()
         self._providers: dict[str, OpenAICompatibleProvider] = {}
+        self._providers_lock = threading.Lock()
 
     def complete_json(
         self,
@@ -33,10 +150,12 @@ class RoleBasedLLMClient:
         system_prompt: str,
         user_payload: dict[str, Any],
         temperature: float = 0.1,
+        validate: PayloadValidator | None = None,
     ) -> tuple[dict[str, Any], dict[str, Any]]:
-        config = self.role_configs.get(role)
-        if config is None:
-            raise KeyError(f"unknown llm role config: {role}")
+        config, meta, cache_key = self._prepare(role, system_prompt, user_payload, temperature)
+        cached = self._lookup(cache_key, meta, validate)
+        if cached is not None:
+            return cached, meta
 
         provider = self._get_provider(role, config)
         payload = provider.chat_json(
@@ -45,27 +164,114 @@ class RoleBasedLLMClient:
             user_payload=user_payload,
             temperature=temperature,
         )
-        meta = {
+        if validate is not None:
+            validate(payload)
+        return payload, self._finish(cache_key, payload, meta)
+
+    async def acomplete_json(
+        self,
+        *,
+        role: str,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        temperature: float = 0.1,
+        validate: PayloadValidator | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        config, meta, cache_key = self._prepare(role, system_prompt, user_payload, temperature)
+        # Cache reads and writes are SQLite I/O, so they run off the event loop.
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self._lookup, cache_key, meta, validate)
+            if cached is not None:
+                return cached, meta
+
+        provider = self._get_provider(role, config)
+        payload = await provider.achat_json(
+            model=config.model,
+            system_prompt=system_prompt,
+            user_payload=user_payload,
+            temperature=temperature,
+        )
+        if validate is not None:
+            validate(payload)
+        if cache_key is not None:
+            return payload, await asyncio.to_thread(self._finish, cache_key, payload, meta)
+        return payload, self._finish(None, payload, meta)
+
+    def is_available(self) -> bool:
+        for config in self.role_configs.values():
+            if config.base_url and os.getenv(config.api_key_env):
+                return True
+        return False
+
+    def _prepare(
+        self,
+        role: str,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        temperature: float,
+    ) -> tuple[LLMProviderConfig, dict[str, Any], str | None]:
+        config = self.role_configs.get(role)
+        if config is None:
+            raise KeyError(f"unknown llm role config: {role}")
+
+        meta: dict[str, Any] = {
             "role": role,
             "provider": config.provider_name,
             "vendor": config.vendor,
             "model": config.model,
             "base_url": config.base_url,
         }
-        return payload, meta
+        if self.cache is None or not self.cache.should_cache(temperature):
+            return config, meta, None
 
-    def is_available(self) -> bool:
-        for config in self.role_configs.values():
-            if config.base_url and os.getenv(config.api_key_env):
-                return True
-        return False
+        cache_key = llm_cache_key(
+            role=role,
+            model=config.model,
+            base_url=config.base_url,
+            system_prompt=system_prompt,
+            user_payload=user_payload,
+            temperature=temperature,
+        )
+        return config, meta, cache_key
+
+    def _lookup(
+        self, cache_key: str | None, meta: dict[str, Any], validate: PayloadValidator | None
+    ) -> dict[str, Any] | None:
+        if cache_key is None:
+            return None
+        cached = self.cache.get(cache_key)  # type: ignore[union-attr]
+        if cached is None:
+            return None
+        if validate is not None:
+            try:
+                validate(cached)
+            except Exception:  # noqa: BLE001
+                self.cache.delete(cache_key)  # type: ignore[union-attr]
+                return None
+        meta["cache"] = "hit"
+        return cached
+
+    def _finish(self, cache_key: str | None, payload: dict[str, Any], meta: dict[str, Any]) -> dict[str, Any]:
+        if cache_key is not None:
+            self.cache.put(cache_key, payload)
+            meta["cache"] = "miss"
+        elif self.cache is not None:
+            meta["cache"] = "bypass"
+        return meta
 
     def _get_provider(self, role: str, config: LLMProviderConfig) -> OpenAICompatibleProvider:
-        key = f"{role}:{config.base_url}:{config.api_key_env}:{config.timeout_s}"
-        provider = self._providers.get(key)
-        if provider is not None:
+        # Roles that talk to the same endpoint share one provider and its connection pool.
+        key = (
+            f"{config.base_url}:{config.api_key_env}:{config.timeout_s}:"
+            f"{config.max_connections}:{config.max_keepalive_connections}:{config.keepalive_expiry_s}:{config.http2}"
+        )
+        with self._providers_lock:
+            provider = self._providers.get(key)
+            if provider is None:
+                provider = self._providers[key] = self._build_provider(config)
             return provider
 
+    def _build_provider(self, config: LLMProviderConfig) -> OpenAICompatibleProvider:
         if not config.base_url:
             raise RuntimeError(
                 "missing REFLEXFLOW_LLM_BASE_URL (or REFLEXFLOW_LLM_VENDOR preset) for LLM provider"
@@ -75,10 +281,26 @@ class RoleBasedLLMClient:
         if not api_key:
             raise RuntimeError(f"missing API key env var: {config.api_key_env}")
 
-        provider = OpenAICompatibleProvider(
+        return OpenAICompatibleProvider(
             base_url=config.base_url,
             api_key=api_key,
             timeout_s=config.timeout_s,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry_s=config.keepalive_expiry_s,
+            http2=config.http2,
         )
-        self._providers[key] = provider
-        return provider
+
+    def close(self) -> None:
+        with self._providers_lock:
+            providers = list(self._providers.values())
+            self._providers.clear()
+        for provider in providers:
+            provider.close()
+
+    async def aclose(self) -> None:
+        with self._providers_lock:
+            providers = list(self._providers.values())
+        for provider in providers:
+            await provider.aclose()
+        self.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import importlib.util
 import json
+import threading
 from typing import Any
 
 import httpx
@@ -11,16 +13,66 @@ class OpenAICompatibleError(RuntimeError):
 
 
 class OpenAICompatibleProvider:
+    """Chat-completions client holding one pooled ``httpx.Client`` for its lifetime.
+
+    Connections are kept alive and reused across calls; ``achat_json`` uses a separate
+    pooled ``httpx.AsyncClient`` so async callers never hold a thread. HTTP/2 is used
+    when requested and the optional ``h2`` package is installed; otherwise HTTP/1.1.
+    """
+
     def __init__(
         self,
         *,
         base_url: str,
         api_key: str,
         timeout_s: int = 30,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_s: float = 30.0,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout_s = timeout_s
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(transport=self._transport, **self._client_options())
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(transport=self._async_transport, **self._client_options())
+            return self._async_client
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
 
     def chat_json(
         self,
@@ -30,7 +82,50 @@ class OpenAICompatibleProvider:
         user_payload: dict[str, Any],
         temperature: float = 0.1,
     ) -> dict[str, Any]:
-        request_payload = {
+        request_payload = self._request_payload(model, system_prompt, user_payload, temperature)
+        try:
+            response = self.client.post("/chat/completions", json=request_payload)
+            response.raise_for_status()
+        except Exception as exc:  # noqa: BLE001
+            raise OpenAICompatibleError(f"LLM request failed: {exc}") from exc
+        return self._decode(response)
+
+    async def achat_json(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        temperature: float = 0.1,
+    ) -> dict[str, Any]:
+        request_payload = self._request_payload(model, system_prompt, user_payload, temperature)
+        try:
+            response = await self.async_client.post("/chat/completions", json=request_payload)
+            response.raise_for_status()
+        except Exception as exc:  # noqa: BLE001
+            raise OpenAICompatibleError(f"LLM request failed: {exc}") from exc
+        return self._decode(response)
+
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout_s,
+            "limits": self._limits,
+            "http2": self.http2,
+            "headers": {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+        }
+
+    def _request_payload(
+        self,
+        model: str,
+        system_prompt: str,
+        user_payload: dict[str, Any],
+        temperature: float,
+    ) -> dict[str, Any]:
+        return {
             "model": model,
             "temperature": temperature,
             "messages": [
@@ -40,20 +135,7 @@ class OpenAICompatibleProvider:
             "response_format": {"type": "json_object"},
         }
 
-        try:
-            with httpx.Client(timeout=self.timeout_s) as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=request_payload,
-                )
-                response.raise_for_status()
-        except Exception as exc:  # noqa: BLE001
-            raise OpenAICompatibleError(f"LLM request failed: {exc}") from exc
-
+    def _decode(self, response: httpx.Response) -> dict[str, Any]:
         try:
             payload = response.json()
             content = payload["choices"][0]["message"]["content"]
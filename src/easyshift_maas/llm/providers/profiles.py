@@ -85,6 +85,12 @@ def build_role_configs_from_env() -> dict[str, LLMProviderConfig]:
         os.getenv("EASYSHIFT_LLM_API_KEY_ENV", _default_api_key_env()),
     )
     timeout_s = int(os.getenv("REFLEXFLOW_LLM_TIMEOUT_SEC", os.getenv("EASYSHIFT_LLM_TIMEOUT_SEC", "30")))
+    pool = {
+        "max_connections": int(os.getenv("REFLEXFLOW_LLM_MAX_CONNECTIONS", "20")),
+        "max_keepalive_connections": int(os.getenv("REFLEXFLOW_LLM_MAX_KEEPALIVE", "10")),
+        "keepalive_expiry_s": float(os.getenv("REFLEXFLOW_LLM_KEEPALIVE_EXPIRY_SEC", "30")),
+        "http2": os.getenv("REFLEXFLOW_LLM_HTTP2", "").strip().lower() in {"1", "true", "yes"},
+    }
 
     default_model = _resolve_default_model(vendor)
     parser_model = os.getenv(
@@ -108,6 +114,7 @@ def build_role_configs_from_env() -> dict[str, LLMProviderConfig]:
             api_key_env=api_key_env,
             model=parser_model,
             timeout_s=timeout_s,
+            **pool,
         ),
         "generator": LLMProviderConfig(
             provider_name="openai_compatible",
@@ -116,6 +123,7 @@ def build_role_configs_from_env() -> dict[str, LLMProviderConfig]:
             api_key_env=api_key_env,
             model=generator_model,
             timeout_s=timeout_s,
+            **pool,
         ),
         "critic": LLMProviderConfig(
             provider_name="openai_compatible",
@@ -124,5 +132,6 @@ def build_role_configs_from_env() -> dict[str, LLMProviderConfig]:
             api_key_env=api_key_env,
             model=critic_model,
             timeout_s=timeout_s,
+            **pool,
         ),
     }
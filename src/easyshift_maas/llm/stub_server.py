@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class StubLLMConfig:
+    """Behaviour of the stub endpoint.
+
+    Each call sleeps ``latency_ms`` plus up to ``jitter_ms``, then fails with
+    ``error_status`` with probability ``error_rate``. Latency and failures are drawn
+    from one ``seed``-ed generator, so a fixed request order gives a fixed outcome.
+    ``responses`` replaces the built-in answer of a role with a canned JSON object.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int = 0
+    responses: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.latency_ms < 0 or self.jitter_ms < 0:
+            raise ValueError("latency_ms and jitter_ms must be non-negative")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be within [0, 1]")
+
+
+def detect_role(user_payload: dict[str, Any]) -> str:
+    """Tell parser, generator and critic requests apart by their payload keys."""
+
+    if "failed_draft" in user_payload:
+        return "critic"
+    if "legacy_points" in user_payload:
+        return "parser"
+    return "generator"
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _parser_output(payload: dict[str, Any]) -> dict[str, Any]:
+    fields = (payload.get("field_dictionary") or {}).get("fields", [])
+    alias_map = (payload.get("field_dictionary") or {}).get("alias_map", {})
+    mappings: list[dict[str, Any]] = []
+    unmapped: list[str] = []
+    for point in payload.get("legacy_points", []):
+        target = alias_map.get(point)
+        if target is None:
+            point_tokens = _tokens(point)
+            scored = [(len(point_tokens & _tokens(item["field_name"])), item["field_name"]) for item in fields]
+            best = max(scored, default=(0, ""))
+            target = best[1] if best[0] else None
+        if target is None:
+            unmapped.append(point)
+        else:
+            mappings.append({"legacy_name": point, "standard_name": target, "confidence": 0.9, "reasoning": "stub"})
+    return {"mappings": mappings, "unmapped_points": unmapped}
+
+
+def _generator_output(payload: dict[str, Any]) -> dict[str, Any]:
+    fields = (payload.get("field_dictionary") or {}).get("fields", [])
+    controllable = [item["field_name"] for item in fields if item.get("controllable")]
+    observed = [item["field_name"] for item in fields if not item.get("controllable")]
+    target = (observed or controllable or ["objective"])[0]
+    return {
+        "objective": {"terms": [{"field_name": target, "direction": "min", "weight": 1.0}]},
+        "constraints": [],
+        "guardrail": {"rules": [{"field_name": name, "max_delta": 0.2} for name in controllable]},
+        "prediction": {"feature_fields": observed, "horizon_steps": 1},
+        "notes": "stub",
+    }
+
+
+def _critic_output(payload: dict[str, Any]) -> dict[str, Any]:
+    issues = (payload.get("validation_report") or {}).get("issues", [])
+    return {
+        "is_fatal_error": False,
+        "analysis": f"stub review of {len(issues)} validation issues",
+        "correction_instruction": "add a max_delta guardrail for every controllable field",
+    }
+
+
+_BUILTIN = {"parser": _parser_output, "generator": _generator_output, "critic": _critic_output}
+
+
+class _StubState:
+    def __init__(self, config: StubLLMConfig) -> None:
+        self.config = config
+        self.calls: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+
+    def draw(self, role: str) -> tuple[float, bool]:
+        with self._lock:
+            self.calls[role] += 1
+            delay = self.config.latency_ms + self._rng.random() * self.config.jitter_ms
+            failed = self._rng.random() < self.config.error_rate
+            if failed:
+                self.errors[role] += 1
+        return delay / 1000.0, failed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"calls": dict(self.calls), "errors": dict(self.errors)}
+
+
+def build_stub_llm_app(config: StubLLMConfig | None = None) -> FastAPI:
+    """OpenAI-compatible ``/chat/completions`` (also under ``/v1``) with canned JSON answers.
+
+    ``GET /stats`` returns per-role call and error counts.
+    """
+
+    state = _StubState(config or StubLLMConfig())
+    stub = FastAPI(title="ReflexFlow stub LLM")
+
+    async def chat_completions(request: Request) -> JSONResponse:
+        body = await request.json()
+        try:
+            user_payload = json.loads(body["messages"][-1]["content"])
+        except Exception as exc:  # noqa: BLE001
+            return JSONResponse({"error": {"message": f"bad request: {exc}", "type": "invalid_request"}}, 400)
+
+        role = detect_role(user_payload)
+        delay, failed = state.draw(role)
+        if delay:
+            await asyncio.sleep(delay)
+        if failed:
+            return JSONResponse(
+                {"error": {"message": "injected stub failure", "type": "stub_error"}},
+                status_code=state.config.error_status,
+            )
+        canned = state.config.responses.get(role)
+        content = canned if canned is not None else _BUILTIN[role](user_payload)
+        return JSONResponse(
+            {
+                "id": f"stub-{role}-{state.calls[role]}",
+                "object": "chat.completion",
+                "model": body.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": json.dumps(content, ensure_ascii=False)},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        )
+
+    for path in ("/chat/completions", "/v1/chat/completions"):
+        stub.add_api_route(path, chat_completions, methods=["POST"])
+    stub.add_api_route("/stats", state.stats, methods=["GET"])
+    return stub
+
+
+def serve_stub_llm(config: StubLLMConfig | None = None, host: str = "127.0.0.1", port: int = 8900) -> None:
+    uvicorn.run(build_stub_llm_app(config), host=host, port=port, log_level="warning")
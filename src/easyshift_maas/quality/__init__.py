@@ -1,3 +1,4 @@
+from easyshift_maas.quality.bulk import BulkQualityRunner, BulkQualitySummarizer
 from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
 
-__all__ = ["TemplateQualityEvaluator"]
+__all__ = ["BulkQualityRunner", "BulkQualitySummarizer", "TemplateQualityEvaluator"]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator
+
+from easyshift_maas.core.contracts import (
+    BulkQualityItem,
+    BulkQualitySummary,
+    ScenarioTemplate,
+    SimulationSample,
+    TemplateQualityGate,
+    TemplateQualityReport,
+)
+from easyshift_maas.core.template_diff import fingerprint_template
+from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
+
+# One evaluator per spawned worker process, built by _init_worker. Its section and
+# stage memos persist across chunks, so versions of one template share work.
+# In-process runs never touch it: they may overlap in API threads.
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(samples: list[dict[str, Any]] | None, gate: dict[str, Any], cache_size: int) -> None:
+    _WORKER["evaluator"] = TemplateQualityEvaluator(cache_size=cache_size)
+    _WORKER["samples"] = [SimulationSample.model_validate(item) for item in samples] if samples else None
+    _WORKER["gate"] = TemplateQualityGate.model_validate(gate)
+
+
+def _evaluate_chunk(payloads: list[str]) -> list[dict[str, Any]]:
+    return _evaluate_payloads(_WORKER["evaluator"], payloads, _WORKER["samples"], _WORKER["gate"])
+
+
+def _evaluate_payloads(
+    evaluator: TemplateQualityEvaluator,
+    payloads: list[str],
+    samples: list[SimulationSample] | None,
+    gate: TemplateQualityGate,
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for payload in payloads:
+        started = time.perf_counter()
+        item: dict[str, Any] = {"template_id": "", "version": ""}
+        try:
+            template = ScenarioTemplate.model_validate_json(payload)
+            item.update(template_id=template.template_id, version=template.version)
+            report = evaluator.evaluate(template, samples, gate)
+            item["report"] = report.model_dump(mode="json")
+        except Exception as exc:  # noqa: BLE001
+            item["error"] = f"{type(exc).__name__}: {exc}"
+        item["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+        results.append(item)
+    return results
+
+
+class BulkQualityRunner:
+    """Quality-check many templates on a process pool and stream the reports.
+
+    Templates are grouped by ``template_id`` into chunks, so the versions of one
+    template usually land on the same worker and reuse its section and pipeline-stage
+    memos. Regression samples and the gate are sent once per worker. Templates with
+    identical content are evaluated once. ``max_workers=0`` evaluates in-process.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        chunk_size: int = 8,
+        cache_size: int = 256,
+        mp_context: str = "spawn",
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        # spawn, not fork: the API runs this from a worker thread.
+        self.mp_context = mp_context
+
+    def iter_items(
+        self,
+        templates: Iterable[ScenarioTemplate],
+        regression_samples: list[SimulationSample] | None = None,
+        gate: TemplateQualityGate | None = None,
+    ) -> Iterator[BulkQualityItem]:
+        """Yield one item per template, in completion order."""
+
+        gate = gate or TemplateQualityGate()
+        samples = [item.model_dump(mode="json") for item in regression_samples] if regression_samples else None
+
+        unique: dict[str, ScenarioTemplate] = {}
+        duplicates: dict[str, list[ScenarioTemplate]] = {}
+        for template in templates:
+            digest = fingerprint_template(template).digest
+            if digest in unique:
+                duplicates.setdefault(digest, []).append(template)
+            else:
+                unique[digest] = template
+
+        ordered = sorted(unique.items(), key=lambda item: (item[1].template_id, item[1].version))
+        chunks: list[list[tuple[str, ScenarioTemplate]]] = [
+            ordered[idx : idx + self.chunk_size] for idx in range(0, len(ordered), self.chunk_size)
+        ]
+
+        for chunk, results in self._run_chunks(chunks, samples, gate):
+            for (digest, _), result in zip(chunk, results):
+                item = BulkQualityItem.model_validate(result)
+                yield item
+                for template in duplicates.get(digest, []):
+                    yield item.model_copy(
+                        update={
+                            "template_id": template.template_id,
+                            "version": template.version,
+                            "deduplicated": True,
+                            "elapsed_ms": 0,
+                        }
+                    )
+
+    def run(
+        self,
+        templates: Iterable[ScenarioTemplate],
+        regression_samples: list[SimulationSample] | None = None,
+        gate: TemplateQualityGate | None = None,
+    ) -> tuple[list[BulkQualityItem], BulkQualitySummary]:
+        templates = list(templates)
+        started = time.perf_counter()
+        summary = BulkQualitySummarizer(total=len(templates))
+        items = []
+        for item in self.iter_items(templates, regression_samples, gate):
+            summary.add(item)
+            items.append(item)
+        return items, summary.summary(elapsed_ms=int((time.perf_counter() - started) * 1000))
+
+    def _run_chunks(
+        self,
+        chunks: list[list[tuple[str, ScenarioTemplate]]],
+        samples: list[dict[str, Any]] | None,
+        gate: TemplateQualityGate,
+    ) -> Iterator[tuple[list[tuple[str, ScenarioTemplate]], list[dict[str, Any]]]]:
+        payloads = [[template.model_dump_json() for _, template in chunk] for chunk in chunks]
+        if self.max_workers <= 0 or len(chunks) <= 1:
+            evaluator = TemplateQualityEvaluator(cache_size=self.cache_size)
+            local_samples = [SimulationSample.model_validate(item) for item in samples] if samples else None
+            for chunk, payload in zip(chunks, payloads):
+                yield chunk, _evaluate_payloads(evaluator, payload, local_samples, gate)
+            return
+
+        initargs = (samples, gate.model_dump(mode="json"), self.cache_size)
+
+        context = multiprocessing.get_context(self.mp_context)
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as pool:
+            pending: dict[Future, list[tuple[str, ScenarioTemplate]]] = {
+                pool.submit(_evaluate_chunk, payload): chunk for chunk, payload in zip(chunks, payloads)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+
+class BulkQualitySummarizer:
+    """Incremental fleet summary, updated as items stream in."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self._items = 0
+        self._passed = 0
+        self._errored = 0
+        self._deduplicated = 0
+        self._scores: list[float] = []
+        self._issues: Counter[str] = Counter()
+
+    def add(self, item: BulkQualityItem) -> None:
+        self._items += 1
+        self._deduplicated += item.deduplicated
+        report: TemplateQualityReport | None = item.report
+        if report is None:
+            self._errored += 1
+            return
+        self._passed += report.passed
+        self._scores.append(report.overall_score)
+        self._issues.update(issue.code for issue in report.issues)
+
+    def summary(self, elapsed_ms: int = 0) -> BulkQualitySummary:
+        scored = len(self._scores)
+        return BulkQualitySummary(
+            total=self.total,
+            completed=self._items,
+            passed=self._passed,
+            failed=scored - self._passed,
+            errored=self._errored,
+            deduplicated=self._deduplicated,
+            mean_overall_score=round(sum(self._scores) / scored, 4) if scored else 0.0,
+            min_overall_score=min(self._scores) if scored else None,
+            issue_counts=dict(self._issues.most_common()),
+            elapsed_ms=elapsed_ms,
+        )
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-from typing import Iterable
-
+import math
+import random
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from statistics import NormalDist
+from typing import Any, Hashable, Iterable, NamedTuple
+
+from pydantic import TypeAdapter
+
+from easyshift_maas.agentic.regression_planner import nominal_values
 from easyshift_maas.agentic.template_validator import TemplateValidator
+from easyshift_maas.core.batch import BatchPipeline, SampleMatrix
 from easyshift_maas.core.contracts import (
+    FieldNoiseSpec,
     IssueSeverity,
+    MetricSummary,
     MigrationDraft,
+    NoiseKind,
+    RobustnessReport,
+    RobustnessSpec,
     ScenarioTemplate,
     SceneContext,
     SimulationSample,
@@ -13,30 +29,286 @@ from easyshift_maas.core.contracts import (
     TemplateQualityIssue,
     TemplateQualityReport,
 )
-from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+from easyshift_maas.core.guardrail import RuleGuardrail
+from easyshift_maas.core.hashing import canonical_digest, model_digest
+from easyshift_maas.core.optimizer import ProjectedHeuristicOptimizer
+from easyshift_maas.core.pipeline import PipelineProtocol, PredictionOptimizationPipeline
+from easyshift_maas.core.predictor import HeuristicPredictor
+from easyshift_maas.core.template_diff import (
+    PLAN_SECTIONS,
+    TEMPLATE_SECTIONS,
+    TemplateFingerprint,
+    fingerprint_template,
+)
+
+
+# Scalar template fields (id, version, notes, created_at) are cheap enough to
+# re-validate on every call; they change each iteration anyway (draft-N versions).
+_HEADER_ADAPTERS = {
+    name: TypeAdapter(info.annotation)
+    for name, info in ScenarioTemplate.model_fields.items()
+    if name not in TEMPLATE_SECTIONS
+}
+
+
+_STANDARD_NORMAL = NormalDist()
+
+
+def _batchable(pipeline: PipelineProtocol) -> bool:
+    # BatchPipeline re-implements the built-in stages, so any custom stage opts out.
+    return (
+        type(pipeline) is PredictionOptimizationPipeline
+        and type(pipeline.predictor) is HeuristicPredictor
+        and type(pipeline.optimizer) is ProjectedHeuristicOptimizer
+        and type(pipeline.guardrail) is RuleGuardrail
+    )
+
+
+class _SampleOutcome(NamedTuple):
+    solver_status: str
+    violated: bool
+    executed: bool
+
+
+class _BoundedMemo:
+    """Thread-safe LRU dict used for the per-section and per-sample memos."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
 
 
 class TemplateQualityEvaluator:
-    """Evaluate template quality with structural/semantic/solvability/guardrail/regression gates."""
+    """Evaluate template quality with structural/semantic/solvability/guardrail/regression gates.
+
+    Reports are memoized in a bounded LRU keyed by the template content (without
+    ``created_at``), the regression samples and the gate, so re-checking an unchanged
+    template (e.g. publishing a draft that was just quality-checked) skips the
+    validator and pipeline runs. ``cache_size=0`` disables the cache.
+
+    A changed template is re-scored incrementally: structural checks only re-validate
+    sections whose digest is new, the validator reuses per-field conflict results,
+    and regression samples reuse the predictor/optimizer stage when only the
+    guardrail changed (and the whole run when no pipeline section changed). Up to
+    ``stage_cache_size`` section and sample results are kept. Stage reuse assumes a
+    deterministic :class:`PredictionOptimizationPipeline`; other pipelines always run.
+    """
 
     def __init__(
         self,
-        pipeline: PredictionOptimizationPipeline | None = None,
+        pipeline: PipelineProtocol | None = None,
         validator: TemplateValidator | None = None,
+        cache_size: int = 256,
+        stage_cache_size: int = 4096,
     ) -> None:
         self.pipeline = pipeline or PredictionOptimizationPipeline()
         self.validator = validator or TemplateValidator()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, TemplateQualityReport] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._valid_sections = _BoundedMemo(stage_cache_size)
+        self._predictions = _BoundedMemo(stage_cache_size)
+        self._plans = _BoundedMemo(stage_cache_size)
+        self._outcomes = _BoundedMemo(stage_cache_size)
 
     def evaluate(
         self,
         template: ScenarioTemplate,
         regression_samples: list[SimulationSample] | None = None,
         gate: TemplateQualityGate | None = None,
+        *,
+        fingerprint: TemplateFingerprint | None = None,
     ) -> TemplateQualityReport:
         gate = gate or TemplateQualityGate()
+        if self.cache_size <= 0:
+            return self._evaluate(template, regression_samples, gate)
+
+        fingerprint = fingerprint or fingerprint_template(template)
+        key = self.cache_key(template, regression_samples, gate, fingerprint=fingerprint)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached.model_copy(deep=True)
+            self._misses += 1
+
+        report = self._evaluate(template, regression_samples, gate, fingerprint)
+        with self._cache_lock:
+            self._cache[key] = report.model_copy(deep=True)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return report
+
+    def cache_key(
+        self,
+        template: ScenarioTemplate,
+        regression_samples: list[SimulationSample] | None,
+        gate: TemplateQualityGate,
+        *,
+        fingerprint: TemplateFingerprint | None = None,
+    ) -> str:
+        payload: dict[str, Any] = {
+            "template": (fingerprint or fingerprint_template(template)).digest,
+            # An empty list falls back to default samples, exactly like None.
+            "samples": [model_digest(item) for item in regression_samples] if regression_samples else None,
+            "gate": gate.model_dump(mode="json"),
+        }
+        return canonical_digest(payload)
+
+    def cache_stats(self) -> dict[str, int]:
+        with self._cache_lock:
+            return {"entries": len(self._cache), "hits": self._hits, "misses": self._misses}
+
+    def robustness(
+        self,
+        template: ScenarioTemplate,
+        spec: RobustnessSpec | None = None,
+        base_samples: list[SimulationSample] | None = None,
+    ) -> RobustnessReport:
+        """Monte Carlo robustness: perturb contexts with sensor noise and summarize outcomes.
+
+        Draws are spread round-robin over ``base_samples`` (default: the nominal
+        operating point). Each perturbed field gets gaussian or uniform noise scaled
+        to ``relative_scale * |value|`` (at least ``min_scale``) unless
+        ``field_noise`` overrides it. Fields sharing a ``FieldDefinition.dimension``
+        share a common factor with correlation ``dimension_correlation`` (uniform
+        noise uses a gaussian copula). Draws run through :class:`BatchPipeline` in
+        batches of ``batch_size``; custom pipelines run draw by draw.
+        """
+
+        spec = spec or RobustnessSpec()
+        started = time.perf_counter()
+        rng = random.Random(spec.seed)
+        bases = [sample.context.values for sample in base_samples] if base_samples else [nominal_values(template)]
+        dimensions = {item.field_name: item.dimension for item in template.field_dictionary.fields}
+        controllable = {item.field_name for item in template.field_dictionary.fields if item.controllable}
+
+        approved = 0
+        violations = array("d")
+        objectives = array("d")
+        fired = [0] * len(template.guardrail.rules)
+        solver_status = "solved"
+        batched = _batchable(self.pipeline)
+        for base_idx, base in enumerate(bases):
+            count = spec.draws // len(bases) + (1 if base_idx < spec.draws % len(bases) else 0)
+            if count == 0:
+                continue
+            fields = list(base)
+            perturbed = [
+                (column, name, self._noise_for(name, base[name], spec))
+                for column, name in enumerate(fields)
+                if not spec.controllable_only or name in controllable
+            ]
+            groups = sorted({dimensions.get(name, f"field:{name}") for _, name, _ in perturbed})
+            kernel = BatchPipeline(template, fields) if batched else None
+
+            for offset in range(0, count, spec.batch_size):
+                matrix = SampleMatrix(fields, base.values())
+                for _ in range(min(spec.batch_size, count - offset)):
+                    common = {group: rng.gauss(0.0, 1.0) for group in groups}
+                    matrix.append(
+                        (column, base[name] + self._draw(rng, common[dimensions.get(name, f"field:{name}")], noise, spec))
+                        for column, name, noise in perturbed
+                    )
+                if kernel is not None:
+                    result = kernel.run(matrix)
+                    solver_status = result.solver_status
+                    approved += sum(result.executed)
+                    violations.extend(float(item) for item in result.violations)
+                    objectives.extend(result.objective)
+                    fired = [total + batch for total, batch in zip(fired, result.rule_fired)]
+                    continue
+                for row in range(len(matrix)):
+                    outcome = self.pipeline.run(matrix.context(row), template)
+                    solver_status = outcome.plan.solver_status
+                    approved += outcome.executed
+                    violations.append(float(len(outcome.guardrail.violations)))
+                    objectives.append(outcome.plan.objective_value)
+
+        draws = len(objectives)
+        z = _STANDARD_NORMAL.inv_cdf(0.5 + spec.confidence / 2.0)
+        ci_low, ci_high = _wilson_interval(approved, draws, z)
+        return RobustnessReport(
+            template_id=template.template_id,
+            draws=draws,
+            seed=spec.seed,
+            approval_rate=round(approved / draws, 4),
+            approval_ci_low=ci_low,
+            approval_ci_high=ci_high,
+            violation_rate=round(sum(1 for item in violations if item > 0) / draws, 4),
+            violations=_summarize(violations, z),
+            objective_value=_summarize(objectives, z),
+            rule_fire_rates=[round(item / draws, 4) for item in fired] if batched else None,
+            solver_status=solver_status,
+            elapsed_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    def _noise_for(self, name: str, value: float, spec: RobustnessSpec) -> FieldNoiseSpec:
+        override = spec.field_noise.get(name)
+        if override is not None:
+            return FieldNoiseSpec(kind=override.kind or spec.noise, scale=override.scale)
+        return FieldNoiseSpec(kind=spec.noise, scale=max(spec.min_scale, abs(value) * spec.relative_scale))
+
+    def _draw(self, rng: random.Random, common: float, noise: FieldNoiseSpec, spec: RobustnessSpec) -> float:
+        rho = spec.dimension_correlation
+        z = math.sqrt(rho) * common + math.sqrt(1.0 - rho) * rng.gauss(0.0, 1.0)
+        if noise.kind == NoiseKind.UNIFORM:
+            return noise.scale * (2.0 * _STANDARD_NORMAL.cdf(z) - 1.0)
+        return noise.scale * z
+
+    def stage_cache_stats(self) -> dict[str, int]:
+        return {
+            "valid_sections": len(self._valid_sections),
+            "predictions": len(self._predictions),
+            "plans": len(self._plans),
+            "outcomes": len(self._outcomes),
+        }
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+        self._valid_sections.clear()
+        self._predictions.clear()
+        self._plans.clear()
+        self._outcomes.clear()
+
+    def _evaluate(
+        self,
+        template: ScenarioTemplate,
+        regression_samples: list[SimulationSample] | None,
+        gate: TemplateQualityGate,
+        fingerprint: TemplateFingerprint | None = None,
+    ) -> TemplateQualityReport:
         issues: list[TemplateQualityIssue] = []
 
-        structural_score = self._structural_score(template, issues)
+        structural_score = self._structural_score(template, issues, fingerprint)
 
         validation = self.validator.validate(
             MigrationDraft(
@@ -45,17 +317,18 @@ class TemplateQualityEvaluator:
                 pending_confirmations=[],
                 risks=[],
                 generation_strategy="quality_check",
-            )
+            ),
+            fingerprint=fingerprint,
         )
 
         semantic_score = self._semantic_score(template, validation, issues)
 
         samples = regression_samples or self._default_samples(template)
-        pipeline_results = [self.pipeline.run(sample.context, template) for sample in samples]
+        outcomes = self._run_samples(template, samples, fingerprint)
 
-        solvability_score = self._solvability_score(pipeline_results)
+        solvability_score = self._solvability_score(outcomes)
         guardrail_coverage = self._guardrail_coverage(template)
-        regression_score = self._regression_score(samples, pipeline_results)
+        regression_score = self._regression_score(samples, outcomes)
 
         overall_score = round(
             (structural_score + semantic_score + solvability_score + guardrail_coverage + regression_score) / 5.0,
@@ -102,10 +375,16 @@ class TemplateQualityEvaluator:
             issues=issues,
         )
 
-    def _structural_score(self, template: ScenarioTemplate, issues: list[TemplateQualityIssue]) -> float:
+    def _structural_score(
+        self,
+        template: ScenarioTemplate,
+        issues: list[TemplateQualityIssue],
+        fingerprint: TemplateFingerprint | None = None,
+    ) -> float:
+        if fingerprint is not None and self._sections_valid(template, fingerprint):
+            return 1.0
         try:
             ScenarioTemplate.model_validate(template.model_dump(mode="json"))
-            return 1.0
         except Exception as exc:  # noqa: BLE001
             issues.append(
                 TemplateQualityIssue(
@@ -115,6 +394,90 @@ class TemplateQualityEvaluator:
                 )
             )
             return 0.0
+        if fingerprint is not None:
+            self._mark_sections_valid(fingerprint)
+        return 1.0
+
+    def _sections_valid(self, template: ScenarioTemplate, fingerprint: TemplateFingerprint) -> bool:
+        # ScenarioTemplate has no cross-section validators, so the full round trip
+        # passes iff every field does. Only sections with unseen digests are
+        # re-validated; any failure falls back to the full round trip so error
+        # messages are unchanged.
+        header = template.model_dump(mode="json", include=set(_HEADER_ADAPTERS))
+        try:
+            for name, adapter in _HEADER_ADAPTERS.items():
+                adapter.validate_python(header[name])
+        except Exception:  # noqa: BLE001
+            return False
+        pending: list[tuple[tuple[str, str], Any]] = []
+        for name in TEMPLATE_SECTIONS:
+            if name == "constraints":
+                continue
+            key = (name, fingerprint.sections[name])
+            if self._valid_sections.get(key) is None:
+                pending.append((key, getattr(template, name)))
+        for digest, constraint in zip(fingerprint.constraints, template.constraints):
+            key = ("constraint", digest)
+            if self._valid_sections.get(key) is None:
+                pending.append((key, constraint))
+
+        for key, section in pending:
+            try:
+                type(section).model_validate(section.model_dump(mode="json"))
+            except Exception:  # noqa: BLE001
+                return False
+            self._valid_sections.put(key, True)
+        return True
+
+    def _mark_sections_valid(self, fingerprint: TemplateFingerprint) -> None:
+        for name in TEMPLATE_SECTIONS:
+            if name != "constraints":
+                self._valid_sections.put((name, fingerprint.sections[name]), True)
+        for digest in fingerprint.constraints:
+            self._valid_sections.put(("constraint", digest), True)
+
+    def _run_samples(
+        self,
+        template: ScenarioTemplate,
+        samples: list[SimulationSample],
+        fingerprint: TemplateFingerprint | None,
+    ) -> list[_SampleOutcome]:
+        if fingerprint is None or type(self.pipeline) is not PredictionOptimizationPipeline:
+            return [self._outcome(self.pipeline.run(sample.context, template)) for sample in samples]
+
+        # Each stage is keyed by the sample plus the sections it reads, so e.g. a
+        # guardrail edit only re-runs the guardrail and a constraint edit skips the predictor.
+        plan_sections = tuple(fingerprint.sections[name] for name in PLAN_SECTIONS)
+        outcomes: list[_SampleOutcome] = []
+        for sample in samples:
+            context = sample.context
+            prediction_key = (model_digest(context), fingerprint.sections["prediction"])
+            plan_key = (prediction_key, plan_sections)
+            outcome_key = (plan_key, fingerprint.sections["guardrail"])
+            outcome = self._outcomes.get(outcome_key)
+            if outcome is None:
+                plan = self._plans.get(plan_key)
+                if plan is None:
+                    prediction = self._predictions.get(prediction_key)
+                    if prediction is None:
+                        prediction = self.pipeline.predictor.predict(context, template.prediction)
+                        self._predictions.put(prediction_key, prediction)
+                    plan = self.pipeline.optimizer.solve(
+                        prediction=prediction,
+                        objective=template.objective,
+                        constraints=template.constraints,
+                        optimization=template.optimization,
+                        context=context,
+                    )
+                    self._plans.put(plan_key, plan)
+                decision = self.pipeline.guardrail.validate(plan, context, template.guardrail)
+                outcome = _SampleOutcome(plan.solver_status, bool(decision.violations), decision.approved)
+                self._outcomes.put(outcome_key, outcome)
+            outcomes.append(outcome)
+        return outcomes
+
+    def _outcome(self, result) -> _SampleOutcome:
+        return _SampleOutcome(result.plan.solver_status, bool(result.guardrail.violations), result.executed)
 
     def _semantic_score(self, template, validation, issues: list[TemplateQualityIssue]) -> float:
         fields = set(template.field_dictionary.field_names())
@@ -144,11 +507,11 @@ class TemplateQualityEvaluator:
             score = max(0.0, round(score - validation.conflict_rate, 4))
         return score
 
-    def _solvability_score(self, pipeline_results: Iterable) -> float:
-        results = list(pipeline_results)
+    def _solvability_score(self, outcomes: Iterable[_SampleOutcome]) -> float:
+        results = list(outcomes)
         if not results:
             return 0.0
-        solved = sum(1 for item in results if item.plan.solver_status == "solved")
+        solved = sum(1 for item in results if item.solver_status == "solved")
         return round(solved / len(results), 4)
 
     def _guardrail_coverage(self, template: ScenarioTemplate) -> float:
@@ -162,12 +525,12 @@ class TemplateQualityEvaluator:
         covered = {item.field_name for item in template.guardrail.rules}
         return round(len(target.intersection(covered)) / len(target), 4)
 
-    def _regression_score(self, samples: list[SimulationSample], results: list) -> float:
+    def _regression_score(self, samples: list[SimulationSample], results: list[_SampleOutcome]) -> float:
         if not results:
             return 0.0
 
         total = len(results)
-        violations = sum(1 for item in results if item.guardrail.violations)
+        violations = sum(1 for item in results if item.violated)
         violation_rate = violations / total
 
         expected_pairs = [
@@ -186,31 +549,7 @@ class TemplateQualityEvaluator:
         return round(max(0.0, min(1.0, score)), 4)
 
     def _default_samples(self, template: ScenarioTemplate) -> list[SimulationSample]:
-        nominal = {item.field_name: 1.0 for item in template.field_dictionary.fields}
-
-        for constraint in template.constraints:
-            field = constraint.field_name
-            if constraint.operator.value == "ge" and constraint.lower_bound is not None:
-                nominal[field] = constraint.lower_bound + max(1.0, abs(constraint.lower_bound) * 0.05)
-            elif constraint.operator.value == "le" and constraint.upper_bound is not None:
-                nominal[field] = constraint.upper_bound - max(1.0, abs(constraint.upper_bound) * 0.05)
-            elif (
-                constraint.operator.value == "between"
-                and constraint.lower_bound is not None
-                and constraint.upper_bound is not None
-            ):
-                nominal[field] = (constraint.lower_bound + constraint.upper_bound) / 2.0
-            elif constraint.operator.value == "eq" and constraint.equals_value is not None:
-                nominal[field] = constraint.equals_value
-
-        for rule in template.guardrail.rules:
-            field = rule.field_name
-            if rule.min_value is not None and rule.max_value is not None:
-                nominal[field] = (rule.min_value + rule.max_value) / 2.0
-            elif rule.min_value is not None:
-                nominal[field] = rule.min_value + max(0.1, abs(rule.min_value) * 0.05)
-            elif rule.max_value is not None:
-                nominal[field] = rule.max_value - max(0.1, abs(rule.max_value) * 0.05)
+        nominal = nominal_values(template)
 
         stressed = dict(nominal)
         for field in template.field_dictionary.fields:
@@ -264,3 +603,39 @@ class TemplateQualityEvaluator:
                         severity=IssueSeverity.ERROR,
                     )
                 )
+
+
+def _wilson_interval(successes: int, total: int, z: float) -> tuple[float, float]:
+    if total == 0:
+        return 0.0, 1.0
+    rate = successes / total
+    denominator = 1.0 + z * z / total
+    center = (rate + z * z / (2 * total)) / denominator
+    margin = z * math.sqrt(rate * (1.0 - rate) / total + z * z / (4 * total * total)) / denominator
+    return round(max(0.0, center - margin), 4), round(min(1.0, center + margin), 4)
+
+
+def _summarize(values: array, z: float) -> MetricSummary:
+    ordered = sorted(values)
+    count = len(ordered)
+    mean = math.fsum(ordered) / count
+    std = math.sqrt(math.fsum((item - mean) ** 2 for item in ordered) / (count - 1)) if count > 1 else 0.0
+    margin = z * std / math.sqrt(count)
+    return MetricSummary(
+        mean=round(mean, 6),
+        std=round(std, 6),
+        ci_low=round(mean - margin, 6),
+        ci_high=round(mean + margin, 6),
+        p05=round(_percentile(ordered, 0.05), 6),
+        p50=round(_percentile(ordered, 0.50), 6),
+        p95=round(_percentile(ordered, 0.95), 6),
+        min=round(ordered[0], 6),
+        max=round(ordered[-1], 6),
+    )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    position = q * (len(ordered) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
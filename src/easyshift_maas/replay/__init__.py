@@ -0,0 +1,3 @@
+from easyshift_maas.replay.engine import ReplayEngine, iter_snapshot_recording
+
+__all__ = ["ReplayEngine", "iter_snapshot_recording"]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from easyshift_maas.core.contracts import (
+    PipelineResult,
+    ReplayReport,
+    ScenarioTemplate,
+    SceneContext,
+    SnapshotResult,
+)
+from easyshift_maas.core.pipeline import PipelineProtocol, PredictionOptimizationPipeline
+
+
+def iter_snapshot_recording(path: str | Path) -> Iterator[SnapshotResult]:
+    """Yield recorded snapshots from a JSONL file (one ``SnapshotResult`` per line)."""
+
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                yield SnapshotResult.model_validate_json(text)
+            except ValueError as exc:
+                raise ValueError(f"invalid snapshot at {path}:{line_no}: {exc}") from exc
+
+
+class ReplayEngine:
+    """Backtest a template by running recorded snapshots through the pipeline tick by tick.
+
+    Controllable fields guarded by ``max_delta`` start each tick from the previous
+    tick's final setpoint instead of the recorded value, so delta limits are judged
+    against what the template itself would have commanded.
+    """
+
+    # Ticks that are due within this slack run back to back instead of sleeping each.
+    _MIN_SLEEP_S = 0.005
+
+    def __init__(
+        self,
+        pipeline: PipelineProtocol | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.pipeline = pipeline or PredictionOptimizationPipeline()
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(
+        self,
+        template: ScenarioTemplate,
+        snapshots: Iterable[SnapshotResult],
+        *,
+        speed: float | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> ReplayReport:
+        *_, report = self.iter_reports(template, snapshots, speed=speed, report_every=0, metadata=metadata)
+        return report
+
+    def iter_reports(
+        self,
+        template: ScenarioTemplate,
+        snapshots: Iterable[SnapshotResult],
+        *,
+        speed: float | None = None,
+        report_every: int = 100,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[ReplayReport]:
+        """Yield a cumulative report every ``report_every`` ticks and a final completed one.
+
+        ``speed`` replays at that multiple of recorded time (``None`` runs unpaced).
+        """
+
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        controllable = {item.field_name for item in template.field_dictionary.fields if item.controllable}
+        carried_fields = [
+            rule.field_name
+            for rule in template.guardrail.rules
+            if rule.max_delta is not None and rule.field_name in controllable
+        ]
+        accumulator = _ReplayAccumulator(template, self._clock())
+        carried: dict[str, float] = {}
+        wall_start: float | None = None
+        recorded_start = None
+
+        for tick, snapshot in enumerate(snapshots):
+            if speed is not None:
+                if wall_start is None:
+                    wall_start, recorded_start = self._clock(), snapshot.collected_at
+                else:
+                    due = (snapshot.collected_at - recorded_start).total_seconds() / speed
+                    lag = due - (self._clock() - wall_start)
+                    if lag > self._MIN_SLEEP_S:
+                        self._sleep(lag)
+
+            values = dict(snapshot.values)
+            values.update(carried)
+            context = SceneContext(
+                values=values,
+                metadata={**(metadata or {}), "replay_tick": tick},
+                timestamp=snapshot.collected_at,
+            )
+            result = self.pipeline.run(context, template)
+            carried = {
+                field: result.final_setpoints[field] for field in carried_fields if field in result.final_setpoints
+            }
+            accumulator.add(snapshot, result)
+
+            if report_every > 0 and accumulator.total % report_every == 0:
+                yield accumulator.report(self._clock(), completed=False)
+
+        yield accumulator.report(self._clock(), completed=True)
+
+
+class _ReplayAccumulator:
+    # Progress reports carry at most this many evenly spaced trajectory points, so
+    # publishing one stays cheap however long the replay runs; the final report has all.
+    _PREVIEW_POINTS = 200
+
+    def __init__(self, template: ScenarioTemplate, started: float) -> None:
+        self._template_id = template.template_id
+        self._rule_fields = [rule.field_name for rule in template.guardrail.rules]
+        self._started = started
+        self.total = 0
+        self._approved = 0
+        self._violation_ticks = 0
+        self._violation_counts: dict[str, int] = {}
+        self._incomplete = 0
+        self._objective_sum = 0.0
+        self._trajectory: list[float] = []
+        self._first_at = None
+        self._last_at = None
+
+    def add(self, snapshot: SnapshotResult, result: PipelineResult) -> None:
+        self.total += 1
+        if result.executed:
+            self._approved += 1
+        if snapshot.missing_fields:
+            self._incomplete += 1
+        violations = result.guardrail.violations
+        if violations:
+            self._violation_ticks += 1
+            for field in self._rule_fields:
+                if any(_mentions_field(item, field) for item in violations):
+                    self._violation_counts[field] = self._violation_counts.get(field, 0) + 1
+        objective = result.plan.objective_value
+        self._objective_sum += objective
+        self._trajectory.append(objective)
+        if self._first_at is None:
+            self._first_at = snapshot.collected_at
+        self._last_at = snapshot.collected_at
+
+    def report(self, now: float, *, completed: bool) -> ReplayReport:
+        total = self.total
+        return ReplayReport(
+            template_id=self._template_id,
+            total_ticks=total,
+            approved_ticks=self._approved,
+            approval_rate=self._approved / total if total else 0.0,
+            violation_ticks=self._violation_ticks,
+            violation_counts=dict(self._violation_counts),
+            incomplete_ticks=self._incomplete,
+            mean_objective=self._objective_sum / total if total else 0.0,
+            objective_trajectory=(
+                list(self._trajectory) if completed else _downsample(self._trajectory, self._PREVIEW_POINTS)
+            ),
+            first_tick_at=self._first_at,
+            last_tick_at=self._last_at,
+            elapsed_ms=int((now - self._started) * 1000),
+            completed=completed,
+        )
+
+
+def _downsample(values: list[float], limit: int) -> list[float]:
+    """Up to ``limit`` evenly spaced items of ``values``, keeping the first and last."""
+
+    if len(values) <= limit:
+        return list(values)
+    step = (len(values) - 1) / (limit - 1)
+    return [values[round(idx * step)] for idx in range(limit)]
+
+
+def _mentions_field(violation: str, field: str) -> bool:
+    # RuleGuardrail messages start with the field name or end with it for missing fields.
+    return violation.startswith(f"{field} ") or violation == f"missing field in plan: {field}"
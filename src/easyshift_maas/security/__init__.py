@@ -1,4 +1,5 @@
 from easyshift_maas.security.secrets import (
+    CachingSecretResolver,
     ChainedSecretResolver,
     EnvSecretResolver,
     FileSecretResolver,
@@ -10,4 +11,5 @@ __all__ = [
     "EnvSecretResolver",
     "FileSecretResolver",
     "ChainedSecretResolver",
+    "CachingSecretResolver",
 ]
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 from urllib.parse import parse_qsl, urlparse
 
 import yaml
 
+from easyshift_maas.core.hashing import canonical_digest
+
 
 class SecretResolverProtocol(Protocol):
     def resolve(self, conn_ref: str) -> dict[str, Any]: ...
@@ -109,3 +115,92 @@ class ChainedSecretResolver:
                 continue
         joined = "; ".join(errors) if errors else "no resolver configured"
         raise KeyError(f"unable to resolve conn_ref '{conn_ref}': {joined}")
+
+
+@dataclass
+class _CachedSecret:
+    payload: dict[str, Any]
+    fingerprint: Any
+    expires_at: float
+
+
+class CachingSecretResolver:
+    """Cache resolved secrets in front of another resolver.
+
+    Entries expire after ``ttl_s`` and are dropped early when the source changes:
+    ``file:`` refs are checked by mtime and size, env refs by a digest of the raw
+    variable. Callers receive copies, and resolved values are never logged.
+    """
+
+    def __init__(
+        self,
+        inner: SecretResolverProtocol | None = None,
+        ttl_s: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be positive")
+        self._inner = inner or ChainedSecretResolver()
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: dict[str, _CachedSecret] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def resolve(self, conn_ref: str) -> dict[str, Any]:
+        fingerprint = self._fingerprint(conn_ref)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(conn_ref)
+            if entry is not None:
+                if entry.expires_at > now and entry.fingerprint == fingerprint:
+                    self._hits += 1
+                    return copy.deepcopy(entry.payload)
+                self._invalidations += 1
+                del self._entries[conn_ref]
+            self._misses += 1
+
+        payload = self._inner.resolve(conn_ref)
+        with self._lock:
+            self._entries[conn_ref] = _CachedSecret(
+                payload=copy.deepcopy(payload),
+                fingerprint=fingerprint,
+                expires_at=now + self._ttl_s,
+            )
+        return copy.deepcopy(payload)
+
+    def connection_key(self, conn_ref: str) -> str:
+        """Stable key for reusing clients; changes whenever the resolved secret changes."""
+
+        return canonical_digest({"conn_ref": conn_ref, "payload": self.resolve(conn_ref)})
+
+    def invalidate(self, conn_ref: str | None = None) -> None:
+        with self._lock:
+            if conn_ref is None:
+                self._invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(conn_ref, None) is not None:
+                self._invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+    def _fingerprint(self, conn_ref: str) -> Any:
+        if conn_ref.startswith("file:"):
+            try:
+                stat = Path(conn_ref.split(":", 1)[1]).stat()
+            except OSError:
+                return None
+            return (stat.st_mtime_ns, stat.st_size)
+
+        key = conn_ref.split(":", 1)[1] if conn_ref.startswith("env:") else conn_ref
+        raw = os.environ.get(key)
+        return None if raw is None else canonical_digest(raw)
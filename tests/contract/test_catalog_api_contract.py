@@ -37,6 +37,7 @@ point_catalog:
     payload = import_resp.json()
     assert payload["catalog_id"] == "api-line-catalog"
     assert payload["binding_count"] == 2
+    assert payload["version"] == "v1"
 
     get_resp = client.get("/v1/catalogs/api-line-catalog")
     assert get_resp.status_code == 200
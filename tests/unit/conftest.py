@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+
+class SlowAsyncLLM:
+    """Async fake LLM: every call sleeps, so concurrent runs overlap only if nothing blocks."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    def complete_json(self, **kwargs):
+        raise AssertionError("sync path must not be used")
+
+    async def acomplete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        if role == "parser":
+            return {"mappings": [], "unmapped_points": list(user_payload["legacy_points"])}, {}
+        if role == "generator":
+            return {
+                "objective": {"terms": [{"field_name": "energy_cost", "direction": "min", "weight": 1.0}]},
+                "guardrail": {"rules": [{"field_name": "energy_cost", "max_delta": 0.2}]},
+            }, {"role": role}
+        return {"is_fatal_error": True, "analysis": "stop", "correction_instruction": "none"}, {}
+
+
+@pytest.fixture
+def slow_async_llm() -> SlowAsyncLLM:
+    return SlowAsyncLLM()
@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from easyshift_maas.agentic.batch import BatchMigrationRunner
+from easyshift_maas.agentic.critic_agent import CriticAgent
+from easyshift_maas.agentic.generator_agent import GeneratorAgent
+from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
+from easyshift_maas.agentic.parser_agent import ParserAgent
+from easyshift_maas.api.app import app
+from easyshift_maas.core.contracts import MigrationManifest
+
+_FIELDS = {
+    "fields": [
+        {"field_name": "energy_cost", "semantic_label": "cost", "unit": "$/h"},
+        {"field_name": "boiler_temp", "semantic_label": "temperature", "unit": "C", "controllable": True},
+    ]
+}
+
+
+def test_batch_runner_bounds_concurrency_and_summarizes(slow_async_llm) -> None:
+    llm = slow_async_llm
+    parser = ParserAgent(llm_client=llm)
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=parser,
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+    )
+    scenes = [
+        {"scene_metadata": {"scene_id": f"batch-{idx}"}, "legacy_points": [f"ENERGY_COST_{idx}"]} for idx in range(12)
+    ]
+    scenes.append({"scene_metadata": {"scene_id": "broken"}, "raw_yaml_path": "/nonexistent/points.yaml"})
+    manifest = MigrationManifest.model_validate(
+        {"scenes": scenes, "field_dictionary": _FIELDS, "max_iterations": 1, "max_concurrency": 3}
+    )
+
+    items, summary = asyncio.run(BatchMigrationRunner(workflow).run(manifest))
+
+    assert llm.peak <= 3
+    assert [item.index for item in items] == list(range(13))
+    assert items[-1].report is None and "FileNotFoundError" in items[-1].error
+    assert summary.total == summary.completed == 13
+    assert summary.errored == 1
+    assert summary.approved + summary.blocked == 12
+    assert summary.mean_iterations == 1.0
+    # Every scene shares one dictionary, so the parser builds its field index once.
+    assert len(parser._indexes) == 1
+
+
+def test_batch_runner_caps_llm_calls_across_scenes(slow_async_llm) -> None:
+    llm = slow_async_llm
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+    )
+    manifest = MigrationManifest.model_validate(
+        {
+            "scenes": [{"scene_metadata": {"scene_id": f"cap-{idx}"}, "legacy_points": ["X"]} for idx in range(8)],
+            "field_dictionary": _FIELDS,
+            "max_iterations": 1,
+            "candidates_per_iteration": 3,
+            "max_concurrency": 4,
+            "max_llm_concurrency": 2,
+        }
+    )
+
+    items, summary = asyncio.run(BatchMigrationRunner(workflow).run(manifest))
+
+    assert llm.peak == 2
+    assert summary.errored == 0 and len(items) == 8
+
+
+def test_agentic_batch_endpoint_streams_ndjson() -> None:
+    client = TestClient(app)
+    manifest = {
+        "scenes": [{"scene_metadata": {"scene_id": f"stream-{idx}"}} for idx in range(3)],
+        "field_dictionary": _FIELDS,
+        "max_iterations": 1,
+    }
+
+    response = client.post("/v1/agentic/batch", json=manifest)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["scene_id"] for line in lines[:-1]) == ["stream-0", "stream-1", "stream-2"]
+    assert lines[-1]["summary"]["completed"] == 3
+
+    invalid = client.post("/v1/agentic/batch", json={"scenes": [{"scene_metadata": {"scene_id": "x"}}]})
+    assert invalid.status_code == 422
@@ -1,3 +1,5 @@
+import asyncio
+
 from easyshift_maas.agentic.critic_agent import CriticAgent
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.langgraph_workflow import LangGraphMigrationWorkflow
@@ -37,6 +39,9 @@ def test_reflection_loop_returns_report() -> None:
     assert report.status.value in {"approved", "blocked"}
     assert report.iterations_used >= 1
     assert report.parser_result is not None
+    assert "guardrail" in report.reflections[0].changed_sections
+    for step in report.reflections[1:]:
+        assert "scene_metadata" not in step.changed_sections
 
 
 def test_critic_produces_instruction_on_failure() -> None:
@@ -57,3 +62,319 @@ def test_critic_produces_instruction_on_failure() -> None:
 
     assert feedback.correction_instruction
     assert feedback.confidence >= 0.0
+
+
+def test_async_runs_share_the_event_loop(slow_async_llm) -> None:
+    llm = slow_async_llm
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+    )
+
+    async def _run_many() -> list:
+        return await asyncio.gather(
+            *(
+                workflow.arun(
+                    scene_metadata=SceneMetadata(scene_id=f"async-{idx}"),
+                    field_dictionary=_fields(),
+                    nl_requirements=[],
+                    legacy_points=["ENERGY_COST"],
+                    max_iterations=1,
+                )
+                for idx in range(20)
+            )
+        )
+
+    reports = asyncio.run(_run_many())
+
+    assert llm.peak == 20
+    assert all(item.parser_result.strategy == "llm_semantic_mapping" for item in reports)
+    assert all(item.final_draft.generation_strategy == "llm_primary" for item in reports)
+
+
+class _TemperatureLLM:
+    def __init__(self) -> None:
+        self.temperatures: list[float] = []
+
+    def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+        if role == "parser":
+            return {"mappings": [], "unmapped_points": list(user_payload["legacy_points"])}, {}
+        if role == "generator":
+            self.temperatures.append(temperature)
+            field = "energy_cost" if temperature < 0.5 else "efficiency"
+            return {
+                "objective": {"terms": [{"field_name": field, "direction": "min", "weight": 1.0}]},
+                "guardrail": {"rules": []},
+            }, {}
+        return {"is_fatal_error": True, "analysis": "stop", "correction_instruction": "none"}, {}
+
+
+def test_best_of_n_scores_candidates_and_keeps_best() -> None:
+    llm = _TemperatureLLM()
+    validator = TemplateValidator()
+    quality = TemplateQualityEvaluator(validator=validator)
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        validator=validator,
+        quality_evaluator=quality,
+    )
+
+    report = workflow.run(
+        scene_metadata=SceneMetadata(scene_id="bon-scene"),
+        field_dictionary=_fields(),
+        nl_requirements=[],
+        max_iterations=1,
+        candidates_per_iteration=3,
+    )
+
+    assert sorted(llm.temperatures) == [0.1, 1.0]
+    assert report.reflections[-1].candidates_evaluated == 3
+    rule_draft = GeneratorAgent(llm_client=None).generate(
+        scene_metadata=SceneMetadata(scene_id="bon-scene"), field_dictionary=_fields(), nl_requirements=[]
+    )
+    assert report.quality.overall_score >= quality.evaluate(rule_draft.template).overall_score
+    assert report.quality.overall_score == quality.evaluate(report.final_draft.template).overall_score
+
+
+def test_fail_fast_validation_agrees_with_full_report() -> None:
+    from easyshift_maas.core.contracts import ConstraintOperator, ConstraintSpec, GuardrailSpec
+
+    validator = TemplateValidator()
+    draft = GeneratorAgent(llm_client=None).generate(
+        scene_metadata=SceneMetadata(scene_id="ff-scene"), field_dictionary=_fields(), nl_requirements=[]
+    )
+    template = draft.template
+    broken = template.model_copy(
+        update={
+            "constraints": [
+                *template.constraints,
+                ConstraintSpec(name="a", field_name="ghost", operator=ConstraintOperator.LE, upper_bound=1.0),
+                ConstraintSpec(name="b", field_name="boiler_temp", operator=ConstraintOperator.GE, lower_bound=9e9),
+                ConstraintSpec(name="c", field_name="boiler_temp", operator=ConstraintOperator.LE, upper_bound=0.0),
+            ]
+        }
+    )
+    unguarded = template.model_copy(update={"guardrail": GuardrailSpec(rules=[])})
+
+    for candidate in (template, broken, unguarded):
+        item = draft.model_copy(update={"template": candidate})
+        full = validator.validate(item)
+        fast = validator.validate(item, fail_fast=True)
+        assert validator.is_valid(item) is full.valid is fast.valid
+        assert fast.issues == full.issues[:1]
+
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(),
+        generator_agent=GeneratorAgent(),
+        critic_agent=CriticAgent(),
+        validator=validator,
+    )
+    drafts = [draft.model_copy(update={"template": broken}), draft]
+    assert workflow._contenders(drafts) == [1]
+    scores = workflow._score_all(drafts=drafts, regression_samples=None, gate=None)
+    assert scores[0] is None and workflow._pick_best(drafts, scores)[0] is draft
+
+
+class _CountingLLM:
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {"parser": 0, "generator": 0, "critic": 0}
+
+    def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+        self.calls[role] += 1
+        if role == "parser":
+            return {"mappings": [], "unmapped_points": list(user_payload["legacy_points"])}, {}
+        if role == "generator":
+            return {
+                "objective": {"terms": [{"field_name": "energy_cost", "direction": "min", "weight": 1.0}]},
+                "guardrail": {"rules": []},
+            }, {}
+        return {"is_fatal_error": False, "analysis": "retry", "correction_instruction": "add guardrails"}, {}
+
+
+def test_interrupted_run_resumes_from_checkpoint() -> None:
+    import pytest
+
+    from easyshift_maas.agentic.checkpoints import InMemoryCheckpointStore
+
+    llm = _CountingLLM()
+    store = InMemoryCheckpointStore()
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        checkpoint_store=store,
+    )
+    inputs = {
+        "scene_metadata": SceneMetadata(scene_id="resume-scene"),
+        "field_dictionary": _fields(),
+        "nl_requirements": [],
+        "legacy_points": ["B_T_01"],
+        "max_iterations": 2,
+    }
+
+    # Parse, generate and score complete; the run stops before the critic review.
+    polls = iter([False, False, False, True])
+    with pytest.raises(RuntimeError):
+        workflow.run(**inputs, run_id="run-resume", cancel_check=lambda: next(polls))
+    state = store.load("run-resume")
+    assert state.last_step == "score" and len(state.candidate_drafts) == 1
+    assert llm.calls == {"parser": 1, "generator": 1, "critic": 0}
+
+    report = workflow.resume("run-resume")
+    assert llm.calls == {"parser": 1, "generator": 2, "critic": 2}
+    assert report.run_id == "run-resume" and report.iterations_used == 2
+    assert [step.iteration for step in report.reflections] == [1, 2]
+    assert workflow.resume("run-resume") == report
+    assert store.load("run-resume").last_step == "done"
+
+    # Same legacy inputs again: the parse step comes from the parse cache.
+    workflow.run(**inputs)
+    assert llm.calls["parser"] == 1
+
+
+class _FlakyParserLLM(_CountingLLM):
+    def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+        if role == "parser" and self.calls["parser"] < 2:
+            self.calls["parser"] += 1
+            raise RuntimeError("upstream timeout")
+        return super().complete_json(
+            role=role, system_prompt=system_prompt, user_payload=user_payload, temperature=temperature
+        )
+
+
+def test_fallback_parse_results_are_not_cached() -> None:
+    from easyshift_maas.agentic.checkpoints import InMemoryCheckpointStore
+
+    llm = _FlakyParserLLM()
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        checkpoint_store=InMemoryCheckpointStore(),
+    )
+    inputs = {
+        "scene_metadata": SceneMetadata(scene_id="flaky-scene"),
+        "field_dictionary": _fields(),
+        "nl_requirements": [],
+        "legacy_points": ["B_T_01"],
+        "max_iterations": 1,
+    }
+
+    first = workflow.run(**inputs)
+    assert first.parser_result.strategy != "llm_semantic_mapping" and first.parser_result.warnings
+    second = workflow.run(**inputs)
+    assert second.parser_result.strategy == "llm_semantic_mapping"
+    workflow.run(**inputs)
+    assert llm.calls["parser"] == 3
+
+
+def test_parse_cache_misses_when_parser_prompt_or_budget_changes() -> None:
+    from easyshift_maas.agentic.checkpoints import InMemoryCheckpointStore
+
+    llm = _CountingLLM()
+    parser = ParserAgent(llm_client=llm)
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=parser,
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        checkpoint_store=InMemoryCheckpointStore(),
+    )
+    inputs = {
+        "scene_metadata": SceneMetadata(scene_id="keyed-scene"),
+        "field_dictionary": _fields(),
+        "nl_requirements": [],
+        "legacy_points": ["B_T_01"],
+        "max_iterations": 1,
+    }
+
+    workflow.run(**inputs)
+    workflow.run(**inputs)
+    assert llm.calls["parser"] == 1
+    parser.prompt += "\nPrefer exact alias matches."
+    workflow.run(**inputs)
+    assert llm.calls["parser"] == 2
+    parser.chunk_token_budget += 1000
+    workflow.run(**inputs)
+    assert llm.calls["parser"] == 3
+
+
+def test_sqlite_checkpoints_expire_and_stay_bounded(tmp_path) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+
+    from easyshift_maas.agentic.checkpoints import SQLiteCheckpointStore
+    from easyshift_maas.core.contracts import AgenticRunState, ParserResult
+
+    now = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+    store = SQLiteCheckpointStore(
+        tmp_path / "checkpoints.sqlite", max_runs=10, max_parse_entries=10, ttl_s=60.0, clock=lambda: now[0]
+    )
+    state = AgenticRunState(scene_metadata=SceneMetadata(scene_id="s"), field_dictionary=_fields())
+    for idx in range(11):
+        now[0] += timedelta(seconds=1)
+        store.save(state.model_copy(update={"run_id": f"run-{idx}"}))
+        store.put_parse(f"key-{idx}", ParserResult(strategy="llm_semantic_mapping"))
+
+    # Trimmed to 90% of the cap, oldest first.
+    assert store._counts == {"run_checkpoints": 9, "parse_cache": 9}
+    assert store.load("run-10").run_id == "run-10" and store.get_parse("key-10") is not None
+    assert store.get_parse("key-0") is None
+
+    now[0] += timedelta(seconds=120)
+    assert store.get_parse("key-10") is None
+    with pytest.raises(KeyError):
+        store.load("run-10")
+
+
+def test_async_runs_do_checkpoint_io_off_the_event_loop(slow_async_llm) -> None:
+    import threading
+
+    from easyshift_maas.agentic.checkpoints import InMemoryCheckpointStore
+
+    class _ThreadRecordingStore(InMemoryCheckpointStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.threads: set[int] = set()
+
+        def save(self, state) -> None:
+            self.threads.add(threading.get_ident())
+            super().save(state)
+
+        def load(self, run_id):
+            self.threads.add(threading.get_ident())
+            return super().load(run_id)
+
+        def get_parse(self, key):
+            self.threads.add(threading.get_ident())
+            return super().get_parse(key)
+
+    llm = slow_async_llm
+    store = _ThreadRecordingStore()
+    workflow = LangGraphMigrationWorkflow(
+        parser_agent=ParserAgent(llm_client=llm),
+        generator_agent=GeneratorAgent(llm_client=llm),
+        critic_agent=CriticAgent(llm_client=llm),
+        checkpoint_store=store,
+    )
+
+    async def _run() -> tuple[int, object]:
+        report = await workflow.arun(
+            scene_metadata=SceneMetadata(scene_id="async-store"),
+            field_dictionary=_fields(),
+            nl_requirements=[],
+            legacy_points=["ENERGY_COST"],
+            max_iterations=1,
+            run_id="async-store",
+        )
+        assert await workflow.aresume("async-store") == report
+        return threading.get_ident(), report
+
+    loop_thread, report = asyncio.run(_run())
+
+    assert store.threads and loop_thread not in store.threads
+    assert store.load("async-store").last_step == "done"
+    assert report.run_id == "async-store"
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from easyshift_maas.api.app import app
+from easyshift_maas.core.contracts import GuardrailSpec, TemplateQualityGate
+from easyshift_maas.examples.synthetic_templates import build_energy_efficiency_template
+from easyshift_maas.quality.bulk import BulkQualityRunner
+from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
+
+
+def _fleet() -> list:
+    base = build_energy_efficiency_template()
+    weak = base.model_copy(update={"version": "v2", "guardrail": GuardrailSpec(rules=[])})
+    other = base.model_copy(update={"template_id": "other"})
+    republished = base.model_copy(update={"created_at": base.created_at.replace(year=2001)})
+    return [base, weak, other, republished]
+
+
+def test_bulk_runner_matches_sequential_evaluation() -> None:
+    fleet = _fleet()
+    evaluator = TemplateQualityEvaluator(cache_size=0)
+    expected = {(item.template_id, item.version): evaluator.evaluate(item) for item in fleet}
+
+    pooled, summary = BulkQualityRunner(max_workers=2, chunk_size=1).run(fleet)
+    inline, _ = BulkQualityRunner(max_workers=0).run(fleet)
+
+    for items in (pooled, inline):
+        assert len(items) == 4
+        for item in items:
+            assert item.error is None
+            assert item.report == expected[(item.template_id, item.version)]
+    assert sum(item.deduplicated for item in pooled) == 1
+    assert summary.total == summary.completed == 4
+    assert summary.passed + summary.failed == 4 and summary.errored == 0
+    assert summary.issue_counts.get("GUARDRAIL_LOW", 0) >= 1
+
+
+def test_concurrent_in_process_runs_keep_their_own_gate() -> None:
+    fleet = _fleet()
+    gates = [TemplateQualityGate(overall_min=0.0), TemplateQualityGate(overall_min=1.0)]
+    evaluator = TemplateQualityEvaluator(cache_size=0)
+    expected = [
+        {(item.template_id, item.version): evaluator.evaluate(item, gate=gate).passed for item in fleet}
+        for gate in gates
+    ]
+
+    def _run(idx: int) -> tuple[int, list]:
+        items, _ = BulkQualityRunner(max_workers=0).run(fleet, gate=gates[idx % 2])
+        return idx % 2, items
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        runs = list(pool.map(_run, range(12)))
+
+    for which, items in runs:
+        assert all(item.error is None for item in items)
+        assert {(item.template_id, item.version): item.report.passed for item in items} == expected[which]
+
+
+def test_bulk_quality_job_streams_into_job_record() -> None:
+    client = TestClient(app)
+    payload = {
+        "inline_templates": [item.model_dump(mode="json") for item in _fleet()[:2]],
+        "max_workers": 0,
+    }
+
+    submitted = client.post("/v1/templates/quality-check/bulk", json=payload)
+    assert submitted.status_code == 202
+
+    job = client.get(f"/v1/templates/quality-check/bulk/{submitted.json()['job_id']}").json()
+    assert job["status"] == "succeeded"
+    assert job["result"]["summary"]["completed"] == 2
+    assert {item["version"] for item in job["result"]["items"]} == {"v1", "v2"}
+    assert client.post("/v1/templates/quality-check/bulk", json={"template_ids": ["missing"]}).status_code == 404
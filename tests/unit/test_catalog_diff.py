@@ -0,0 +1,67 @@
+from easyshift_maas.core.contracts import DataSourceKind, DataSourceProfile, PointBinding, PointCatalog
+from easyshift_maas.ingestion.catalog_diff import apply_catalog_diff, bump_version, diff_catalogs
+from easyshift_maas.ingestion.catalog_index import CatalogIndexCache
+
+
+def _binding(point_id: str, kind: DataSourceKind, ref: str) -> PointBinding:
+    return PointBinding(point_id=point_id, source_type=kind, source_ref=ref, field_name=point_id.lower())
+
+
+def test_diff_applies_only_changed_bindings() -> None:
+    current = PointCatalog(
+        catalog_id="line",
+        version="v3",
+        bindings=[
+            _binding("P1", DataSourceKind.REDIS, "r1"),
+            _binding("P2", DataSourceKind.REDIS, "r2"),
+            _binding("P3", DataSourceKind.MYSQL, "m3"),
+        ],
+    )
+    incoming = PointCatalog(
+        catalog_id="line",
+        bindings=[
+            _binding("P1", DataSourceKind.REDIS, "r1"),
+            _binding("P2", DataSourceKind.REDIS, "r2-new"),
+            _binding("P4", DataSourceKind.REDIS, "r4"),
+        ],
+    )
+
+    diff = diff_catalogs(current, incoming)
+    updated = apply_catalog_diff(current, incoming, diff)
+
+    assert (diff.added, diff.removed, diff.changed, diff.unchanged_count) == (["P4"], ["P3"], ["P2"], 1)
+    assert diff.affected_kinds == [DataSourceKind.MYSQL, DataSourceKind.REDIS]
+    assert updated.version == "v4"
+    assert updated.bindings[0] is current.bindings[0]
+    assert [item.source_ref for item in updated.bindings] == ["r1", "r2-new", "r4"]
+
+    unchanged = diff_catalogs(updated, updated.model_copy())
+    assert apply_catalog_diff(updated, updated.model_copy(), unchanged) is updated
+    assert bump_version("2024.09") == "2024.10"
+    assert bump_version("draft") == "draft.1"
+
+
+def test_index_invalidation_keeps_profiles_for_unaffected_kinds() -> None:
+    current = PointCatalog(
+        catalog_id="line",
+        bindings=[_binding("P1", DataSourceKind.REDIS, "r1"), _binding("P2", DataSourceKind.MYSQL, "m2")],
+    )
+    incoming = PointCatalog(
+        catalog_id="line",
+        bindings=[_binding("P1", DataSourceKind.REDIS, "r1-new"), _binding("P2", DataSourceKind.MYSQL, "m2")],
+    )
+    profiles = [
+        DataSourceProfile(name="redis", kind=DataSourceKind.REDIS, conn_ref="env:R"),
+        DataSourceProfile(name="mysql", kind=DataSourceKind.MYSQL, conn_ref="env:M"),
+    ]
+    cache = CatalogIndexCache()
+    index = cache.get(current)
+    index.profile_for(DataSourceKind.REDIS, profiles)
+    index.profile_for(DataSourceKind.MYSQL, profiles)
+
+    diff = diff_catalogs(current, incoming)
+    cache.invalidate("line", diff)
+    rebuilt = cache.get(apply_catalog_diff(current, incoming, diff))
+
+    _, resolved = rebuilt.resolved_profiles(exclude=set())
+    assert set(resolved) == {DataSourceKind.MYSQL}
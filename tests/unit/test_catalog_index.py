@@ -0,0 +1,49 @@
+from easyshift_maas.core.contracts import DataSourceKind, DataSourceProfile, PointBinding, PointCatalog
+from easyshift_maas.ingestion.catalog_index import CatalogIndexCache
+from easyshift_maas.ingestion.repository import InMemoryCatalogRepository
+
+
+def _catalog(version: str = "v1") -> PointCatalog:
+    return PointCatalog(
+        catalog_id="line",
+        version=version,
+        source_profile="mysql_main",
+        bindings=[
+            PointBinding(point_id="P1", source_type=DataSourceKind.REDIS, source_ref="r1", field_name="a"),
+            PointBinding(point_id="P2", source_type=DataSourceKind.MYSQL, source_ref="m2", field_name="b"),
+            PointBinding(point_id="P3", source_type=DataSourceKind.REDIS, source_ref="r3", field_name="c"),
+            PointBinding(point_id="P4", source_type=DataSourceKind.REDIS, source_ref="r4", field_name="d", enabled=False),
+        ],
+    )
+
+
+def test_index_selects_subsets_in_catalog_order_and_memoizes_profiles() -> None:
+    cache = CatalogIndexCache()
+    catalog = _catalog()
+    index = cache.get(catalog)
+    profiles = [
+        DataSourceProfile(name="mysql_other", kind=DataSourceKind.MYSQL, conn_ref="env:A"),
+        DataSourceProfile(name="mysql_main", kind=DataSourceKind.MYSQL, conn_ref="env:B"),
+    ]
+
+    subset = index.select(["c", "a", "d"])
+
+    assert [item.point_id for item in subset[DataSourceKind.REDIS]] == ["P1", "P3"]
+    assert DataSourceKind.MYSQL not in subset
+    assert [item.point_id for item in index.select(None)[DataSourceKind.REDIS]] == ["P1", "P3"]
+    assert index.profile_for(DataSourceKind.MYSQL, profiles).name == "mysql_main"
+    assert index.profile_for(DataSourceKind.REDIS, profiles) is None
+    assert cache.get(catalog) is index
+
+
+def test_repository_put_invalidates_cached_index() -> None:
+    cache = CatalogIndexCache()
+    repository = InMemoryCatalogRepository()
+    repository.add_listener(cache.invalidate)
+    repository.put(_catalog())
+    first = cache.get(repository.get("line"))
+
+    repository.put(_catalog("v2"))
+
+    assert cache.get(repository.get("line")) is not first
+    assert cache.get(repository.get("line")).catalog.version == "v2"
@@ -1,3 +1,6 @@
+import os
+import time
+
 from easyshift_maas.core.contracts import CatalogLoadMode
 from easyshift_maas.ingestion.catalog_loader import YamlCatalogLoader
 
@@ -74,3 +77,49 @@ real_time_inputs:
     assert len({item.point_id for item in result.catalog.bindings}) == len(result.catalog.bindings)
     assert len([item for item in result.catalog.bindings if item.source_ref == "RAA10BQ101"]) == 2
     assert result.field_dictionary.has_field("air_preheater_outlet_oxygen_content_a1")
+
+
+def test_ndjson_catalog_load_and_cache(tmp_path) -> None:
+    path = tmp_path / "catalog.ndjson"
+    path.write_text(
+        '{"scene": {"scene_id": "nd"}, "point_catalog": {"catalog_id": "nd-catalog"}}\n'
+        '{"point_id": "P1", "source_ref": "r:1", "field_name": "temp"}\n'
+        '{"point_id": "P2", "source_type": "nosuch", "source_ref": "r:2"}\n'
+        '{"point_id": "P3", "source_type": "mysql", "source_ref": "m:3"}\n',
+        encoding="utf-8",
+    )
+    loader = YamlCatalogLoader()
+
+    first = loader.load(yaml_path=str(path))
+    second = loader.load(yaml_path=str(path))
+
+    assert [item.point_id for item in first.catalog.bindings] == ["P1", "P3"]
+    assert any(item.startswith("invalid binding P2") for item in first.warnings)
+    # Hits share the cached, read-only result.
+    assert second is first
+
+    # Same size and mtime, different content: the cache must not serve the old catalog.
+    stat = path.stat()
+    path.write_text(path.read_text(encoding="utf-8").replace('"P1"', '"Q1"'), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert loader.load(yaml_path=str(path)).catalog.bindings[0].point_id == "Q1"
+
+
+def test_catalog_cache_hit_is_cheaper_than_a_cold_load(tmp_path) -> None:
+    path = tmp_path / "catalog.yaml"
+    path.write_text(
+        "scene: {scene_id: big}\npoint_catalog:\n  bindings:\n"
+        + "".join(f"    - {{point_id: P{idx}, source_ref: 'r:{idx}', field_name: f{idx}}}\n" for idx in range(3000)),
+        encoding="utf-8",
+    )
+    loader = YamlCatalogLoader()
+
+    started = time.perf_counter()
+    cold = loader.load(yaml_path=str(path))
+    cold_s = time.perf_counter() - started
+    started = time.perf_counter()
+    hit = loader.load(yaml_path=str(path))
+    hit_s = time.perf_counter() - started
+
+    assert hit is cold and len(hit.catalog.bindings) == 3000
+    assert hit_s * 10 < cold_s
@@ -0,0 +1,46 @@
+import random
+
+from easyshift_maas.agentic.field_matcher import FieldTokenIndex, tokenize
+from easyshift_maas.core.contracts import FieldDefinition, FieldDictionary
+
+
+def _brute_force(legacy_name: str, dictionary: FieldDictionary) -> tuple[str | None, float]:
+    best_field = None
+    best_score = 0.0
+    legacy_tokens = tokenize(legacy_name)
+    for field in dictionary.fields:
+        target = tokenize(field.field_name) | tokenize(field.semantic_label)
+        if not target:
+            continue
+        score = len(legacy_tokens & target) / len(legacy_tokens | target)
+        if score > best_score:
+            best_score = score
+            best_field = field.field_name
+    return best_field, best_score
+
+
+def test_index_matches_linear_jaccard_scan() -> None:
+    rng = random.Random(7)
+    words = ["coal", "flow", "temp", "drum", "level", "feed", "water", "steam", "pressure", "a1", "b2"]
+    fields = [
+        FieldDefinition(
+            field_name="_".join(rng.sample(words, rng.randint(1, 3))) + f"_{idx}",
+            semantic_label=" ".join(rng.sample(words, rng.randint(0, 3))),
+            unit="-",
+        )
+        for idx in range(200)
+    ]
+    fields.append(FieldDefinition(field_name="__", semantic_label="", unit="-"))
+    dictionary = FieldDictionary(fields=fields)
+    index = FieldTokenIndex(dictionary)
+    bounded = FieldTokenIndex(dictionary, memo_size=8)
+
+    for _ in range(500):
+        legacy = "-".join(rng.sample(words, rng.randint(0, 4))).upper()
+        expected = _brute_force(legacy, dictionary)
+        assert index.best_match(legacy) == expected
+        assert bounded.best_match(legacy) == expected
+    assert len(bounded._memo) == 8 < len(index._memo)
+
+    assert index.has_field("__")
+    assert not index.has_field("missing")
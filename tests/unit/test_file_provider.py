@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from easyshift_maas.core.contracts import (
+    DataSourceKind,
+    DataSourceOptions,
+    DataSourceProfile,
+    PointBinding,
+    PointCatalog,
+    SnapshotRequest,
+    SnapshotWindowRequest,
+)
+from easyshift_maas.ingestion.providers.file_provider import CsvRecording, FileSnapshotProvider
+from easyshift_maas.ingestion.snapshot_provider import CompositeSnapshotProvider
+
+
+class _StaticResolver:
+    def resolve(self, conn_ref: str) -> dict:
+        return {}
+
+
+def _setup(tmp_path):
+    recording = tmp_path / "capture.csv"
+    recording.write_text(
+        "ts,T1,T2\n"
+        "1704067200,1.0,10\n"
+        "1704067230,2.0,\n"
+        "1704067320,3.0,30\n",
+        encoding="utf-8",
+    )
+    catalog = PointCatalog(
+        catalog_id="replay",
+        source_profile="capture",
+        bindings=[
+            PointBinding(point_id="P1", source_type=DataSourceKind.FILE, source_ref="T1", field_name="temp"),
+            PointBinding(point_id="P2", source_type=DataSourceKind.FILE, source_ref="T2", field_name="flow", transform="scale:2"),
+            PointBinding(point_id="P3", source_type=DataSourceKind.FILE, source_ref="T9", field_name="absent"),
+        ],
+    )
+    profiles = [
+        DataSourceProfile(
+            name="capture",
+            kind=DataSourceKind.FILE,
+            conn_ref="env:REFLEXFLOW_FILE_CONN",
+            options=DataSourceOptions(file_path=str(recording)),
+        )
+    ]
+    return catalog, profiles
+
+
+def test_file_snapshot_reads_as_of_row(tmp_path) -> None:
+    catalog, profiles = _setup(tmp_path)
+    composite = CompositeSnapshotProvider(providers=[FileSnapshotProvider()])
+
+    latest = composite.fetch(
+        request=SnapshotRequest(catalog_id="replay"), catalog=catalog, profiles=profiles, secret_resolver=_StaticResolver()
+    )
+    as_of = composite.fetch(
+        request=SnapshotRequest(catalog_id="replay", at=datetime(2024, 1, 1, 0, 0, 45, tzinfo=timezone.utc)),
+        catalog=catalog,
+        profiles=profiles,
+        secret_resolver=_StaticResolver(),
+    )
+
+    assert latest.values == {"temp": 3.0, "flow": 60.0}
+    assert as_of.values == {"temp": 2.0}
+    assert as_of.quality_flags["flow"] == "missing"
+    assert as_of.value_timestamps["temp"] == datetime(2024, 1, 1, 0, 0, 30, tzinfo=timezone.utc)
+    assert "absent" in latest.missing_fields
+
+
+def test_file_window_resamples_recording(tmp_path) -> None:
+    catalog, profiles = _setup(tmp_path)
+    request = SnapshotWindowRequest(
+        catalog_id="replay",
+        start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 1, 0, 3, tzinfo=timezone.utc),
+        step_sec=60,
+        fields=["temp", "flow"],
+    )
+
+    window = CompositeSnapshotProvider(providers=[FileSnapshotProvider()]).fetch_window(
+        request=request, catalog=catalog, profiles=profiles, secret_resolver=_StaticResolver()
+    )
+
+    assert window.values[0] == [1.0, 2.0, 3.0, None]
+    assert window.values[1] == [20.0, None, 60.0, None]
+
+
+def test_file_recording_rejects_unsorted_timestamps(tmp_path) -> None:
+    catalog, profiles = _setup(tmp_path)
+    recording = tmp_path / "capture.csv"
+    recording.write_text("ts,T1,T2\n1704067230,2.0,20\n1704067200,1.0,10\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="capture.csv"):
+        CsvRecording(recording, "ts")
+
+    snapshot = CompositeSnapshotProvider(providers=[FileSnapshotProvider()]).fetch(
+        request=SnapshotRequest(catalog_id="replay"), catalog=catalog, profiles=profiles, secret_resolver=_StaticResolver()
+    )
+    assert snapshot.values == {}
+    assert snapshot.quality_flags["temp"] == "file_error:ValueError"
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from easyshift_maas.api.app import app
+from easyshift_maas.core.contracts import JobStatus
+from easyshift_maas.jobs.queue import JobQueue
+from easyshift_maas.jobs.store import InMemoryJobStore, SQLiteJobStore
+
+
+def _wait(store, job_id: str, *statuses: JobStatus, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = store.get(job_id)
+        if record.status in statuses:
+            return record
+        time.sleep(0.01)
+    raise AssertionError(f"{job_id} stuck in {store.get(job_id).status}")
+
+
+def test_queue_orders_by_priority_caps_tenants_and_cancels() -> None:
+    store = InMemoryJobStore()
+    gate = threading.Event()
+    order: list[str] = []
+
+    def handler(record, payload, cancelled):
+        order.append(payload["name"])
+        if payload["name"] in ("first", "stuck"):
+            while not gate.is_set() and not cancelled():
+                time.sleep(0.005)
+            if cancelled():
+                raise RuntimeError("stopped")
+        return {"name": payload["name"]}
+
+    queue = JobQueue(store, handler, kind="test", max_workers=2, tenant_limit=1)
+    first = queue.submit({"name": "first"}, tenant_id="a")
+    _wait(store, first.job_id, JobStatus.RUNNING)
+    stuck = queue.submit({"name": "stuck"}, tenant_id="b")
+    _wait(store, stuck.job_id, JobStatus.RUNNING)
+    low = queue.submit({"name": "low"}, tenant_id="a")
+    high = queue.submit({"name": "high"}, tenant_id="a", priority=5)
+    dropped = queue.submit({"name": "dropped"}, tenant_id="c")
+    assert queue.stats() == {"workers": 2, "pending": 3, "running": 2}
+
+    assert queue.cancel(dropped.job_id).status == JobStatus.CANCELLED
+    assert queue.cancel(stuck.job_id).cancel_requested is True
+    assert _wait(store, stuck.job_id, JobStatus.CANCELLED).error == "cancelled"
+    # Tenant "a" is at its cap while "first" runs, so the free worker stays idle.
+    time.sleep(0.05)
+    assert order == ["first", "stuck"]
+
+    gate.set()
+    for job in (first, low, high):
+        _wait(store, job.job_id, JobStatus.SUCCEEDED)
+    assert order == ["first", "stuck", "high", "low"]
+    assert store.get(high.job_id).result == {"name": "high"}
+    queue.shutdown()
+
+
+def test_sqlite_store_requeues_unfinished_jobs_after_restart(tmp_path) -> None:
+    path = tmp_path / "jobs.sqlite"
+    before = SQLiteJobStore(path)
+    interrupted = before.create("test", tenant_id="a", payload={"value": 2})
+    before.update(interrupted.job_id, status=JobStatus.RUNNING)
+    withdrawn = before.create("test", payload={"value": 3})
+    before.update(withdrawn.job_id, cancel_requested=True)
+    before.close()
+
+    store = SQLiteJobStore(path)
+    queue = JobQueue(store, lambda record, payload, cancelled: {"double": payload["value"] * 2}, kind="test")
+    queue.start()
+
+    assert _wait(store, interrupted.job_id, JobStatus.SUCCEEDED).result == {"double": 4}
+    assert store.get(withdrawn.job_id).status == JobStatus.CANCELLED
+    assert [item.job_id for item in store.list_jobs("test")] == [interrupted.job_id, withdrawn.job_id]
+    queue.shutdown()
+
+
+def test_agentic_job_endpoints() -> None:
+    client = TestClient(app)
+    payload = {
+        "scene_metadata": {"scene_id": "job-scene"},
+        "field_dictionary": {
+            "fields": [
+                {"field_name": "energy_cost", "semantic_label": "cost", "unit": "$/h"},
+                {"field_name": "boiler_temp", "semantic_label": "temperature", "unit": "C", "controllable": True},
+            ]
+        },
+        "max_iterations": 1,
+        "tenant_id": "plant-a",
+        "priority": 3,
+    }
+
+    submitted = client.post("/v1/agentic/jobs", json=payload)
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+    assert submitted.json()["tenant_id"] == "plant-a"
+
+    deadline = time.monotonic() + 10.0
+    while client.get(f"/v1/agentic/jobs/{job_id}").json()["status"] in ("pending", "running"):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    result = client.get(f"/v1/agentic/jobs/{job_id}/result")
+    assert result.status_code == 200
+    assert result.json()["iterations_used"] == 1
+    assert client.get(f"/v1/agentic/jobs/{job_id}").json()["status"] == "succeeded"
+    assert client.post(f"/v1/agentic/jobs/{job_id}/cancel").status_code == 409
+    assert client.get("/v1/agentic/jobs/job-missing/result").status_code == 404
+
+    # The job id doubles as the run id of the workflow checkpoint.
+    assert client.get(f"/v1/agentic/runs/{job_id}").json()["last_step"] == "done"
+    resumed = client.post(f"/v1/agentic/runs/{job_id}/resume")
+    assert resumed.status_code == 200 and resumed.json()["run_id"] == job_id
+    assert client.post("/v1/agentic/runs/run-missing/resume").status_code == 404
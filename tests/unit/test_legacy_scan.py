@@ -0,0 +1,34 @@
+from easyshift_maas.ingestion.legacy_scan import collect_point_keys, scan_section_tags
+
+
+def test_collect_point_keys_handles_deep_nesting() -> None:
+    payload: dict = {"AB10PT101": "AB10PT101"}
+    node = payload
+    for depth in range(5000):
+        child: dict = {"level_key": "value"}
+        node[f"nest{depth}"] = child
+        node = child
+    node["RAA10BQ101"] = "RAA10BQ101"
+    payload["redis_config"] = {"AB99PT999": "AB99PT999"}
+
+    keys = collect_point_keys(payload, {"redis_config"})
+
+    assert {"AB10PT101", "RAA10BQ101", "level_key", "nest4999"} <= keys
+    assert "AB99PT999" not in keys
+
+
+def test_scan_section_tags_uses_hints_and_tag_density() -> None:
+    payload = {
+        "inputs": {"coal_value": "AMICS_BALAR1503", "note": "plain"},
+        "misc": {"a": "RAA10BQ101", "b": ["RAA10BT301", "x"], "c": "lower", "d": "AB10FT201"},
+        "sparse": {"a": "RAA10BQ101", "b": "one", "c": "two", "d": "three"},
+    }
+
+    found = scan_section_tags(payload, {"inputs"})
+
+    assert found == [
+        ("inputs:coal_value", "coal_value", "AMICS_BALAR1503"),
+        ("misc:a", "a", "RAA10BQ101"),
+        ("misc:b:0", "b_0", "RAA10BT301"),
+        ("misc:d", "d", "AB10FT201"),
+    ]
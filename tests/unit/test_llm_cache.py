@@ -0,0 +1,148 @@
+from easyshift_maas.agentic.critic_agent import CriticAgent
+from easyshift_maas.agentic.generator_agent import GeneratorAgent
+from easyshift_maas.agentic.template_validator import TemplateValidator
+from easyshift_maas.core.contracts import FieldDefinition, FieldDictionary, LLMProviderConfig, SceneMetadata
+from easyshift_maas.llm.cache import SQLiteLLMResponseCache
+from easyshift_maas.llm.client import RoleBasedLLMClient
+from easyshift_maas.quality.template_quality import TemplateQualityEvaluator
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat_json(self, *, model, system_prompt, user_payload, temperature=0.1):
+        self.calls += 1
+        return {"answer": user_payload["q"], "call": self.calls}
+
+
+def _client(cache: SQLiteLLMResponseCache) -> tuple[RoleBasedLLMClient, _CountingProvider]:
+    provider = _CountingProvider()
+    client = RoleBasedLLMClient(
+        role_configs={"parser": LLMProviderConfig(model="m1", base_url="http://stub")},
+        cache=cache,
+    )
+    client._get_provider = lambda role, config: provider  # type: ignore[method-assign]
+    return client, provider
+
+
+def test_client_serves_repeated_requests_from_cache(tmp_path) -> None:
+    cache = SQLiteLLMResponseCache(tmp_path / "llm.sqlite")
+    client, provider = _client(cache)
+
+    first, first_meta = client.complete_json(role="parser", system_prompt="p", user_payload={"q": 1}, temperature=0.0)
+    second, second_meta = client.complete_json(role="parser", system_prompt="p", user_payload={"q": 1}, temperature=0.0)
+    _, hot_meta = client.complete_json(role="parser", system_prompt="p", user_payload={"q": 1}, temperature=0.9)
+
+    assert first == second == {"answer": 1, "call": 1}
+    assert (first_meta["cache"], second_meta["cache"], hot_meta["cache"]) == ("miss", "hit", "bypass")
+    assert provider.calls == 2
+    assert cache.stats()["hit_rate"] == 0.5
+
+    reopened, provider = _client(SQLiteLLMResponseCache(tmp_path / "llm.sqlite"))
+    reopened.complete_json(role="parser", system_prompt="p", user_payload={"q": 1}, temperature=0.0)
+    assert provider.calls == 0
+
+
+def test_cache_expires_and_evicts_least_recently_read(tmp_path) -> None:
+    now = [1000.0]
+    cache = SQLiteLLMResponseCache(tmp_path / "llm.sqlite", max_entries=10, ttl_s=60.0, clock=lambda: now[0])
+
+    for idx in range(10):
+        now[0] += 1
+        cache.put(f"k{idx}", {"v": idx})
+    now[0] += 1
+    assert cache.get("k0") == {"v": 0}
+    now[0] += 1
+    cache.put("k10", {"v": 10})
+
+    stats = cache.stats()
+    assert stats["entries"] == 9
+    assert cache.get("k0") == {"v": 0}
+    assert cache.get("k1") is None
+
+    now[0] += 120
+    assert cache.get("k10") is None
+
+
+class _ScriptedProvider:
+    def __init__(self, *payloads) -> None:
+        self.payloads = list(payloads)
+        self.calls = 0
+
+    def chat_json(self, *, model, system_prompt, user_payload, temperature=0.1):
+        self.calls += 1
+        return self.payloads.pop(0)
+
+
+def test_invalid_answers_are_not_cached_and_retry_reaches_the_model(tmp_path) -> None:
+    valid = {"is_fatal_error": False, "analysis": "ok", "correction_instruction": "add guardrails"}
+    provider = _ScriptedProvider({"analysis": "missing fields"}, valid)
+    cache = SQLiteLLMResponseCache(tmp_path / "llm.sqlite")
+    client = RoleBasedLLMClient(
+        role_configs={"critic": LLMProviderConfig(model="m1", base_url="http://stub")},
+        cache=cache,
+    )
+    client._get_provider = lambda role, config: provider  # type: ignore[method-assign]
+
+    fields = FieldDictionary(fields=[FieldDefinition(field_name="energy_cost", semantic_label="cost", unit="$/h")])
+    draft = GeneratorAgent(llm_client=None).generate(
+        scene_metadata=SceneMetadata(scene_id="cache-scene"), field_dictionary=fields, nl_requirements=[]
+    )
+    inputs = {
+        "failed_draft": draft,
+        "validation_report": TemplateValidator().validate(draft),
+        "quality_report": TemplateQualityEvaluator().evaluate(draft.template),
+    }
+    critic = CriticAgent(llm_client=client)
+
+    assert critic.review(**inputs).correction_instruction == "add guardrails"
+    assert provider.calls == 2
+    assert cache.stats()["hits"] == 0 and cache.stats()["entries"] == 1
+
+    # The validated answer is served from the cache from now on.
+    assert critic.review(**inputs).analysis == "ok"
+    assert provider.calls == 2 and cache.stats()["hits"] == 1
+
+    # An entry that no longer validates is dropped and requested again.
+    (key,) = [row[0] for row in cache._conn.execute("SELECT key FROM llm_cache")]
+    cache.put(key, {"stale": True})
+    provider.payloads.append(valid)
+    assert critic.review(**inputs).analysis == "ok"
+    assert provider.calls == 3
+    assert cache.get(key) == valid
+
+
+def test_any_client_can_opt_into_validation_before_caching() -> None:
+    import asyncio
+
+    from easyshift_maas.agentic.prompts.output_schemas import CriticAgentOutput
+    from easyshift_maas.llm.client import acomplete_validated, complete_validated
+
+    answer = {"is_fatal_error": False, "analysis": "ok", "correction_instruction": "none"}
+
+    class _ValidatingClient:
+        def __init__(self) -> None:
+            self.validators: list = []
+
+        def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1, validate=None):
+            self.validators.append(validate)
+            return dict(answer), {}
+
+        async def acomplete_json(self, *, role, system_prompt, user_payload, temperature=0.1, validate=None):
+            self.validators.append(validate)
+            return dict(answer), {}
+
+    class _PlainClient:
+        def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+            return dict(answer), {}
+
+    request = {"role": "critic", "system_prompt": "", "user_payload": {}}
+    validating = _ValidatingClient()
+    complete_validated(validating, CriticAgentOutput, **request)
+    asyncio.run(acomplete_validated(validating, CriticAgentOutput, **request))
+    assert validating.validators == [CriticAgentOutput.model_validate] * 2
+
+    output, _ = complete_validated(_PlainClient(), CriticAgentOutput, **request)
+    async_output, _ = asyncio.run(acomplete_validated(_PlainClient(), CriticAgentOutput, **request))
+    assert output == async_output and output.analysis == "ok"
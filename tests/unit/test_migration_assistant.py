@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 from easyshift_maas.agentic.generator_agent import GeneratorAgent
 from easyshift_maas.agentic.parser_agent import ParserAgent
 from easyshift_maas.core.contracts import FieldDefinition, FieldDictionary, SceneMetadata
@@ -35,3 +38,98 @@ def test_generator_produces_structured_draft_without_llm() -> None:
     assert draft.template.template_id == "quality-scene-template"
     assert len(draft.template.objective.terms) >= 1
     assert draft.generation_strategy == "rule_fallback"
+
+
+class _ChunkRecordingLLM:
+    def __init__(self, fail_on: str) -> None:
+        self.fail_on = fail_on
+        self.calls: list[dict] = []
+
+    def complete_json(self, *, role, system_prompt, user_payload, temperature=0.1):
+        self.calls.append(user_payload)
+        points = user_payload["legacy_points"]
+        if self.fail_on in points:
+            raise RuntimeError("upstream timeout")
+        fields = [item["field_name"] for item in user_payload["field_dictionary"]["fields"]]
+        mappings = [
+            {"legacy_name": point, "standard_name": fields[0], "confidence": 0.9, "reasoning": "llm"}
+            for point in points
+        ]
+        return {"mappings": mappings, "unmapped_points": []}, {}
+
+
+def test_parser_chunks_points_and_falls_back_per_chunk() -> None:
+    fields = FieldDictionary(
+        fields=[
+            FieldDefinition(field_name=f"zone{idx}_temp", semantic_label=f"zone{idx} temperature", unit="C")
+            for idx in range(40)
+        ]
+    )
+    points = [f"ZONE{idx}_TEMP_PV" for idx in range(40)]
+    llm = _ChunkRecordingLLM(fail_on="ZONE0_TEMP_PV")
+    parser = ParserAgent(llm_client=llm, chunk_token_budget=1200, max_concurrency=3)
+
+    result = parser.parse(field_dictionary=fields, legacy_points=points)
+
+    assert len(llm.calls) > 2
+    assert all(len(call["field_dictionary"]["fields"]) < 40 for call in llm.calls)
+    assert result.strategy == "llm_semantic_mapping"
+    assert len(result.warnings) == 1 and "fell back to rule mapping" in result.warnings[0]
+    by_point = {item.legacy_name: item for item in result.mappings}
+    assert by_point["ZONE0_TEMP_PV"].reasoning == "token overlap heuristic"
+    assert by_point["ZONE0_TEMP_PV"].standard_name == "zone0_temp"
+    assert by_point["ZONE9_TEMP_PV"].reasoning == "llm"
+    assert [item.legacy_name for item in result.mappings] == sorted(points)
+
+
+class _ThreadRecordingParser(ParserAgent):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.threads: dict[str, set[int]] = {}
+
+    def _record(self, name: str) -> None:
+        self.threads.setdefault(name, set()).add(threading.get_ident())
+
+    def _collect_points(self, **kwargs):
+        self._record("collect")
+        return super()._collect_points(**kwargs)
+
+    def _plan_chunks(self, **kwargs):
+        self._record("plan")
+        return super()._plan_chunks(**kwargs)
+
+    def _merge_chunks(self, *args):
+        self._record("merge")
+        return super()._merge_chunks(*args)
+
+    def _parse_with_rules(self, **kwargs):
+        self._record("rules")
+        return super()._parse_with_rules(**kwargs)
+
+
+def test_async_parse_keeps_cpu_work_off_the_event_loop() -> None:
+    fields = FieldDictionary(
+        fields=[
+            FieldDefinition(field_name=f"zone{idx}_temp", semantic_label=f"zone{idx} temperature", unit="C")
+            for idx in range(40)
+        ]
+    )
+    points = [f"ZONE{idx}_TEMP_PV" for idx in range(40)]
+    raw_yaml_text = "inputs:\n  EXTRA_POINT_01: AB01CD\n"
+    llm_parser = _ThreadRecordingParser(llm_client=_ChunkRecordingLLM(fail_on="ZONE0_TEMP_PV"), chunk_token_budget=1200)
+    rule_parser = _ThreadRecordingParser(llm_client=None)
+
+    async def _run():
+        loop_thread = threading.get_ident()
+        llm_result = await llm_parser.aparse(field_dictionary=fields, legacy_points=points, raw_yaml_text=raw_yaml_text)
+        rule_result = await rule_parser.aparse(field_dictionary=fields, legacy_points=points)
+        return loop_thread, llm_result, rule_result
+
+    loop_thread, llm_result, rule_result = asyncio.run(_run())
+
+    assert set(llm_parser.threads) == {"collect", "plan", "merge", "rules"}
+    assert set(rule_parser.threads) == {"collect", "rules"}
+    for recorded in (*llm_parser.threads.values(), *rule_parser.threads.values()):
+        assert loop_thread not in recorded
+    assert llm_result == llm_parser.parse(field_dictionary=fields, legacy_points=points, raw_yaml_text=raw_yaml_text)
+    assert rule_result.strategy == "rule_fallback"
@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import httpx
+
+from easyshift_maas.llm.providers.openai_compatible import OpenAICompatibleProvider
+
+
+def test_provider_reuses_one_pooled_client() -> None:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = json.loads(request.content)
+        content = json.dumps({"echo": body["messages"][1]["content"]})
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    provider = OpenAICompatibleProvider(
+        base_url="http://stub/v1/",
+        api_key="k",
+        http2=True,
+        transport=httpx.MockTransport(_handler),
+    )
+    first = provider.chat_json(model="m", system_prompt="s", user_payload={"a": 1})
+    client = provider.client
+    second = provider.chat_json(model="m", system_prompt="s", user_payload={"a": 2})
+
+    assert first == {"echo": '{"a": 1}'} and second == {"echo": '{"a": 2}'}
+    assert provider.client is client
+    assert [str(item.url) for item in seen] == ["http://stub/v1/chat/completions"] * 2
+    assert seen[0].headers["authorization"] == "Bearer k"
+
+    provider.close()
+    assert client.is_closed
+
+
+def test_async_provider_uses_pooled_async_client() -> None:
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"choices": [{"message": {"content": '{"ok": true}'}}]})
+
+    provider = OpenAICompatibleProvider(
+        base_url="http://stub/v1",
+        api_key="k",
+        async_transport=httpx.MockTransport(_handler),
+    )
+
+    async def _calls() -> list[dict]:
+        results = [await provider.achat_json(model="m", system_prompt="s", user_payload={}) for _ in range(3)]
+        client = provider.async_client
+        await provider.aclose()
+        assert client.is_closed
+        return results
+
+    assert asyncio.run(_calls()) == [{"ok": True}] * 3
+
+
+def test_roles_share_a_provider_only_with_identical_pool_settings(monkeypatch) -> None:
+    from easyshift_maas.core.contracts import LLMProviderConfig
+    from easyshift_maas.llm.client import RoleBasedLLMClient
+
+    monkeypatch.setenv("REFLEXFLOW_LLM_API_KEY", "k")
+    base = LLMProviderConfig(model="m", base_url="http://llm/v1")
+    client = RoleBasedLLMClient(
+        role_configs={
+            "parser": base,
+            "generator": base.model_copy(update={"model": "other"}),
+            "critic": base.model_copy(update={"keepalive_expiry_s": 5.0}),
+        }
+    )
+
+    providers = {role: client._get_provider(role, config) for role, config in client.role_configs.items()}
+
+    assert providers["parser"] is providers["generator"]
+    assert providers["critic"] is not providers["parser"]
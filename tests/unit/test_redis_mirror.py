@@ -0,0 +1,137 @@
+from easyshift_maas.core.contracts import (
+    DataSourceKind,
+    DataSourceOptions,
+    DataSourceProfile,
+    PointBinding,
+    RedisSubscriptionMode,
+    SnapshotRequest,
+)
+from easyshift_maas.ingestion.providers.redis_provider import RedisSnapshotProvider
+
+
+class _StaticResolver:
+    def resolve(self, conn_ref: str) -> dict:
+        return {"host": "127.0.0.1", "db": 0}
+
+
+class _FakePubSub:
+    def __init__(self) -> None:
+        self.channels: set[str] = set()
+        self.pending: list[dict] = []
+        self.closed = False
+
+    def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    def get_message(self, timeout: float = 0.0):
+        return self.pending.pop(0) if self.pending else None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self, data: dict[str, bytes]) -> None:
+        self.data = data
+        self.mget_calls: list[list[str]] = []
+        self.pubsub_client = _FakePubSub()
+        self.stream: list[tuple[bytes, dict[bytes, bytes]]] = []
+
+    def mget(self, keys: list[str]):
+        self.mget_calls.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> _FakePubSub:
+        return self.pubsub_client
+
+    def set(self, key: str, value: bytes) -> None:
+        self.data[key] = value
+        channel = f"__keyspace@0__:{key}"
+        if channel in self.pubsub_client.channels:
+            self.pubsub_client.pending.append({"type": "message", "channel": channel.encode(), "data": b"set"})
+
+    def xrevrange(self, name: str, count: int = 1):
+        return list(reversed(self.stream))[:count]
+
+    def xread(self, streams: dict[str, str], count: int | None = None):
+        (name, last_id), = streams.items()
+        entries = [item for item in self.stream if item[0].decode() > last_id]
+        return [(name.encode(), entries)] if entries else []
+
+
+def _bindings() -> list[PointBinding]:
+    return [
+        PointBinding(point_id=f"P{idx}", source_type=DataSourceKind.REDIS, source_ref=f"k{idx}", field_name=f"f{idx}")
+        for idx in range(3)
+    ]
+
+
+def _profile(mode: RedisSubscriptionMode, stream_key: str | None = None) -> DataSourceProfile:
+    return DataSourceProfile(
+        name="redis_main",
+        kind=DataSourceKind.REDIS,
+        conn_ref="env:REFLEXFLOW_REDIS_CONN",
+        options=DataSourceOptions(redis_subscription=mode, redis_stream_key=stream_key),
+    )
+
+
+def test_keyspace_mirror_rereads_only_changed_keys() -> None:
+    fake = _FakeRedis({"k0": b"1.0", "k1": b"2.0", "k2": b"3.0"})
+    provider = RedisSnapshotProvider(client_factory=lambda profile, conn: fake)
+    profile = _profile(RedisSubscriptionMode.KEYSPACE)
+    request = SnapshotRequest(catalog_id="demo")
+
+    first = provider.fetch_bindings(_bindings(), profile, request, _StaticResolver())
+    fake.set("k1", b"20.0")
+    second = provider.fetch_bindings(_bindings(), profile, request, _StaticResolver())
+
+    assert first.values == {"f0": 1.0, "f1": 2.0, "f2": 3.0}
+    assert second.values == {"f0": 1.0, "f1": 20.0, "f2": 3.0}
+    assert fake.mget_calls == [["k0", "k1", "k2"], ["k1"]]
+    assert second.value_timestamps["f1"] >= first.value_timestamps["f1"]
+    assert second.value_timestamps["f0"] == first.value_timestamps["f0"]
+
+
+def test_stream_mirror_applies_entries_without_rereading() -> None:
+    fake = _FakeRedis({"k0": b"1.0", "k1": b"2.0", "k2": b"3.0"})
+    provider = RedisSnapshotProvider(client_factory=lambda profile, conn: fake)
+    profile = _profile(RedisSubscriptionMode.STREAM, stream_key="points:{catalog_id}")
+    request = SnapshotRequest(catalog_id="demo")
+
+    provider.fetch_bindings(_bindings(), profile, request, _StaticResolver())
+    fake.stream.append((b"1700000000000-0", {b"k2": b"9.5"}))
+    result = provider.fetch_bindings(_bindings(), profile, request, _StaticResolver())
+
+    assert result.values["f2"] == 9.5
+    assert result.value_timestamps["f2"].year == 2023
+    assert len(fake.mget_calls) == 1
+
+
+def test_rotated_connection_replaces_and_closes_the_old_mirror() -> None:
+    clients: list[_FakeRedis] = []
+
+    def _factory(profile, conn) -> _FakeRedis:
+        clients.append(_FakeRedis({"k0": b"1.0", "k1": b"2.0", "k2": b"3.0"}))
+        return clients[-1]
+
+    conn = {"host": "127.0.0.1", "db": 0, "password": "old"}
+
+    class _RotatingResolver:
+        def resolve(self, conn_ref: str) -> dict:
+            return dict(conn)
+
+    provider = RedisSnapshotProvider(client_factory=_factory)
+    profile = _profile(RedisSubscriptionMode.KEYSPACE)
+    request = SnapshotRequest(catalog_id="demo")
+
+    provider.fetch_bindings(_bindings(), profile, request, _RotatingResolver())
+    provider.fetch_bindings(_bindings(), profile, request, _RotatingResolver())
+    conn["password"] = "new"
+    result = provider.fetch_bindings(_bindings(), profile, request, _RotatingResolver())
+
+    assert result.values == {"f0": 1.0, "f1": 2.0, "f2": 3.0}
+    assert len(clients) == 2 and len(provider._mirrors) == 1
+    assert clients[0].pubsub_client.closed and not clients[1].pubsub_client.closed
+
+    provider.close()
+    assert clients[1].pubsub_client.closed and not provider._mirrors
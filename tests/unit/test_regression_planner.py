@@ -0,0 +1,48 @@
+from easyshift_maas.agentic.regression_planner import RegressionPlanner
+from easyshift_maas.core.batch import BatchPipeline
+from easyshift_maas.core.contracts import GuardrailAction, GuardrailRule
+from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+from easyshift_maas.examples.synthetic_templates import build_energy_efficiency_template
+
+
+def test_batch_pipeline_matches_pipeline_run() -> None:
+    template = build_energy_efficiency_template()
+    # A rule on a field outside the dictionary is "missing in plan" for every row.
+    rules = [*template.guardrail.rules, GuardrailRule(field_name="ghost", max_value=1.0, action=GuardrailAction.WARN)]
+    template = template.model_copy(update={"guardrail": template.guardrail.model_copy(update={"rules": rules})})
+    suite = RegressionPlanner().build_matrix(template, combinatorial=False, random_cases=200, seed=7)
+
+    result = BatchPipeline(template, suite.matrix.fields).run(suite.matrix)
+    pipeline = PredictionOptimizationPipeline()
+    for row in range(len(suite)):
+        expected = pipeline.run(suite.matrix.context(row), template)
+        assert bool(result.executed[row]) is expected.executed
+        assert bool(result.violated[row]) is bool(expected.guardrail.violations)
+        assert result.solver_status == expected.plan.solver_status
+
+
+def test_regression_matrix_counts_coverage_per_constraint_and_rule() -> None:
+    template = build_energy_efficiency_template()
+    planner = RegressionPlanner()
+    suite = planner.build_matrix(template, random_cases=500, seed=3, max_cases=3000)
+    again = planner.build_matrix(template, random_cases=500, seed=3, max_cases=3000)
+    report = planner.evaluate_matrix(template, suite)
+
+    assert len(suite) == report.total_cases == 3000
+    assert list(suite.matrix.values) == list(again.matrix.values)
+    assert report.cases_by_kind["nominal"] == 1 and report.cases_by_kind["pairwise"] > 0
+
+    kernel = BatchPipeline(template, suite.matrix.fields)
+    fired = [0] * len(template.guardrail.rules)
+    binding = [0] * len(template.constraints)
+    for row in range(len(suite)):
+        for column, value in enumerate(suite.matrix.row_values(row)):
+            outcome = kernel.field_outcome(column, value)
+            for idx in outcome.fired_rules:
+                fired[idx] += 1
+            for idx in outcome.binding_constraints:
+                binding[idx] += 1
+    assert [item.cases_fired for item in report.rules] == fired
+    assert [item.cases_binding for item in report.constraints] == binding
+    assert all(item.cases_targeted > 0 for item in report.rules)
+    assert report.coverage["rule_fired_ratio"] == 1.0
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from easyshift_maas.api.app import app
+from easyshift_maas.core.contracts import PipelineResult, SnapshotResult
+from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+from easyshift_maas.examples.synthetic_templates import build_energy_efficiency_template
+from easyshift_maas.replay.engine import ReplayEngine
+
+
+class _RecordingPipeline:
+    def __init__(self) -> None:
+        self.inner = PredictionOptimizationPipeline()
+        self.contexts = []
+
+    def run(self, context, template) -> PipelineResult:
+        self.contexts.append(context)
+        return self.inner.run(context, template)
+
+
+def _snapshots(count: int) -> list[SnapshotResult]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        SnapshotResult(
+            values={"energy_cost": 100.0 + idx, "steam_flow": 30.0 + idx, "boiler_temp": 560.0, "efficiency": 0.8},
+            collected_at=start + timedelta(seconds=60 * idx),
+        )
+        for idx in range(count)
+    ]
+
+
+def test_replay_carries_setpoints_and_streams_reports() -> None:
+    template = build_energy_efficiency_template()
+    pipeline = _RecordingPipeline()
+    sleeps: list[float] = []
+    engine = ReplayEngine(pipeline=pipeline, clock=lambda: 0.0, sleep=sleeps.append)
+
+    reports = list(engine.iter_reports(template, _snapshots(5), speed=60.0, report_every=2))
+
+    assert [item.total_ticks for item in reports] == [2, 4, 5]
+    assert [item.completed for item in reports] == [False, False, True]
+    final = reports[-1]
+    assert len(final.objective_trajectory) == 5
+    assert final.approved_ticks == round(final.approval_rate * 5)
+    assert sleeps == [1.0, 2.0, 3.0, 4.0]
+
+    first_result = pipeline.inner.run(pipeline.contexts[0], template)
+    assert pipeline.contexts[1].values["steam_flow"] == first_result.final_setpoints["steam_flow"]
+    assert pipeline.contexts[1].values["energy_cost"] == 101.0
+
+
+def test_replay_job_api_runs_in_background() -> None:
+    client = TestClient(app)
+    payload = {
+        "inline_template": build_energy_efficiency_template().model_dump(mode="json"),
+        "snapshots": [item.model_dump(mode="json") for item in _snapshots(3)],
+        "report_every": 2,
+    }
+
+    submitted = client.post("/v1/replay/jobs", json=payload)
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+
+    job = client.get(f"/v1/replay/jobs/{job_id}").json()
+    assert job["status"] == "succeeded"
+    assert job["result"]["total_ticks"] == 3
+    assert job["result"]["completed"] is True
+    assert client.get("/v1/replay/jobs/job-missing").status_code == 404
+
+
+def test_progress_reports_carry_a_bounded_trajectory() -> None:
+    engine = ReplayEngine(clock=lambda: 0.0)
+
+    reports = list(engine.iter_reports(build_energy_efficiency_template(), _snapshots(450), report_every=150))
+
+    progress, final = reports[:-1], reports[-1]
+    assert [len(item.objective_trajectory) for item in progress] == [150, 200, 200]
+    assert len(final.objective_trajectory) == 450
+    assert progress[-1].objective_trajectory[0] == final.objective_trajectory[0]
+    assert progress[-1].objective_trajectory[-1] == final.objective_trajectory[-1]
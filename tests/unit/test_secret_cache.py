@@ -0,0 +1,54 @@
+import json
+import os
+
+from easyshift_maas.security.secrets import CachingSecretResolver, ChainedSecretResolver
+
+
+class _CountingResolver:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.inner = ChainedSecretResolver()
+
+    def resolve(self, conn_ref: str) -> dict:
+        self.calls += 1
+        return self.inner.resolve(conn_ref)
+
+
+def test_file_secret_cached_until_file_changes(tmp_path) -> None:
+    secret = tmp_path / "redis.json"
+    secret.write_text(json.dumps({"host": "10.0.0.1"}), encoding="utf-8")
+    inner = _CountingResolver()
+    resolver = CachingSecretResolver(inner, ttl_s=60)
+    conn_ref = f"file:{secret}"
+
+    first = resolver.resolve(conn_ref)
+    first["host"] = "mutated"
+    second = resolver.resolve(conn_ref)
+    key_before = resolver.connection_key(conn_ref)
+
+    secret.write_text(json.dumps({"host": "10.0.0.22"}), encoding="utf-8")
+    os.utime(secret, ns=(secret.stat().st_atime_ns, secret.stat().st_mtime_ns + 1_000_000))
+    third = resolver.resolve(conn_ref)
+
+    assert second == {"host": "10.0.0.1"}
+    assert third == {"host": "10.0.0.22"}
+    assert inner.calls == 2
+    assert resolver.connection_key(conn_ref) != key_before
+    assert resolver.stats()["invalidations"] == 1
+
+
+def test_env_secret_expires_by_ttl_and_value_change(monkeypatch) -> None:
+    now = [0.0]
+    inner = _CountingResolver()
+    resolver = CachingSecretResolver(inner, ttl_s=10, clock=lambda: now[0])
+    monkeypatch.setenv("REFLEXFLOW_TEST_CONN", "redis://cache:6379/0")
+
+    resolver.resolve("env:REFLEXFLOW_TEST_CONN")
+    resolver.resolve("env:REFLEXFLOW_TEST_CONN")
+    monkeypatch.setenv("REFLEXFLOW_TEST_CONN", "redis://cache:6380/0")
+    assert resolver.resolve("env:REFLEXFLOW_TEST_CONN")["port"] == 6380
+    now[0] = 11.0
+    resolver.resolve("env:REFLEXFLOW_TEST_CONN")
+
+    assert inner.calls == 3
+    assert resolver.stats()["hits"] == 1
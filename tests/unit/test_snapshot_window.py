@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+
+import pymysql
+
+from easyshift_maas.core.contracts import (
+    DataSourceKind,
+    DataSourceOptions,
+    DataSourceProfile,
+    PointBinding,
+    PointCatalog,
+    SnapshotWindowRequest,
+)
+from easyshift_maas.ingestion.providers.mysql_provider import MySQLSnapshotProvider
+from easyshift_maas.ingestion.providers.redis_provider import RedisSnapshotProvider
+from easyshift_maas.ingestion.snapshot_provider import CompositeSnapshotProvider
+
+
+class _StaticResolver:
+    def resolve(self, conn_ref: str) -> dict:
+        return {"host": "127.0.0.1"}
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[tuple]) -> None:
+        self._rows = rows
+        self.fetch_sizes: list[int] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, query: str, args: list) -> None:
+        self.query = query
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        self.fetch_sizes.append(size)
+        chunk, self._rows = self._rows[:size], self._rows[size:]
+        return chunk
+
+
+class _FakeConnection:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _FakeCursor:
+        return self._cursor
+
+    def close(self) -> None:
+        return None
+
+
+def _ts(minute: int, second: int = 0) -> datetime:
+    return datetime(2024, 1, 1, 0, minute, second)
+
+
+def test_mysql_window_streams_and_resamples(monkeypatch) -> None:
+    rows = [
+        ("T1", _ts(0, 0), 1.0),
+        ("T1", _ts(0, 30), 2.0),
+        ("T2", _ts(1, 0), "5"),
+        ("T1", _ts(2, 10), 3.0),
+    ]
+    cursor = _FakeCursor(rows)
+    captured: dict = {}
+
+    def _connect(**kwargs):
+        captured.update(kwargs)
+        return _FakeConnection(cursor)
+
+    monkeypatch.setattr(pymysql, "connect", _connect)
+
+    catalog = PointCatalog(
+        catalog_id="hist",
+        source_profile="mysql_main",
+        bindings=[
+            PointBinding(point_id="P1", source_type=DataSourceKind.MYSQL, source_ref="T1", field_name="temp"),
+            PointBinding(point_id="P2", source_type=DataSourceKind.MYSQL, source_ref="T2", field_name="flow", transform="scale:2"),
+            PointBinding(point_id="P3", source_type=DataSourceKind.REDIS, source_ref="r:1", field_name="live"),
+        ],
+    )
+    profiles = [
+        DataSourceProfile(
+            name="mysql_main",
+            kind=DataSourceKind.MYSQL,
+            conn_ref="env:REFLEXFLOW_MYSQL_CONN",
+            options=DataSourceOptions(mysql_ts_column="ts", batch_size=2),
+        )
+    ]
+    request = SnapshotWindowRequest(
+        catalog_id="hist",
+        start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 1, 0, 3, tzinfo=timezone.utc),
+        step_sec=60,
+    )
+
+    window = CompositeSnapshotProvider(
+        providers=[MySQLSnapshotProvider(), RedisSnapshotProvider()]
+    ).fetch_window(request=request, catalog=catalog, profiles=profiles, secret_resolver=_StaticResolver())
+
+    assert captured["cursorclass"] is pymysql.cursors.SSCursor
+    assert cursor.fetch_sizes == [2, 2, 2]
+    assert window.fields == ["temp", "flow", "live"]
+    assert len(window.timestamps) == 4
+    assert window.values[0] == [1.0, 2.0, None, 3.0]
+    assert window.values[1] == [None, 10.0, None, None]
+    assert window.values[2] == [None, None, None, None]
+    assert window.quality_flags["live"] == "window_unsupported:redis"
+    assert window.missing_fields == ["live"]
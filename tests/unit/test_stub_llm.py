@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+
+from easyshift_maas.agentic.prompts.output_schemas import (
+    CriticAgentOutput,
+    GeneratorAgentOutput,
+    ParserAgentOutput,
+)
+from easyshift_maas.llm.providers.openai_compatible import OpenAICompatibleProvider
+from easyshift_maas.llm.stub_server import StubLLMConfig, build_stub_llm_app
+
+_FIELDS = {
+    "fields": [
+        {"field_name": "energy_cost", "controllable": False},
+        {"field_name": "boiler_temp", "controllable": True},
+    ]
+}
+
+
+def _chat(client: TestClient, payload: dict):
+    return client.post(
+        "/v1/chat/completions",
+        json={
+            "model": "stub",
+            "messages": [{"role": "system", "content": ""}, {"role": "user", "content": json.dumps(payload)}],
+        },
+    )
+
+
+def test_stub_answers_each_role_with_valid_agent_output() -> None:
+    provider = OpenAICompatibleProvider(
+        base_url="http://stub/v1",
+        api_key="k",
+        async_transport=httpx.ASGITransport(app=build_stub_llm_app()),
+    )
+
+    async def _calls() -> list[dict]:
+        payloads = [
+            {"legacy_points": ["BOILER_TEMP_01", "XYZ"], "field_dictionary": _FIELDS},
+            {"scene_metadata": {"scene_id": "s"}, "field_dictionary": _FIELDS, "nl_requirements": []},
+            {"failed_draft": {}, "validation_report": {"issues": [{"code": "X"}]}, "quality_report": {}},
+        ]
+        results = [await provider.achat_json(model="m", system_prompt="", user_payload=item) for item in payloads]
+        await provider.aclose()
+        return results
+
+    parsed, generated, reviewed = asyncio.run(_calls())
+
+    parser_output = ParserAgentOutput.model_validate(parsed)
+    assert [(item.legacy_name, item.standard_name) for item in parser_output.mappings] == [
+        ("BOILER_TEMP_01", "boiler_temp")
+    ]
+    assert parser_output.unmapped_points == ["XYZ"]
+    assert GeneratorAgentOutput.model_validate(generated).objective.terms[0].field_name == "energy_cost"
+    assert CriticAgentOutput.model_validate(reviewed).is_fatal_error is False
+
+
+def test_stub_injects_errors_deterministically_and_serves_canned_responses() -> None:
+    canned = {"is_fatal_error": True, "analysis": "canned", "correction_instruction": "stop"}
+    config = StubLLMConfig(error_rate=0.5, error_status=429, seed=7, responses={"critic": canned})
+    outcomes = []
+    for _ in range(2):
+        client = TestClient(build_stub_llm_app(config))
+        outcomes.append([_chat(client, {"failed_draft": {}}).status_code for _ in range(20)])
+        stats = client.get("/stats").json()
+        assert stats["calls"] == {"critic": 20}
+        assert stats["errors"]["critic"] == outcomes[-1].count(429)
+
+    assert outcomes[0] == outcomes[1]
+    assert set(outcomes[0]) == {200, 429}
+
+    ok = _chat(TestClient(build_stub_llm_app(StubLLMConfig(responses={"critic": canned}))), {"failed_draft": {}})
+    assert json.loads(ok.json()["choices"][0]["message"]["content"]) == canned
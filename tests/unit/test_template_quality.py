@@ -20,3 +20,115 @@ def test_template_quality_blocks_when_guardrail_coverage_low() -> None:
 
     assert report.passed is False
     assert any(item.code == "GUARDRAIL_LOW" for item in report.issues)
+
+
+def test_quality_reports_are_memoized_by_content() -> None:
+    template = build_energy_efficiency_template()
+    evaluator = TemplateQualityEvaluator()
+
+    first = evaluator.evaluate(template)
+    first.issues.clear()
+    republished = template.model_copy(update={"created_at": template.created_at.replace(year=2001)})
+    second = evaluator.evaluate(republished)
+    changed = evaluator.evaluate(template.model_copy(update={"guardrail": GuardrailSpec(rules=[])}))
+    strict = evaluator.evaluate(template, gate=TemplateQualityGate(overall_min=1.0))
+
+    assert second == TemplateQualityEvaluator(cache_size=0).evaluate(template)
+    assert changed.guardrail_coverage < second.guardrail_coverage
+    assert strict.passed is False or strict.overall_score == 1.0
+    assert evaluator.cache_stats() == {"entries": 3, "hits": 1, "misses": 3}
+
+
+def test_incremental_rescoring_matches_full_evaluation() -> None:
+    from easyshift_maas.agentic.template_validator import TemplateValidator
+    from easyshift_maas.core.contracts import (
+        ConstraintOperator,
+        ConstraintSpec,
+        GuardrailRule,
+        MigrationDraft,
+        SimulationSample,
+    )
+    from easyshift_maas.core.template_diff import fingerprint_template
+    from easyshift_maas.examples.synthetic_templates import sample_contexts
+
+    base = build_energy_efficiency_template()
+    tighter = base.guardrail.model_copy(
+        update={"rules": [*base.guardrail.rules[:-1], GuardrailRule(field_name="efficiency", max_delta=0.001)]}
+    )
+    conflict = ConstraintSpec(name="cap", field_name="steam_flow", operator=ConstraintOperator.LE, upper_bound=-5.0)
+    broken = ConstraintSpec.model_construct(
+        name="broken", field_name="boiler_temp", operator=ConstraintOperator.LE, upper_bound=None, lower_bound=None
+    )
+    drafts = [
+        base,
+        base.model_copy(update={"version": "v2", "guardrail": tighter}),
+        base.model_copy(update={"version": "v3", "guardrail": tighter, "constraints": [*base.constraints, conflict]}),
+        base.model_copy(update={"version": "v4", "constraints": [*base.constraints, broken]}),
+        base.model_copy(update={"version": "v5"}),
+    ]
+
+    samples = [SimulationSample(context=context) for context in sample_contexts()]
+    validator = TemplateValidator()
+    incremental = TemplateQualityEvaluator(validator=validator)
+    for template in drafts:
+        fingerprint = fingerprint_template(template)
+        draft = MigrationDraft(template=template, confidence=1.0, generation_strategy="test")
+        assert validator.validate(draft, fingerprint=fingerprint) == TemplateValidator().validate(draft)
+        assert incremental.evaluate(template, fingerprint=fingerprint) == TemplateQualityEvaluator(cache_size=0).evaluate(
+            template
+        )
+
+    assert fingerprint_template(drafts[1]).changed_sections(fingerprint_template(drafts[0])) == ["header", "guardrail"]
+    # With fixed samples a guardrail-only edit reuses the predictor/optimizer stage.
+    staged = TemplateQualityEvaluator()
+    staged.evaluate(drafts[0], samples)
+    staged.evaluate(drafts[1], samples)
+    assert staged.stage_cache_stats()["plans"] == len(samples)
+    assert staged.stage_cache_stats()["outcomes"] == 2 * len(samples)
+    assert validator.cache_stats()["hits"] > 0
+
+
+def test_robustness_batches_match_per_draw_pipeline() -> None:
+    from easyshift_maas.core.contracts import FieldNoiseSpec, NoiseKind, RobustnessSpec
+    from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+
+    class _CustomPipeline(PredictionOptimizationPipeline):
+        pass
+
+    template = build_energy_efficiency_template()
+    spec = RobustnessSpec(
+        draws=400,
+        seed=11,
+        relative_scale=0.2,
+        dimension_correlation=0.5,
+        field_noise={"boiler_temp": FieldNoiseSpec(kind=NoiseKind.UNIFORM, scale=400.0)},
+    )
+    batched = TemplateQualityEvaluator().robustness(template, spec)
+    per_draw = TemplateQualityEvaluator(pipeline=_CustomPipeline()).robustness(template, spec)
+
+    assert batched.draws == 400
+    assert 0.0 < batched.approval_rate < 1.0
+    assert batched.approval_ci_low <= batched.approval_rate <= batched.approval_ci_high
+    assert batched.approval_rate == per_draw.approval_rate
+    assert batched.violations == per_draw.violations
+    assert abs(batched.objective_value.mean - per_draw.objective_value.mean) < 1e-9
+    assert batched.rule_fire_rates[0] > 0.0 and per_draw.rule_fire_rates is None
+    rerun = TemplateQualityEvaluator().robustness(template, spec)
+    assert rerun.model_dump(exclude={"elapsed_ms"}) == batched.model_dump(exclude={"elapsed_ms"})
+
+
+def test_robustness_runs_custom_stages_draw_by_draw() -> None:
+    from easyshift_maas.core.contracts import GuardrailAction, GuardrailDecision, RobustnessSpec
+    from easyshift_maas.core.pipeline import PredictionOptimizationPipeline
+
+    class _RejectAll:
+        def validate(self, plan, context, guardrail):
+            return GuardrailDecision(approved=False, violations=["always"], action=GuardrailAction.REJECT)
+
+    template = build_energy_efficiency_template()
+    evaluator = TemplateQualityEvaluator(pipeline=PredictionOptimizationPipeline(guardrail=_RejectAll()))
+    report = evaluator.robustness(template, RobustnessSpec(draws=50, seed=3))
+
+    assert report.approval_rate == 0.0
+    assert report.violation_rate == 1.0
+    assert report.rule_fire_rates is None